@@ -0,0 +1,4 @@
+"""Conversion throughput and latency benchmarks.
+
+Run ``python -m benchmarks --help`` from the repository root.
+"""
@@ -0,0 +1,106 @@
+"""Benchmark corpora built from the test fixture generators.
+
+Each corpus kind is a list of generators; :func:`build_corpus` renders every
+generator once and copies the results round-robin until the requested file
+count is reached, so large corpora are cheap to build.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+from typing import Callable
+
+_TESTS_DIR = Path(__file__).resolve().parent.parent / "tests"
+if str(_TESTS_DIR) not in sys.path:
+    sys.path.insert(0, str(_TESTS_DIR))
+
+from fixture_helpers.calc import (  # noqa: E402
+    create_csv_file,
+    create_large_xlsx,
+    create_ods,
+    create_tsv,
+    create_xlsx,
+)
+from fixture_helpers.images import create_test_image  # noqa: E402
+from fixture_helpers.impress import create_odp, create_pptx  # noqa: E402
+from fixture_helpers.writer import (  # noqa: E402
+    create_docx,
+    create_html,
+    create_odt,
+    create_rtf,
+    create_txt,
+)
+
+Generator = Callable[[Path], Path]
+
+
+def _with_image(create: Callable[..., Path]) -> Generator:
+    def generate(path: Path) -> Path:
+        return create(path, image_bytes=create_test_image(800, 600))
+
+    return generate
+
+
+# kind -> [(extension, generator)]
+CORPORA: dict[str, list[tuple[str, Generator]]] = {
+    "writer": [
+        ("docx", create_docx),
+        ("odt", create_odt),
+        ("rtf", create_rtf),
+        ("html", create_html),
+        ("txt", create_txt),
+    ],
+    "calc": [
+        ("xlsx", create_xlsx),
+        ("ods", create_ods),
+        ("csv", create_csv_file),
+        ("tsv", create_tsv),
+    ],
+    "impress": [
+        ("pptx", create_pptx),
+        ("odp", create_odp),
+    ],
+    "large": [
+        ("xlsx", create_large_xlsx),
+        ("docx", _with_image(create_docx)),
+        ("pptx", _with_image(create_pptx)),
+    ],
+}
+CORPORA["mixed"] = CORPORA["writer"] + CORPORA["calc"] + CORPORA["impress"]
+
+
+def build_corpus(kind: str, count: int, dest: Path) -> list[Path]:
+    """Create ``count`` files of corpus ``kind`` under ``dest``.
+
+    Args:
+        kind: One of :data:`CORPORA`.
+        count: Number of files to create.
+        dest: Directory to create the files in. Created if missing.
+
+    Returns:
+        The created file paths, in creation order.
+
+    Raises:
+        ValueError: If ``kind`` is unknown or ``count`` is less than 1.
+    """
+    if kind not in CORPORA:
+        raise ValueError(f"Unknown corpus: {kind} (choose from {sorted(CORPORA)})")
+    if count < 1:
+        raise ValueError(f"count must be >= 1, got {count}")
+
+    dest.mkdir(parents=True, exist_ok=True)
+    templates_dir = dest / ".templates"
+    templates_dir.mkdir(exist_ok=True)
+    generators = CORPORA[kind]
+    templates = [
+        generate(templates_dir / f"template_{i}.{ext}")
+        for i, (ext, generate) in enumerate(generators)
+    ]
+
+    paths = []
+    for i in range(count):
+        template = templates[i % len(templates)]
+        path = dest / f"{kind}_{i:05d}{template.suffix}"
+        shutil.copyfile(template, path)
+        paths.append(path)
+    return paths
@@ -0,0 +1,408 @@
+"""Conversion benchmark runner.
+
+Builds corpora with :mod:`benchmarks.corpus`, converts them through each
+engine entry point at several concurrency levels, and writes one JSON report
+per run. Reports from two commits can be compared with ``--compare``::
+
+    python -m benchmarks --corpus mixed --files 200 -c 1 2 4 -o head.json
+    python -m benchmarks --corpus mixed --files 200 -c 1 2 4 --compare head.json
+
+Per-file latency is the wall time of the engine call that produced the file's
+result (``transform``/``async_transform`` or, in batched modes, the whole
+``transform_batch``/``async_transform_batch`` chunk), including any wait for a
+concurrency slot.
+
+The ``uno`` mode runs ``transform_parallel`` on :class:`libreformer.UnoEngine`
+for comparison with the CLI engine. It needs the LibreOffice Python bindings
+and a real soffice, so it only runs when requested with ``--modes``.
+"""
+
+import argparse
+import asyncio
+import datetime
+import functools
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+from loguru import logger
+
+from libreformer import LibreOfficeEngine, Succeed
+from libreformer.engine import BaseEngine
+
+from .corpus import CORPORA, build_corpus
+from .stats import ResourceMonitor, summarize_latencies
+
+MODES = (
+    "transform",
+    "parallel",
+    "parallel-batched",
+    "async",
+    "async-batched",
+    "pooled",
+    "uno",
+)
+
+# Modes run when --modes is not given.
+DEFAULT_MODES = tuple(m for m in MODES if m != "uno")
+
+# Keys identifying the same measurement across reports.
+_CASE_KEY = ("corpus", "mode", "concurrency", "batch_size")
+
+
+@dataclass(frozen=True)
+class Case:
+    corpus: str
+    mode: str
+    concurrency: int
+    batch_size: Optional[int]
+
+
+def plan_cases(
+    corpora: Sequence[str],
+    modes: Sequence[str],
+    concurrency: Sequence[int],
+    batch_size: int,
+) -> list[Case]:
+    """Expand the requested sweep. Sequential ``transform`` runs once."""
+    cases = []
+    for corpus in corpora:
+        for mode in modes:
+            levels = [1] if mode == "transform" else concurrency
+            batch = batch_size if mode.endswith("-batched") else None
+            cases.extend(Case(corpus, mode, c, batch) for c in levels)
+    return cases
+
+
+def _instrument(engine: BaseEngine, latencies: list[float]) -> None:
+    """Record the wall time of every public conversion call on ``engine``."""
+
+    def timed(method: Callable, per_file: Callable[[tuple], int]) -> Callable:
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                latencies.extend([time.perf_counter() - start] * per_file(args))
+
+        return wrapper
+
+    def async_timed(method: Callable, per_file: Callable[[tuple], int]) -> Callable:
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                latencies.extend([time.perf_counter() - start] * per_file(args))
+
+        return wrapper
+
+    def one(args: tuple) -> int:
+        return 1
+
+    def chunk(args: tuple) -> int:
+        return len(args[0])
+
+    engine.transform = timed(engine.transform, one)
+    engine.transform_batch = timed(engine.transform_batch, chunk)
+    engine.async_transform = async_timed(engine.async_transform, one)
+    engine.async_transform_batch = async_timed(engine.async_transform_batch, chunk)
+
+
+def _convert(engine: BaseEngine, case: Case, files: list[str], target: str) -> list:
+    if case.mode == "transform":
+        return [engine.transform(f, target) for f in files]
+    if case.mode in ("parallel", "parallel-batched", "pooled", "uno"):
+        return list(engine.transform_parallel(files, target, case.batch_size))
+
+    async def collect() -> list:
+        return [
+            r
+            async for r in engine.async_transform_parallel(
+                files, target, case.batch_size
+            )
+        ]
+
+    return asyncio.run(collect())
+
+
+def run_case(case: Case, files: Sequence[Path], target: str) -> dict:
+    """Convert ``files`` once under ``case`` and return its measurements."""
+    paths = [str(f) for f in files]
+    latencies: list[float] = []
+
+    start = time.perf_counter()
+    engine: BaseEngine
+    if case.mode == "uno":
+        from libreformer import UnoEngine
+
+        engine = UnoEngine(auto_install=False, max_concurrency=case.concurrency)
+    else:
+        engine = LibreOfficeEngine(
+            auto_install=False,
+            max_concurrency=case.concurrency,
+            pool_size=case.concurrency if case.mode == "pooled" else None,
+        )
+    startup = time.perf_counter() - start
+    _instrument(engine, latencies)
+
+    with ResourceMonitor() as monitor:
+        start = time.perf_counter()
+        try:
+            results = _convert(engine, case, paths, target)
+            elapsed = time.perf_counter() - start
+        finally:
+            engine.close()
+
+    succeeded = sum(isinstance(r, Succeed) for r in results)
+    return {
+        **asdict(case),
+        "files": len(paths),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "startup_s": round(startup, 4),
+        "wall_s": round(elapsed, 4),
+        "files_per_sec": round(len(paths) / elapsed, 3) if elapsed > 0 else 0.0,
+        "latency_ms": summarize_latencies(latencies),
+        "peak_rss_mb": round(monitor.peak_rss_bytes / 1024**2, 1),
+        "cpu_seconds": round(monitor.cpu_seconds, 3),
+        "cpu_percent": round(monitor.cpu_percent, 1),
+    }
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", *args],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _soffice_version(path: Optional[str]) -> Optional[str]:
+    if not path:
+        return None
+    try:
+        out = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=60
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment(soffice: Optional[str]) -> dict:
+    """Metadata identifying where and on what a report was produced."""
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "soffice": soffice,
+        "soffice_version": _soffice_version(soffice),
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Describe cases whose throughput or p95 latency regressed.
+
+    A case regresses when files/sec drops, or p95 latency grows, by more than
+    ``threshold`` (a fraction) relative to ``baseline``.
+    """
+
+    def key(result: dict) -> tuple:
+        return tuple(result[k] for k in _CASE_KEY)
+
+    before = {key(r): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = before.get(key(result))
+        if old is None:
+            continue
+        label = "/".join(str(v) for v in key(result))
+        if result["files_per_sec"] < old["files_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{label}: files/sec "
+                f"{old['files_per_sec']} -> {result['files_per_sec']}"
+            )
+        old_p95, new_p95 = old["latency_ms"]["p95"], result["latency_ms"]["p95"]
+        if new_p95 > old_p95 * (1 + threshold):
+            regressions.append(f"{label}: p95 {old_p95}ms -> {new_p95}ms")
+    return regressions
+
+
+def _uno_available() -> bool:
+    try:
+        import uno  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _use_soffice(path: str, bin_dir: Path) -> None:
+    """Expose ``path`` as ``libreoffice`` on ``PATH`` for the engine to find."""
+    link = bin_dir / "libreoffice"
+    link.symlink_to(Path(path).resolve())
+    os.environ["PATH"] = f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+
+
+def _parse_args(argv: Optional[Sequence[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure LibreFormer conversion throughput and latency.",
+    )
+    parser.add_argument(
+        "--corpus",
+        nargs="+",
+        default=["mixed"],
+        choices=sorted(CORPORA),
+        help="corpus kinds to generate (default: mixed)",
+    )
+    parser.add_argument(
+        "--files", type=int, default=50, help="files per corpus (default: 50)"
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        default=list(DEFAULT_MODES),
+        choices=MODES,
+        metavar="MODE",
+        help="entry points to measure; uno must be named explicitly "
+        "(default: all but uno)",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        nargs="+",
+        type=int,
+        default=[1, 2, 4],
+        help="max_concurrency levels to sweep (default: 1 2 4)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=8, help="chunk size for batched modes"
+    )
+    parser.add_argument("--to", default="pdf", help="target format (default: pdf)")
+    parser.add_argument(
+        "--soffice", help="soffice executable to use instead of the one on PATH"
+    )
+    parser.add_argument(
+        "--fake",
+        action="store_true",
+        help="use the test suite's fake soffice (measures engine overhead only)",
+    )
+    parser.add_argument(
+        "--fake-delay",
+        type=float,
+        default=0.0,
+        help="seconds the fake soffice sleeps per conversion",
+    )
+    parser.add_argument(
+        "--workdir", type=Path, help="where to build corpora (default: a temp dir)"
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write the JSON report here")
+    parser.add_argument(
+        "--compare", type=Path, help="baseline report to check for regressions"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="allowed relative regression for --compare (default: 0.10)",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="keep libreformer logging"
+    )
+    args = parser.parse_args(argv)
+    if args.files < 1:
+        parser.error("--files must be >= 1")
+    if any(c < 1 for c in args.concurrency):
+        parser.error("--concurrency levels must be >= 1")
+    if args.fake and args.soffice:
+        parser.error("--fake and --soffice are mutually exclusive")
+    if args.fake and "uno" in args.modes:
+        parser.error("the fake soffice cannot serve the uno mode")
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _parse_args(argv)
+    if not args.verbose:
+        logger.disable("libreformer")
+
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="libreformer_bench_"))
+    bin_dir = Path(tempfile.mkdtemp(prefix="libreformer_bench_bin_"))
+    try:
+        if args.fake:
+            from fixture_helpers.soffice import create_fake_soffice
+
+            args.soffice = str(create_fake_soffice(bin_dir / "soffice"))
+            os.environ["FAKE_SOFFICE_DELAY"] = str(args.fake_delay)
+        if args.soffice:
+            _use_soffice(args.soffice, bin_dir)
+        soffice = shutil.which("libreoffice")
+        if soffice is None:
+            print("libreoffice not found; pass --soffice or --fake", file=sys.stderr)
+            return 2
+        if "uno" in args.modes and not _uno_available():
+            print(
+                "the uno mode needs the LibreOffice Python bindings (python3-uno)",
+                file=sys.stderr,
+            )
+            return 2
+
+        report = {"environment": environment(soffice), "results": []}
+        report["environment"]["fake"] = args.fake
+        corpora = {
+            kind: build_corpus(kind, args.files, workdir / kind) for kind in args.corpus
+        }
+        for case in plan_cases(
+            args.corpus, args.modes, args.concurrency, args.batch_size
+        ):
+            result = run_case(case, corpora[case.corpus], args.to)
+            report["results"].append(result)
+            print(
+                f"{case.corpus:8} {case.mode:16} c={case.concurrency:<3} "
+                f"{result['files_per_sec']:9.2f} files/s  "
+                f"p50={result['latency_ms']['p50']:.1f}ms "
+                f"p95={result['latency_ms']['p95']:.1f}ms  "
+                f"rss={result['peak_rss_mb']}MB cpu={result['cpu_percent']}%",
+                file=sys.stderr,
+            )
+    finally:
+        shutil.rmtree(bin_dir, ignore_errors=True)
+        if args.workdir is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        regressions = compare(
+            report, json.loads(args.compare.read_text()), args.threshold
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
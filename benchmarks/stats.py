@@ -0,0 +1,139 @@
+"""Latency percentiles and process-tree resource sampling."""
+
+import os
+import resource
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Sequence
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Linearly interpolated ``q``-th percentile (0-100) of ``values``."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize_latencies(seconds: Sequence[float]) -> dict[str, float]:
+    """p50/p95/p99/mean/max of ``seconds``, in milliseconds."""
+    ms = [s * 1000 for s in seconds]
+    return {
+        "p50": round(percentile(ms, 50), 3),
+        "p95": round(percentile(ms, 95), 3),
+        "p99": round(percentile(ms, 99), 3),
+        "mean": round(sum(ms) / len(ms), 3) if ms else 0.0,
+        "max": round(max(ms), 3) if ms else 0.0,
+    }
+
+
+def _cpu_seconds() -> float:
+    """CPU time of this process plus its reaped children."""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def _tree_rss_bytes(root: int) -> Optional[int]:
+    """Summed RSS of ``root`` and all its descendants, read from ``/proc``."""
+    proc = Path("/proc")
+    if not (proc / str(root) / "statm").exists():
+        return None
+    parents: dict[int, list[int]] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # "pid (comm) state ppid ..." — comm may contain spaces/parentheses
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        parents.setdefault(ppid, []).append(int(entry.name))
+
+    total = 0
+    stack = [root]
+    while stack:
+        pid = stack.pop()
+        try:
+            total += int((proc / str(pid) / "statm").read_text().split()[1])
+        except (OSError, IndexError, ValueError):
+            pass
+        stack.extend(parents.get(pid, ()))
+    return total * _PAGE_SIZE
+
+
+def _maxrss_bytes(who: int) -> int:
+    rss = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+class ResourceMonitor:
+    """Sample CPU time and peak memory of this process and its children.
+
+    On Linux a background thread sums the RSS of the whole process tree every
+    ``interval`` seconds, which captures concurrently running soffice
+    processes. Elsewhere the peak falls back to the largest ``ru_maxrss`` of
+    this process or any single reaped child.
+
+    CPU time of children is only accounted once they are reaped, so stop the
+    monitor after the engine has been closed.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._peak_tree_rss = 0
+        self._cpu_start = 0.0
+        self._wall_start = 0.0
+        self.cpu_seconds = 0.0
+        self.wall_seconds = 0.0
+
+    def __enter__(self) -> "ResourceMonitor":
+        self._cpu_start = _cpu_seconds()
+        self._wall_start = time.perf_counter()
+        if _tree_rss_bytes(os.getpid()) is not None:
+            self._thread = threading.Thread(
+                target=self._sample, name="bench-rss", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.wall_seconds = time.perf_counter() - self._wall_start
+        self.cpu_seconds = _cpu_seconds() - self._cpu_start
+
+    def _sample(self) -> None:
+        pid = os.getpid()
+        while True:
+            rss = _tree_rss_bytes(pid) or 0
+            self._peak_tree_rss = max(self._peak_tree_rss, rss)
+            if self._stop.wait(self._interval):
+                return
+
+    @property
+    def peak_rss_bytes(self) -> int:
+        if self._thread is not None:
+            return self._peak_tree_rss
+        return max(
+            _maxrss_bytes(resource.RUSAGE_SELF),
+            _maxrss_bytes(resource.RUSAGE_CHILDREN),
+        )
+
+    @property
+    def cpu_percent(self) -> float:
+        """CPU time over wall time; 100% is one fully busy core."""
+        if self.wall_seconds <= 0:
+            return 0.0
+        return 100 * self.cpu_seconds / self.wall_seconds
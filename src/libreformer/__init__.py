@@ -1,13 +1,49 @@
-from .engine import LibreOfficeEngine
-from .schemas import Succeed, Failed, TransformResult, FormatInfo
+from .engine import ConversionError, LibreOfficeEngine
+from .schemas import (
+    Succeed,
+    Failed,
+    FailureKind,
+    TransformResult,
+    FormatInfo,
+    FilterOptions,
+)
 from .formats import FormatRegistry, DocumentCategory
+from .cache import ConversionCache, CacheStats
+from .metrics import ConversionMetrics, Stage
+from .results import ResultStore, ResultSummary
+from .concurrency import AdaptiveConcurrency
+from .scheduling import SchedulePolicy, Scheduler
+from .retry import RetryPolicy
+from .quarantine import Quarantine, QuarantineEntry
+from .breaker import BreakerState, CircuitBreaker
+from .slots import SharedSlots
+from .uno_engine import UnoEngine
 
 __all__ = [
     "LibreOfficeEngine",
+    "ConversionError",
     "Succeed",
     "Failed",
+    "FailureKind",
     "TransformResult",
     "FormatInfo",
+    "FilterOptions",
     "FormatRegistry",
     "DocumentCategory",
+    "ConversionCache",
+    "CacheStats",
+    "ConversionMetrics",
+    "Stage",
+    "ResultStore",
+    "ResultSummary",
+    "AdaptiveConcurrency",
+    "SchedulePolicy",
+    "Scheduler",
+    "RetryPolicy",
+    "Quarantine",
+    "QuarantineEntry",
+    "CircuitBreaker",
+    "BreakerState",
+    "SharedSlots",
+    "UnoEngine",
 ]
@@ -0,0 +1,137 @@
+"""크래시가 잇따를 때 동시 실행 수를 낮추는 서킷 브레이커.
+
+최근 ``window``개의 변환 결과 중 크래시·타임아웃 비율이 ``failure_threshold``를
+넘으면 브레이커가 열리고, 엔진의 동시 실행 수를 ``open_concurrency``로 낮춘다.
+``cooldown``초가 지나면 반열림(half-open) 상태가 되어 다음 결과로 판단한다.
+성공이면 닫혀 원래 동시 실행 수로 돌아가고, 또 실패하면 다시 열린다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Iterable
+
+from loguru import logger
+
+from .schemas import Failed, FailureKind, Succeed
+
+
+class BreakerState(str, Enum):
+    """서킷 브레이커 상태."""
+
+    CLOSED = "closed"
+    """정상. 동시 실행 수를 제한하지 않는다."""
+    OPEN = "open"
+    """크래시가 잦아 동시 실행 수를 낮춘 상태."""
+    HALF_OPEN = "half_open"
+    """대기 시간이 지나 다음 결과로 닫을지 판단하는 상태."""
+
+
+class CircuitBreaker:
+    """크래시·타임아웃 비율로 열리는 서킷 브레이커.
+
+    엔진 여러 개가 하나를 공유할 수 있으며, 상태가 바뀌면 구독한 엔진들의
+    동시 실행 수를 함께 바꾼다.
+
+    Args:
+        failure_threshold: 브레이커를 여는 실패 비율 (0-1).
+        window: 비율을 계산할 최근 결과 수.
+        min_results: 비율을 판단하기 전에 필요한 최소 결과 수.
+        cooldown: 열린 뒤 반열림으로 바뀌기까지의 시간(초).
+        open_concurrency: 열려 있는 동안의 동시 실행 수.
+        kinds: 실패로 셀 분류.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_results: int = 5,
+        cooldown: float = 30.0,
+        open_concurrency: int = 1,
+        kinds: frozenset[FailureKind] = frozenset(
+            {FailureKind.CRASH, FailureKind.TIMEOUT}
+        ),
+    ):
+        if not 0 < failure_threshold <= 1:
+            raise ValueError(
+                f"failure_threshold must be in (0, 1], got {failure_threshold}"
+            )
+        if window < 1 or min_results < 1:
+            raise ValueError("window and min_results must be >= 1")
+        if cooldown < 0:
+            raise ValueError(f"cooldown must be >= 0, got {cooldown}")
+        if open_concurrency < 1:
+            raise ValueError(f"open_concurrency must be >= 1, got {open_concurrency}")
+        self.failure_threshold = failure_threshold
+        self.min_results = min(min_results, window)
+        self.cooldown = cooldown
+        self.open_concurrency = open_concurrency
+        self.kinds = kinds
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._state = BreakerState.CLOSED
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[int | None], None]] = []
+
+    @property
+    def state(self) -> BreakerState:
+        with self._lock:
+            return self._current_state()
+
+    def subscribe(self, listener: Callable[[int | None], None]) -> None:
+        """상태가 바뀔 때 동시 실행 수 상한(닫히면 ``None``)을 받을 함수를 등록한다."""
+        with self._lock:
+            self._listeners.append(listener)
+            cap = None if self._state is BreakerState.CLOSED else self.open_concurrency
+        if cap is not None:
+            listener(cap)
+
+    def record(self, results: Iterable[Succeed | Failed]) -> None:
+        """soffice 실행 한 번의 결과를 기록한다."""
+        failed = any(isinstance(r, Failed) and r.kind in self.kinds for r in results)
+        with self._lock:
+            state = self._current_state()
+            if state is BreakerState.OPEN:
+                return
+            if state is BreakerState.HALF_OPEN:
+                cap = self._open() if failed else self._close()
+            else:
+                self._outcomes.append(failed)
+                if not self._tripped():
+                    return
+                cap = self._open()
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(cap)
+
+    def _current_state(self) -> BreakerState:
+        if (
+            self._state is BreakerState.OPEN
+            and time.monotonic() - self._opened_at >= self.cooldown
+        ):
+            self._state = BreakerState.HALF_OPEN
+        return self._state
+
+    def _tripped(self) -> bool:
+        if len(self._outcomes) < self.min_results:
+            return False
+        rate = sum(self._outcomes) / len(self._outcomes)
+        return rate >= self.failure_threshold
+
+    def _open(self) -> int:
+        logger.warning(
+            "서킷 브레이커 열림: 동시 실행 수를 {}(으)로 낮춘다", self.open_concurrency
+        )
+        self._state = BreakerState.OPEN
+        self._opened_at = time.monotonic()
+        return self.open_concurrency
+
+    def _close(self) -> None:
+        logger.info("서킷 브레이커 닫힘")
+        self._state = BreakerState.CLOSED
+        self._outcomes.clear()
+        return None
@@ -0,0 +1,53 @@
+"""메모리 입출력 변환(:meth:`LibreOfficeEngine.transform_bytes`)의 버퍼 처리.
+
+soffice는 파일 경로만 받으므로 입력 바이트를 RAM 기반 임시 디렉터리
+(가능하면 ``/dev/shm``)에 쓰고, 변환 결과를 다시 읽는다. 바이트류 입력은
+``memoryview``로 그대로 쓰고 파일류 입력은 덩어리 단위로 복사해 중간 사본을
+만들지 않는다. 결과는 한 번에 ``bytes``로 읽거나, 복사 없이 읽기 전용
+``mmap``으로 돌려준다. 매핑은 임시 파일이 지워진 뒤에도 유효하다.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import shutil
+from pathlib import Path
+from typing import BinaryIO, Union
+
+BytesInput = Union[bytes, bytearray, memoryview, BinaryIO]
+
+_COPY_CHUNK = 1024 * 1024
+
+
+def input_name(from_ext: str) -> str:
+    """임시 입력 파일 이름. soffice가 확장자로 입력 형식을 고르므로 확장자를 붙인다."""
+    ext = from_ext.strip().lstrip(".").lower()
+    if not ext:
+        raise ValueError("from_ext must not be empty")
+    return f"input.{ext}"
+
+
+def write_input(path: Path, data: BytesInput) -> int:
+    """``data``를 ``path``에 쓰고 쓴 바이트 수를 반환한다."""
+    with open(path, "wb") as fh:
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            view = memoryview(data).cast("B")
+            fh.write(view)
+            return len(view)
+        shutil.copyfileobj(data, fh, _COPY_CHUNK)
+        return fh.tell()
+
+
+def read_output(path: Path, as_mmap: bool = False) -> bytes | mmap.mmap:
+    """변환 결과를 읽는다.
+
+    ``as_mmap``이면 파일을 읽기 전용으로 매핑해 돌려준다. 빈 파일은 매핑할 수
+    없으므로 ``b""``를 반환한다.
+    """
+    if not as_mmap:
+        return path.read_bytes()
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
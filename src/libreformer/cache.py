@@ -0,0 +1,280 @@
+"""내용 주소 기반(content-addressed) 변환 결과 캐시.
+
+입력 파일 바이트의 해시와 대상 포맷, 필터 옵션을 키로 변환 결과를 디스크에
+보관한다. 같은 문서를 다시 변환하면 soffice를 실행하지 않고 캐시된 결과를
+복사(또는 하드링크)해 돌려준다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from loguru import logger
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    """파일 내용의 BLAKE2b 해시(hex)를 반환한다."""
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as fh:
+        while chunk := fh.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중 통계.
+
+    Attributes:
+        hits: 캐시에서 결과를 돌려준 횟수.
+        misses: 캐시에 결과가 없어 변환을 수행한 횟수.
+        stores: 새 결과를 저장한 횟수.
+        evictions: 용량/유효기간 초과로 삭제한 항목 수.
+        bytes_served: 캐시에서 돌려준 출력 파일의 총 바이트 수.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_served: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """조회 중 적중 비율. 조회가 없으면 0."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    path: Path
+    size: int
+    last_access: float
+
+
+class ConversionCache:
+    """크기·유효기간 기반 LRU 축출을 지원하는 디스크 변환 결과 캐시.
+
+    항목은 ``<directory>/<key[:2]>/<key>.<ext>`` 형태로 저장되며, 마지막 접근
+    시각은 파일 mtime에 기록되어 프로세스를 재시작해도 LRU 순서가 유지된다.
+    여러 엔진(스레드)이 하나의 캐시를 공유해도 안전하다.
+
+    Args:
+        directory: 캐시 디렉터리. 없으면 생성한다.
+        max_bytes: 보관할 최대 총 바이트 수. ``None``이면 제한 없음.
+        max_age: 마지막 접근 이후 보관할 최대 시간(초). ``None``이면 제한 없음.
+        hardlink: ``True``면 적중 시 결과를 복사하는 대신 하드링크한다.
+            출력 파일을 제자리에서 수정하면 캐시도 함께 바뀌므로 주의한다.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int | None = 1024**3,
+        max_age: float | None = None,
+        hardlink: bool = False,
+    ):
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError(f"max_bytes must be > 0, got {max_bytes}")
+        if max_age is not None and max_age <= 0:
+            raise ValueError(f"max_age must be > 0, got {max_age}")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.hardlink = hardlink
+
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._total_bytes = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    # -----------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------
+    @property
+    def stats(self) -> CacheStats:
+        """현재까지의 적중 통계 스냅샷."""
+        with self._lock:
+            return replace(self._stats)
+
+    @property
+    def total_bytes(self) -> int:
+        """캐시에 보관 중인 총 바이트 수."""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(input_path: Path, to: str, options: str = "", route: str = "") -> str:
+        """입력 내용·확장자, 대상 포맷, 필터 옵션, 변환 경로로 캐시 키를 만든다.
+
+        내용이 같아도 확장자가 다르면 다른 모듈·필터로 불러오므로 키가 다르다.
+        ``route``는 실행할 변환 단계(가져오기/내보내기 필터)를 나타내는 문자열이다.
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(file_digest(input_path).encode())
+        digest.update(b"\0" + input_path.suffix.lstrip(".").lower().encode())
+        digest.update(b"\0" + to.lower().encode())
+        digest.update(b"\0" + options.encode())
+        digest.update(b"\0" + route.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Path | None:
+        """캐시된 결과 파일 경로를 반환한다. 없거나 만료되었으면 ``None``."""
+        entry = self._lookup(key)
+        self._count(entry)
+        return entry.path if entry is not None else None
+
+    def fetch(self, key: str, destination: Path) -> Path | None:
+        """캐시된 결과를 ``destination``에 배치하고 그 경로를 반환한다.
+
+        없거나 만료되었거나 배치에 실패하면 ``None``이며, 배치에 성공했을 때만
+        적중으로 센다.
+        """
+        entry = self._lookup(key)
+        placed = None
+        if entry is not None:
+            try:
+                placed = self.materialize(entry.path, destination)
+            except OSError as e:
+                logger.warning("캐시된 결과 배치 실패: {}", e)
+                entry = None
+        self._count(entry)
+        return placed
+
+    def put(self, key: str, output_path: Path) -> None:
+        """변환 결과를 캐시에 저장한다. 실패해도 예외를 던지지 않는다."""
+        suffix = output_path.suffix
+        target = self.directory / key[:2] / f"{key}{suffix}"
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+            shutil.copyfile(output_path, tmp)
+            os.replace(tmp, target)
+            size = target.stat().st_size
+        except OSError as e:
+            logger.warning("변환 결과 캐시 저장 실패: {}", e)
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = _Entry(target, size, time.time())
+            self._total_bytes += size
+            self._stats.stores += 1
+            self._enforce_limits()
+
+    def materialize(self, cached: Path, destination: Path) -> Path:
+        """캐시된 결과를 ``destination``에 원자적으로 배치하고 그 경로를 반환한다."""
+        tmp = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            if self.hardlink:
+                try:
+                    os.link(cached, tmp)
+                except OSError:
+                    shutil.copyfile(cached, tmp)
+            else:
+                shutil.copyfile(cached, tmp)
+            os.replace(tmp, destination)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return destination
+
+    def clear(self) -> None:
+        """모든 항목을 삭제한다. 통계는 유지한다."""
+        with self._lock:
+            for key in list(self._entries):
+                self._evict(key)
+
+    # -----------------------------------------------------------------
+    # Internals
+    # -----------------------------------------------------------------
+    def _lookup(self, key: str) -> _Entry | None:
+        """유효한 항목을 찾아 최근 사용으로 표시한다. 통계는 세지 않는다."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry, now):
+                self._evict(key)
+                entry = None
+            if entry is None or not entry.path.exists():
+                if entry is not None:
+                    # 다른 프로세스가 삭제한 항목
+                    self._drop(key)
+                return None
+            entry.last_access = now
+            self._entries.move_to_end(key)
+        try:
+            os.utime(entry.path, (now, now))
+        except OSError:
+            pass
+        return entry
+
+    def _count(self, entry: _Entry | None) -> None:
+        with self._lock:
+            if entry is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+                self._stats.bytes_served += entry.size
+
+    def _load_index(self) -> None:
+        found: list[tuple[str, _Entry]] = []
+        for shard in self.directory.iterdir():
+            if not shard.is_dir() or len(shard.name) != 2:
+                continue
+            for path in shard.iterdir():
+                if path.name.startswith("."):
+                    continue
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                key = path.name.split(".", 1)[0]
+                found.append((key, _Entry(path, st.st_size, st.st_mtime)))
+        found.sort(key=lambda item: item[1].last_access)
+        for key, entry in found:
+            self._entries[key] = entry
+            self._total_bytes += entry.size
+        with self._lock:
+            self._enforce_limits()
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return self.max_age is not None and now - entry.last_access > self.max_age
+
+    def _enforce_limits(self) -> None:
+        """가장 오래 접근하지 않은 항목부터 제한을 만족할 때까지 축출한다."""
+        now = time.time()
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            over_size = (
+                self.max_bytes is not None and self._total_bytes > self.max_bytes
+            )
+            if not over_size and not self._expired(entry, now):
+                break
+            self._evict(key)
+
+    def _evict(self, key: str) -> None:
+        entry = self._drop(key)
+        if entry is not None:
+            entry.path.unlink(missing_ok=True)
+            self._stats.evictions += 1
+
+    def _drop(self, key: str) -> _Entry | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+        return entry
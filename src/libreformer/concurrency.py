@@ -0,0 +1,374 @@
+"""동시 실행 수 제한기.
+
+:class:`ConcurrencyLimiter`는 여러 스레드와 이벤트 루프가 함께 쓸 수 있는
+고정 한도 리미터이고, :class:`AdaptiveLimiter`는 관측값에 따라 한도를 바꾼다.
+
+고정 크기 세마포어는 큰 스프레드시트에서는 메모리를 초과 사용하고, 작은 텍스트
+파일에서는 CPU를 놀린다. :class:`AdaptiveLimiter`는 변환이 끝날 때마다 지연
+시간을 기록하고, 일정 간격으로 시스템 CPU 사용률과 가용 메모리(``/proc/meminfo``
+와 cgroup 메모리 제한)를 읽어 허용 동시 실행 수를 하나씩 늘리거나 줄인다.
+
+- 가용 메모리가 ``min_available_memory``보다 적으면 크게(25%) 줄인다.
+- CPU 사용률이 ``max_cpu_utilization``을 넘거나 최근 지연 시간이 장기 평균의
+  ``latency_tolerance``배를 넘으면 하나 줄인다.
+- 슬롯이 모두 사용 중이고 자원에 여유가 있으면 하나 늘린다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+_CGROUP_ROOT = Path("/sys/fs/cgroup")
+# cgroup v1은 제한이 없을 때 매우 큰 값을 보고한다
+_CGROUP_V1_UNLIMITED = 1 << 60
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrency:
+    """적응형 동시성 제어 설정.
+
+    Attributes:
+        min_concurrency: 동시 실행 수 하한.
+        max_concurrency: 동시 실행 수 상한. ``None``이면 CPU 수의 2배.
+        min_available_memory: 이보다 가용 메모리가 적으면 동시 실행 수를 줄인다(바이트).
+        max_cpu_utilization: 이보다 CPU 사용률(0-1)이 높으면 늘리지 않고 줄인다.
+        latency_tolerance: 최근 지연 시간이 장기 평균의 이 배수를 넘으면 줄인다.
+        adjust_interval: 조절 사이의 최소 간격(초).
+    """
+
+    min_concurrency: int = 1
+    max_concurrency: int | None = None
+    min_available_memory: int = 512 * 1024**2
+    max_cpu_utilization: float = 0.9
+    latency_tolerance: float = 2.0
+    adjust_interval: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.min_concurrency < 1:
+            raise ValueError(
+                f"min_concurrency must be >= 1, got {self.min_concurrency}"
+            )
+        if self.max_concurrency is not None and (
+            self.max_concurrency < self.min_concurrency
+        ):
+            raise ValueError("max_concurrency must be >= min_concurrency")
+        if not 0 < self.max_cpu_utilization <= 1:
+            raise ValueError(
+                f"max_cpu_utilization must be in (0, 1], got {self.max_cpu_utilization}"
+            )
+        if self.latency_tolerance <= 1:
+            raise ValueError(
+                f"latency_tolerance must be > 1, got {self.latency_tolerance}"
+            )
+
+    @property
+    def ceiling(self) -> int:
+        return self.max_concurrency or 2 * (os.cpu_count() or 4)
+
+
+def available_memory() -> int | None:
+    """사용 가능한 메모리(바이트). cgroup 제한이 있으면 그 안의 여유분과 비교해 작은 값.
+
+    알 수 없으면 ``None``.
+    """
+    candidates = [
+        v for v in (_meminfo_available(), _cgroup_available()) if v is not None
+    ]
+    return min(candidates) if candidates else None
+
+
+def _meminfo_available() -> int | None:
+    try:
+        with open("/proc/meminfo") as fh:
+            for line in fh:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _read_int(path: Path) -> int | None:
+    try:
+        text = path.read_text().strip()
+    except OSError:
+        return None
+    return int(text) if text.isdigit() else None
+
+
+def _cgroup_available() -> int | None:
+    # cgroup v2
+    limit = _read_int(_CGROUP_ROOT / "memory.max")
+    usage = _read_int(_CGROUP_ROOT / "memory.current")
+    if limit is None or usage is None:
+        # cgroup v1
+        limit = _read_int(_CGROUP_ROOT / "memory" / "memory.limit_in_bytes")
+        usage = _read_int(_CGROUP_ROOT / "memory" / "memory.usage_in_bytes")
+    if limit is None or usage is None or limit >= _CGROUP_V1_UNLIMITED:
+        return None
+    return max(limit - usage, 0)
+
+
+class _CpuSampler:
+    """``/proc/stat``에서 직전 호출 이후의 CPU 사용률(0-1)을 계산한다.
+
+    ``/proc/stat``이 없으면 1분 부하 평균을 CPU 수로 나눈 값을 쓴다.
+    """
+
+    def __init__(self) -> None:
+        self._last: tuple[int, int] | None = self._read()
+
+    @staticmethod
+    def _read() -> tuple[int, int] | None:
+        try:
+            with open("/proc/stat") as fh:
+                fields = [int(v) for v in fh.readline().split()[1:]]
+        except (OSError, ValueError):
+            return None
+        # user nice system idle iowait irq softirq steal ...
+        idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+        return sum(fields[:8]), idle
+
+    def utilization(self) -> float | None:
+        current = self._read()
+        if current is None:
+            try:
+                return os.getloadavg()[0] / (os.cpu_count() or 1)
+            except (AttributeError, OSError):
+                return None
+        last, self._last = self._last, current
+        if last is None or current[0] <= last[0]:
+            return None
+        total = current[0] - last[0]
+        idle = current[1] - last[1]
+        return 1 - idle / total
+
+
+class _Ewma:
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, alpha: float):
+        self.alpha = alpha
+        self.value: float | None = None
+
+    def update(self, sample: float) -> None:
+        if self.value is None:
+            self.value = sample
+        else:
+            self.value += self.alpha * (sample - self.value)
+
+
+class _Waiter:
+    """슬롯을 기다리는 호출자 하나. 비동기 대기자는 자기 이벤트 루프에서 깨운다."""
+
+    __slots__ = ("loop", "future", "event")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None):
+        self.loop = loop
+        self.future: asyncio.Future[None] | None = (
+            loop.create_future() if loop is not None else None
+        )
+        self.event = threading.Event() if loop is None else None
+
+    def wake(self) -> bool:
+        """대기자에게 슬롯을 넘긴다. 이벤트 루프가 이미 닫혔으면 ``False``."""
+        if self.loop is None:
+            assert self.event is not None
+            self.event.set()
+            return True
+        try:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+        except RuntimeError:
+            return False
+        return True
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ConcurrencyLimiter:
+    """스레드와 이벤트 루프에 묶이지 않는 동시 실행 수 제한기.
+
+    ``asyncio.Semaphore``는 처음 사용한 이벤트 루프에 묶이므로, 엔진 하나를
+    여러 루프(스레드별 루프, 테스트마다 새로 만드는 루프 등)에서 공유할 수 없다.
+    이 리미터는 잠금으로 상태를 보호하고 비동기 대기자를 각자의 루프에서
+    깨우므로, 동기 호출(``with``)과 여러 루프의 비동기 호출(``async with``)이
+    같은 한도를 나눠 쓴다. 대기자는 도착 순서대로 슬롯을 받는다.
+
+    Args:
+        limit: 허용 동시 실행 수.
+    """
+
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError(f"limit must be >= 1, got {limit}")
+        self._limit = limit
+        self._cap: int | None = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._waiters: deque[_Waiter] = deque()
+        self._started: dict[object, float] = {}
+
+    @property
+    def limit(self) -> int:
+        """현재 허용 동시 실행 수."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def set_cap(self, cap: int | None) -> None:
+        """한도와 별개로 동시 실행 수 상한을 건다. ``None``이면 상한을 푼다.
+
+        이미 실행 중인 작업은 끝까지 실행되며, 새 작업만 상한을 따른다.
+        """
+        with self._lock:
+            self._cap = cap
+            self._wake()
+
+    def _allowed(self) -> int:
+        return self._limit if self._cap is None else min(self._limit, self._cap)
+
+    def _try_take(self) -> bool:
+        if self._in_flight < self._allowed() and not self._waiters:
+            self._in_flight += 1
+            return True
+        return False
+
+    async def acquire(self) -> None:
+        with self._lock:
+            if self._try_take():
+                return
+            waiter = _Waiter(asyncio.get_running_loop())
+            self._waiters.append(waiter)
+        assert waiter.future is not None
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # 슬롯을 넘겨받은 뒤 취소되었으면 돌려준다
+            self._release_slot()
+            raise
+
+    def acquire_sync(self) -> None:
+        """슬롯이 빌 때까지 현재 스레드를 막고 기다린다."""
+        with self._lock:
+            if self._try_take():
+                return
+            waiter = _Waiter(None)
+            self._waiters.append(waiter)
+        assert waiter.event is not None
+        waiter.event.wait()
+
+    def release(self, latency: float | None = None) -> None:
+        """슬롯을 반납한다. ``latency``는 하위 클래스가 조절에 쓴다."""
+        self._release_slot()
+
+    async def __aenter__(self) -> ConcurrencyLimiter:
+        await self.acquire()
+        self._started[asyncio.current_task()] = time.perf_counter()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        started = self._started.pop(asyncio.current_task(), None)
+        self.release(None if started is None else time.perf_counter() - started)
+
+    def __enter__(self) -> ConcurrencyLimiter:
+        self.acquire_sync()
+        self._started[threading.get_ident()] = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        started = self._started.pop(threading.get_ident(), None)
+        self.release(None if started is None else time.perf_counter() - started)
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._wake()
+
+    def _wake(self) -> None:
+        """빈 슬롯을 대기자에게 넘긴다. ``self._lock``을 쥔 채로 호출한다."""
+        while self._waiters and self._in_flight < self._allowed():
+            waiter = self._waiters.popleft()
+            self._in_flight += 1
+            if not waiter.wake():
+                self._in_flight -= 1
+
+
+class AdaptiveLimiter(ConcurrencyLimiter):
+    """허용 동시 실행 수가 바뀌는 :class:`ConcurrencyLimiter`.
+
+    슬롯을 점유한 시간을 지연 시간으로 기록하고, 반납할 때마다 설정된 간격이
+    지났으면 허용 동시 실행 수를 다시 정한다.
+
+    Args:
+        config: 조절 설정.
+        initial: 시작 동시 실행 수. 설정의 하한·상한으로 제한된다.
+    """
+
+    def __init__(self, config: AdaptiveConcurrency, initial: int):
+        super().__init__(min(max(initial, config.min_concurrency), config.ceiling))
+        self._config = config
+        self._short = _Ewma(0.3)
+        self._long = _Ewma(0.02)
+        self._cpu = _CpuSampler()
+        self._last_adjust = time.monotonic()
+
+    def release(self, latency: float | None = None) -> None:
+        """슬롯을 반납한다. ``latency``가 있으면 조절에 반영한다."""
+        if latency is not None:
+            with self._lock:
+                self._short.update(latency)
+                self._long.update(latency)
+        self._release_slot()
+        self._maybe_adjust()
+
+    def _maybe_adjust(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_adjust < self._config.adjust_interval:
+                return
+            self._last_adjust = now
+            new_limit = self._decide()
+            if new_limit != self._limit:
+                logger.debug("동시 실행 수 조절: {} -> {}", self._limit, new_limit)
+                self._limit = new_limit
+                self._wake()
+
+    def _decide(self) -> int:
+        config = self._config
+        limit = self._limit
+        floor, ceiling = config.min_concurrency, config.ceiling
+
+        memory = available_memory()
+        if memory is not None and memory < config.min_available_memory:
+            return max(floor, min(limit - 1, int(limit * 0.75)))
+
+        cpu = self._cpu.utilization()
+        if cpu is not None and cpu > config.max_cpu_utilization:
+            return max(floor, limit - 1)
+
+        short, long = self._short.value, self._long.value
+        if short is not None and long and short > long * config.latency_tolerance:
+            return max(floor, limit - 1)
+
+        saturated = bool(self._waiters) or self._in_flight >= limit
+        memory_ok = memory is None or memory >= 2 * config.min_available_memory
+        if saturated and memory_ok:
+            return min(ceiling, limit + 1)
+        return limit
@@ -1,68 +1,547 @@
-from typing import Sequence, Iterator, Dict, overload, AsyncIterator
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    Sequence,
+    overload,
+)
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, contextmanager, nullcontext
 import asyncio
 import concurrent.futures
-from concurrent.futures import ProcessPoolExecutor
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os
+import shutil
 import subprocess
+import tempfile
+import threading
+import time
+import uuid
 
-from .schemas import Succeed, Failed
-from .utils import check_install, get_path, install
+from loguru import logger
+
+from .schemas import Succeed, Failed, FailureKind, FilterOptions
+from .utils import check_install, fast_temp_dir, get_path, install
 from .logging import log_elapsed_time, async_log_elapsed_time
+from .metrics import NULL_TIMER, ConversionMetrics, Stage, StageTimer
 from .formats import FormatRegistry, DocumentCategory
+from .buffers import BytesInput, input_name, read_output, write_input
+from .breaker import CircuitBreaker
+from .cache import ConversionCache
+from .concurrency import AdaptiveConcurrency, AdaptiveLimiter, ConcurrencyLimiter
+from .jobs import aiter_batches, aiter_jobs, iter_batches, iter_jobs
+from .pool import SofficeWorker, SofficeWorkerPool, WorkerStartError
+from .process import async_run_process, run_process
+from .profiles import NO_THUMBNAIL_SETTINGS, ProfileCache, write_registry_settings
+from .quarantine import Quarantine
+from .retry import RetryPolicy, RetryQueue, classify_exit
+from .routing import (
+    Hop,
+    OutputClaims,
+    RouteRun,
+    file_size,
+    plan_hops,
+    route_scratch_dir,
+)
+from .scheduling import ScheduledUnit, Scheduler, UnitQueue
+from .slots import SharedSlots
 from .schemas.format_info import FormatInfo
 
 
+class ConversionError(RuntimeError):
+    """메모리 입출력 변환(:meth:`LibreOfficeEngine.transform_bytes`) 실패 시 발생한다.
+
+    Attributes:
+        result: 실패 결과.
+    """
+
+    def __init__(self, result: Failed):
+        super().__init__(result.error_message)
+        self.result = result
+
+
 class BaseEngine(ABC):
-    def __init__(self):
-        pass
+    # LibreOffice 실행 파일 경로. 하위 클래스가 설정한다.
+    libreoffice_path: str | None = None
+    # 격리 목록. 하위 클래스가 설정하면 격리된 입력은 실행 전에 실패로 처리한다.
+    _quarantine: Quarantine | None = None
+    # 서킷 브레이커. 하위 클래스가 설정하면 soffice 실행 결과를 알린다.
+    _circuit_breaker: CircuitBreaker | None = None
+    # 레지스트리가 불가능하다고 보는 변환을 실행 전에 실패로 처리할지 여부
+    _preflight: bool = True
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        metrics: ConversionMetrics | None = None,
+    ):
+        """
+        Args:
+            max_concurrency: 동시에 실행할 최대 변환 수. None이면 os.cpu_count() 사용.
+            metrics: 단계별 소요 시간을 기록할 계측기. None이면 계측하지 않는다.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        self._max_concurrency = max_concurrency or os.cpu_count() or 4
+        self._metrics = metrics
 
     @abstractmethod
-    def transform(self, file_path: str, to: str) -> Succeed | Failed: ...
+    def transform(
+        self, file_path: str, to: str, options: FilterOptions | None = None
+    ) -> Succeed | Failed: ...
+
+    def transform_batch(
+        self,
+        file_paths: Sequence[str],
+        to: str,
+        options: FilterOptions | None = None,
+    ) -> list[Succeed | Failed]:
+        """여러 파일을 같은 포맷으로 변환하고 입력 순서대로 결과를 반환합니다.
+
+        기본 구현은 파일마다 :meth:`transform`을 호출한다. 한 번의 실행으로
+        여러 파일을 처리할 수 있는 엔진은 이 메서드를 재정의한다.
+        """
+        return [self.transform(file_path, to, options) for file_path in file_paths]
+
+    @abstractmethod
+    async def async_transform(
+        self, file_path: str, to: str, options: FilterOptions | None = None
+    ) -> Succeed | Failed: ...
+
+    async def async_transform_batch(
+        self,
+        file_paths: Sequence[str],
+        to: str,
+        options: FilterOptions | None = None,
+    ) -> list[Succeed | Failed]:
+        """:meth:`transform_batch`의 비동기 버전.
+
+        기본 구현은 파일마다 :meth:`async_transform`을 동시에 호출한다.
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.async_transform(file_path, to, options)
+                    for file_path in file_paths
+                )
+            )
+        )
 
     @overload
     def transform_parallel(
-        self, file_paths: Sequence[str], to: str
+        self,
+        file_paths: Iterable[str],
+        to: str,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        options: FilterOptions | None = None,
+        schedule: Scheduler | None = None,
+        retry: RetryPolicy | None = None,
     ) -> Iterator[Succeed | Failed]: ...
     @overload
     def transform_parallel(
-        self, file_paths: Sequence[str], to: Sequence[str]
+        self,
+        file_paths: Iterable[str],
+        to: Iterable[str],
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        options: FilterOptions | None = None,
+        schedule: Scheduler | None = None,
+        retry: RetryPolicy | None = None,
     ) -> Iterator[Succeed | Failed]: ...
     def transform_parallel(
         self,
-        file_paths: Sequence[str],
-        to: str | Sequence[str],
+        file_paths: Iterable[str],
+        to: str | Iterable[str],
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        options: FilterOptions | None = None,
+        schedule: Scheduler | None = None,
+        retry: RetryPolicy | None = None,
     ) -> Iterator[Succeed | Failed]:
         """병렬로 파일을 변환하고 결과를 이터레이터로 반환합니다.
 
         각 작업이 완료되는 순서대로 :class:`Succeed` 혹은 :class:`Failed` 인스턴스를
         `yield` 합니다.
+
+        ``file_paths``는 임의의 이터러블(제너레이터 포함)이며, 실행 중인 작업이
+        ``max_in_flight``개를 넘지 않도록 슬롯이 빌 때마다 입력을 하나씩 읽는다.
+        ``batch_size``가 2 이상이면 대상 포맷과 상위 디렉터리가 같은 파일을
+        최대 ``batch_size``개씩 묶어 :meth:`transform_batch` 한 번으로 변환한다.
+        ``options``는 모든 파일에 같은 출력 필터 옵션으로 적용된다.
+        ``schedule``을 지정하면 입력을 미리 읽어 추정 비용 순으로 작업을 시작하고
+        무거운 작업의 동시 실행 수를 제한한다.
+        ``retry``를 지정하면 정책이 재시도 대상으로 정한 분류의 실패는 백오프 후
+        파일 하나씩 다시 변환하고, 마지막 시도의 결과만 내보낸다. 결과의
+        ``attempt``는 그 결과를 얻은 시도 번호다.
+
+        Raises:
+            ValueError: ``to``가 포맷 목록이고 ``file_paths``와 길이가 다를 때,
+                또는 ``batch_size``/``max_in_flight``가 1보다 작을 때.
         """
-        # Validate 'to' parameter when it is a sequence of strings
-        if not isinstance(to, str):
-            # Ensure 'to' is a sequence with same length as file_paths
-            if len(to) != len(file_paths):
-                raise ValueError(
-                    f"Length of 'to' ({len(to)}) must match number of file_paths ({len(file_paths)})"
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if max_in_flight is None:
+            max_in_flight = self._default_max_in_flight()
+        elif max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+
+        jobs = iter_jobs(file_paths, to)
+        units: Iterator[tuple[str, list[str]]]
+        if batch_size is not None and batch_size > 1:
+            units = iter_batches(jobs, batch_size)
+        else:
+            units = ((target, [file_path]) for file_path, target in jobs)
+
+        queue = UnitQueue(schedule)
+        retries = RetryQueue(retry)
+        executor = self._make_executor()
+        file_path_map: Dict[concurrent.futures.Future, ScheduledUnit] = {}
+        try:
+            exhausted = False
+            while True:
+                # 빈 슬롯만큼 입력을 읽어 제출
+                while len(file_path_map) < max_in_flight:
+                    while (due := retries.pop_due()) is not None:
+                        queue.requeue(due)
+                    while not exhausted and queue.wants_more():
+                        unit = next(units, None)
+                        if unit is None:
+                            exhausted = True
+                            break
+                        queue.push(*unit)
+                    scheduled = queue.pop()
+                    if scheduled is None:
+                        break
+                    target, chunk = scheduled.target, scheduled.paths
+                    if len(chunk) > 1:
+                        call = (self.transform_batch, chunk, target, options)
+                    else:
+                        call = (self.transform, chunk[0], target, options)
+                    if self._metrics is not None:
+                        future = executor.submit(
+                            self._timed_unit, time.perf_counter(), *call
+                        )
+                    else:
+                        future = executor.submit(*call)
+                    file_path_map[future] = scheduled
+                if not file_path_map:
+                    if not retries:
+                        break
+                    # 백오프 중인 재시도만 남았다
+                    time.sleep(retries.next_due_in() or 0.0)
+                    continue
+
+                # 결과가 준비되는 대로 yield
+                done, _ = concurrent.futures.wait(
+                    file_path_map,
+                    timeout=retries.next_due_in(),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
                 )
-        file_path_map: Dict[concurrent.futures.Future, str] = {}
-
-        with ProcessPoolExecutor() as executor:
-            # 각 파일에 대해 transform 메서드를 병렬로 실행하고 future와 파일 경로 매핑
-            for idx, file_path in enumerate(file_paths):
-                target = to if isinstance(to, str) else to[idx]
-                future = executor.submit(self.transform, file_path, target)
-                file_path_map[future] = file_path
-
-            # 결과가 준비되는 대로 yield
-            for future in concurrent.futures.as_completed(list(file_path_map.keys())):
-                file_path = file_path_map[future]
-                try:
-                    result = future.result()
-                    yield result
-                except Exception as e:
-                    yield Failed(file_path=Path(file_path), error_message=str(e))
+                for future in done:
+                    scheduled = file_path_map.pop(future)
+                    queue.finish(scheduled)
+                    chunk = scheduled.paths
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        for file_path in chunk:
+                            yield Failed(
+                                file_path=Path(file_path),
+                                error_message=str(e),
+                                attempt=scheduled.attempt,
+                            )
+                        continue
+                    yield from retries.settle(
+                        scheduled, result if isinstance(result, list) else [result]
+                    )
+        finally:
+            # 소비가 중단되면 아직 시작하지 않은 작업은 취소한다
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @overload
+    async def async_transform_parallel(
+        self,
+        file_paths: Iterable[str] | AsyncIterable[str],
+        to: str,
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        options: FilterOptions | None = None,
+        schedule: Scheduler | None = None,
+        retry: RetryPolicy | None = None,
+    ) -> AsyncIterator[Succeed | Failed]: ...
+    @overload
+    async def async_transform_parallel(
+        self,
+        file_paths: Iterable[str] | AsyncIterable[str],
+        to: Iterable[str],
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        options: FilterOptions | None = None,
+        schedule: Scheduler | None = None,
+        retry: RetryPolicy | None = None,
+    ) -> AsyncIterator[Succeed | Failed]: ...
+    async def async_transform_parallel(
+        self,
+        file_paths: Iterable[str] | AsyncIterable[str],
+        to: str | Iterable[str],
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        options: FilterOptions | None = None,
+        schedule: Scheduler | None = None,
+        retry: RetryPolicy | None = None,
+    ) -> AsyncIterator[Succeed | Failed]:
+        """복수 파일을 비동기 병렬로 변환하고 완료 순서대로 결과를 yield합니다.
+
+        Args:
+            file_paths: 변환할 원본 파일 경로의 (비동기) 이터러블
+            to: 단일 포맷 문자열 또는 파일별 포맷 목록
+            batch_size: 2 이상이면 대상 포맷과 상위 디렉터리가 같은 파일을
+                최대 ``batch_size``개씩 soffice 한 번으로 변환한다.
+            max_in_flight: 동시에 만들어 둘 최대 작업(Task) 수. 슬롯이 빌 때마다
+                입력을 읽는다. ``None``이면 ``max_concurrency``의 2배.
+            options: 모든 파일에 적용할 출력 필터와 필터 옵션
+            schedule: 작업 시작 순서와 무거운 작업의 동시 실행 수 제한.
+                ``None``이면 입력 순서대로 시작한다.
+            retry: 실패 재시도 정책. ``None``이면 재시도하지 않는다.
+
+        Yields:
+            완료 순서대로 ``Succeed`` 또는 ``Failed`` 인스턴스.
+
+        Raises:
+            ValueError: ``to``가 Sequence이고 길이가 ``file_paths``와 다를 때.
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if max_in_flight is None:
+            max_in_flight = self._default_max_in_flight()
+        elif max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+
+        jobs = aiter_jobs(file_paths, to)
+        units: AsyncIterator[tuple[str, list[str]]]
+        if batch_size is not None and batch_size > 1:
+            units = aiter_batches(jobs, batch_size)
+        else:
+            units = ((target, [fp]) async for fp, target in jobs)
+
+        queue = UnitQueue(schedule)
+        retries = RetryQueue(retry)
+        pending: dict[asyncio.Task[list[Succeed | Failed]], ScheduledUnit] = {}
+
+        async def run_unit(
+            target: str, chunk: list[str], submitted: float
+        ) -> list[Succeed | Failed]:
+            timer = NULL_TIMER if self._metrics is None else self._metrics.timer()
+            timer.stop(Stage.QUEUE_WAIT, submitted)
+            if len(chunk) > 1:
+                results = await self.async_transform_batch(chunk, target, options)
+            else:
+                results = [await self.async_transform(chunk[0], target, options)]
+            timer.attach(results)
+            return results
+
+        try:
+            exhausted = False
+            while True:
+                while len(pending) < max_in_flight:
+                    while (due := retries.pop_due()) is not None:
+                        queue.requeue(due)
+                    while not exhausted and queue.wants_more():
+                        try:
+                            unit = await units.__anext__()
+                        except StopAsyncIteration:
+                            exhausted = True
+                            break
+                        queue.push(*unit)
+                    scheduled = queue.pop()
+                    if scheduled is None:
+                        break
+                    task = asyncio.create_task(
+                        run_unit(scheduled.target, scheduled.paths, time.perf_counter())
+                    )
+                    pending[task] = scheduled
+                if not pending:
+                    if not retries:
+                        break
+                    # 백오프 중인 재시도만 남았다
+                    await asyncio.sleep(retries.next_due_in() or 0.0)
+                    continue
+
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=retries.next_due_in(),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    scheduled = pending.pop(task)
+                    queue.finish(scheduled)
+                    for result in retries.settle(scheduled, task.result()):
+                        yield result
+        finally:
+            # 소비가 중단되면 남은 작업을 취소한다
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _timed_unit(self, submitted: float, func, *args):
+        """병렬 API의 작업 하나를 실행하고 대기열에서 기다린 시간을 기록한다."""
+        assert self._metrics is not None
+        timer = self._metrics.timer()
+        timer.stop(Stage.QUEUE_WAIT, submitted)
+        result = func(*args)
+        timer.attach(result if isinstance(result, list) else [result])
+        return result
+
+    def _default_max_in_flight(self) -> int:
+        """병렬 API의 기본 동시 제출 한도."""
+        return 2 * self._max_concurrency
+
+    def _make_executor(self) -> concurrent.futures.Executor:
+        """:meth:`transform_parallel`에서 사용할 실행기를 생성한다.
+
+        실제 변환은 자식 프로세스가 수행하므로 스레드는 대기만 한다.
+        ``max_concurrency``개의 스레드가 동시 변환 수를 제한한다.
+        """
+        return ThreadPoolExecutor(
+            max_workers=self._max_concurrency, thread_name_prefix="libreformer"
+        )
+
+    def _precheck(
+        self, file_paths: Sequence[str], to: str
+    ) -> tuple[list[Path], dict[int, Failed]]:
+        """실행 전에 판별 가능한 실패를 걸러낸다.
+
+        ``_preflight``가 켜져 있으면 입력의 실제 포맷(확장자와 매직 바이트)에서
+        ``to``로 가는 변환이 레지스트리에 없을 때도 실패로 처리한다. 필터를
+        직접 지정한 ``to``(예: ``"pdf:writer_pdf_Export"``)는 검사하지 않는다.
+
+        Returns:
+            ``(변환할 입력 경로 목록, {입력 인덱스: Failed})``
+        """
+        pending: list[Path] = []
+        failures: dict[int, Failed] = {}
+        for idx, file_path in enumerate(file_paths):
+            input_path = Path(file_path)
+            if not input_path.exists():
+                failures[idx] = Failed(
+                    file_path=input_path,
+                    error_message="File not found",
+                    kind=FailureKind.INPUT_NOT_FOUND,
+                )
+            # self.libreoffice_path가 None일 수 있으므로 체크
+            elif not self.libreoffice_path:
+                failures[idx] = Failed(
+                    file_path=input_path, error_message="LibreOffice not found in PATH"
+                )
+            elif (
+                self._preflight
+                and ":" not in to
+                and (error := self._preflight_error(input_path, to))
+            ):
+                failures[idx] = Failed(
+                    file_path=input_path,
+                    error_message=error,
+                    kind=FailureKind.UNSUPPORTED_FORMAT,
+                )
+            elif (
+                self._quarantine is not None
+                and (entry := self._quarantine.lookup(input_path)) is not None
+            ):
+                failures[idx] = Failed(
+                    file_path=input_path,
+                    error_message=(
+                        f"Quarantined after {entry.strikes} {entry.kind.value} "
+                        f"failure(s): {entry.error_message}"
+                    ),
+                    kind=FailureKind.QUARANTINED,
+                )
+            else:
+                pending.append(input_path)
+        return pending, failures
+
+    def _observe(
+        self, input_paths: Sequence[Path], results: Sequence[Succeed | Failed]
+    ) -> None:
+        """soffice 실행 한 번의 결과를 서킷 브레이커와 격리 목록에 알린다.
+
+        여러 파일을 한 번에 실행하다 실패하면 원인 파일을 알 수 없으므로,
+        격리 목록에는 파일 하나짜리 실행의 실패만 기록한다.
+        """
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record(results)
+        if self._quarantine is not None and len(input_paths) == 1:
+            for result in results:
+                if isinstance(result, Failed):
+                    self._quarantine.record(result)
+
+    async def _async_observe(
+        self, input_paths: Sequence[Path], results: Sequence[Succeed | Failed]
+    ) -> None:
+        """:meth:`_observe`의 비동기 버전.
+
+        격리 목록 기록은 입력을 해시하므로 이벤트 루프 밖에서 수행한다.
+        """
+        if self._quarantine is None:
+            self._observe(input_paths, results)
+        else:
+            await asyncio.to_thread(self._observe, input_paths, results)
+
+    async def _async_precheck(
+        self, file_paths: Sequence[str], to: str
+    ) -> tuple[list[Path], dict[int, Failed]]:
+        """:meth:`_precheck`의 비동기 버전.
+
+        매직 바이트 판별과 격리 목록 조회는 입력 파일을 읽으므로 이벤트 루프
+        밖에서 수행한다.
+        """
+        return await asyncio.to_thread(self._precheck, file_paths, to)
+
+    @staticmethod
+    def _preflight_error(input_path: Path, to: str) -> str | None:
+        """``input_path``를 ``to``로 변환할 수 없으면 그 사유, 가능하면 ``None``.
+
+        변환 경로는 확장자로 계획하므로, 확장자와 다른 모듈이 여는 내용(예:
+        이름만 ``.docx``인 PDF)은 경로가 있더라도 실패로 처리한다.
+        """
+        suffix = input_path.suffix.lstrip(".").lower()
+        sniffed = FormatRegistry.sniff_format(input_path)
+        expected = FormatRegistry.import_categories(suffix)
+        if (
+            sniffed is not None
+            and expected
+            and not expected & FormatRegistry.import_categories(sniffed)
+        ):
+            return (
+                "File content does not match extension: "
+                f"content is {sniffed}, not {suffix}"
+            )
+        source = suffix if expected else sniffed or suffix
+        if FormatRegistry.can_route(source, to):
+            return None
+        return f"Unsupported conversion: {source or 'unknown'} -> {to}"
+
+    @staticmethod
+    def _merge_results(
+        count: int, failures: dict[int, Failed], converted: list[Succeed | Failed]
+    ) -> list[Succeed | Failed]:
+        """사전 실패와 변환 결과를 입력 순서대로 합친다."""
+        converted_iter = iter(converted)
+        return [
+            failures[idx] if idx in failures else next(converted_iter)
+            for idx in range(count)
+        ]
+
+    def _new_timer(self, hops: Sequence[Hop]) -> StageTimer:
+        """경로 실행 한 번의 단계별 시간을 모을 타이머. 계측이 꺼져 있으면 no-op."""
+        if self._metrics is None:
+            return NULL_TIMER
+        return self._metrics.timer({"target": hops[-1][0].split(":", 1)[0]})
 
     # ---------------------------------------------------------------------
     # Callable interface
@@ -88,25 +567,95 @@ class LibreOfficeEngine(BaseEngine):
         auto_install: bool = True,
         max_concurrency: int | None = None,
         timeout: float = 300.0,
+        pool_size: int | None = None,
+        max_jobs_per_worker: int = 200,
+        reuse_profiles: bool = True,
+        cache: ConversionCache | None = None,
+        generate_thumbnails: bool = True,
+        metrics: ConversionMetrics | None = None,
+        adaptive_concurrency: AdaptiveConcurrency | None = None,
+        shared_slots: SharedSlots | None = None,
+        output_dir: str | Path | None = None,
+        staging: bool = False,
+        max_worker_rss: int | None = None,
+        max_worker_age: float | None = None,
+        quarantine: Quarantine | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        preflight: bool = True,
     ):
         """
         LibreOfficeEngine 클래스 초기화
 
         Args:
             auto_install: LibreOffice가 설치되어 있지 않을 때 자동으로 설치할지 여부
-            max_concurrency: 비동기 최대 동시 변환 수. None이면 os.cpu_count() 사용.
+            max_concurrency: 최대 동시 변환 수. 동기 호출과 모든 이벤트 루프의
+                비동기 호출이 이 한도를 함께 쓴다. None이면 os.cpu_count() 사용.
             timeout: 단일 변환 작업 타임아웃(초). 기본값 300초.
+            pool_size: 상주 soffice 워커 수. None이면 변환마다 soffice를 새로 띄운다.
+            max_jobs_per_worker: 워커를 교체하기 전 처리할 최대 작업 수.
+            reuse_profiles: 사전 초기화된 ``UserInstallation`` 프로필을 작업 간에
+                재사용할지 여부. ``False``면 변환마다 빈 프로필을 새로 만든다.
+            cache: 변환 결과 캐시. 지정하면 같은 내용·포맷의 변환은 soffice를
+                실행하지 않고 캐시된 결과를 사용한다.
+            generate_thumbnails: ``False``면 ODF 출력에 썸네일을 만들지 않도록
+                프로필을 설정해 저장 시간을 줄인다.
+            metrics: 단계별 소요 시간을 기록할 계측기. 지정하면 결과 객체의
+                ``timings``에도 단계별 시간이 붙는다.
+            adaptive_concurrency: 지정하면 동시 실행 수를
+                ``max_concurrency``에서 시작해 지연 시간·CPU·메모리에 따라 조절한다.
+            shared_slots: 지정하면 soffice를 실행하기 전에 같은 디렉터리를 쓰는
+                모든 프로세스가 나눠 쓰는 머신 전역 슬롯도 하나 얻는다.
+            output_dir: 변환 결과를 둘 디렉터리. None이면 원본 파일의 디렉터리.
+            staging: ``True``면 soffice가 작업마다 RAM 기반 임시 디렉터리
+                (가능하면 ``/dev/shm``)에 출력하고, 완성된 파일을 출력
+                디렉터리로 원자적으로 옮긴다. 출력 디렉터리를 훑지 않으며,
+                다른 작업이 쓰다 만 파일을 결과로 착각하지 않는다.
+            max_worker_rss: 상주 워커 프로세스 트리의 RSS 한도(바이트). 넘으면
+                워커를 교체한다. ``pool_size``를 지정했을 때만 쓰인다.
+            max_worker_age: 상주 워커의 수명 한도(초). 넘으면 워커를 교체한다.
+            quarantine: 격리 목록. 지정하면 파일 하나짜리 soffice 실행의
+                타임아웃·크래시를 기록하고, 격리된 입력은 실행하지 않고
+                ``FailureKind.QUARANTINED``로 실패시킨다.
+            circuit_breaker: 지정하면 크래시·타임아웃이 잦을 때 동시 실행 수를
+                낮춘다.
+            preflight: ``True``면 입력의 확장자와 매직 바이트로 판별한 포맷에서
+                대상 포맷으로 가는 변환이 레지스트리에 없을 때 soffice를 띄우지
+                않고 ``FailureKind.UNSUPPORTED_FORMAT``으로 실패시킨다.
         """
-        super().__init__()
+        super().__init__(max_concurrency, metrics)
 
-        if max_concurrency is not None and max_concurrency < 1:
-            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
         if timeout <= 0:
             raise ValueError(f"timeout must be > 0, got {timeout}")
+        if pool_size is not None and pool_size < 1:
+            raise ValueError(f"pool_size must be >= 1, got {pool_size}")
 
-        self._max_concurrency = max_concurrency or os.cpu_count() or 4
         self._timeout = timeout
-        self._semaphore: asyncio.Semaphore | None = None
+        # asyncio.Semaphore와 달리 특정 이벤트 루프에 묶이지 않으므로 엔진 하나를
+        # 여러 스레드·루프에서 공유해도 전체 soffice 실행 수가 제한된다
+        self._limiter: ConcurrencyLimiter
+        if adaptive_concurrency is not None:
+            self._limiter = AdaptiveLimiter(adaptive_concurrency, self._max_concurrency)
+            process_threads = max(self._max_concurrency, adaptive_concurrency.ceiling)
+        else:
+            self._limiter = ConcurrencyLimiter(self._max_concurrency)
+            process_threads = self._max_concurrency
+        # 비동기 soffice 실행의 출력 수집·회수 전용 스레드. 기본 executor를 쓰면
+        # 다른 to_thread 작업과 경쟁해 타임아웃과 처리량이 밀린다
+        self._process_threads = process_threads
+        self._process_executor: ThreadPoolExecutor | None = None
+        self._process_executor_lock = threading.Lock()
+        self._shared_slots = shared_slots
+        self._quarantine = quarantine
+        self._circuit_breaker = circuit_breaker
+        self._preflight = preflight
+        if circuit_breaker is not None:
+            circuit_breaker.subscribe(self._limiter.set_cap)
+        self._output_dir: Path | None = None
+        if output_dir is not None:
+            self._output_dir = Path(output_dir).resolve()
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._staging = staging
+        self._cache = cache
 
         if auto_install and not check_install():
             install()
@@ -114,231 +663,763 @@ class LibreOfficeEngine(BaseEngine):
         # LibreOffice 실행 파일 경로 저장
         self.libreoffice_path = get_path()
 
-    @log_elapsed_time("LibreOffice file transformation")
-    def transform(self, file_path: str, to: str) -> Succeed | Failed:
-        """단일 파일을 변환하고 변환된 파일 경로를 반환합니다.
+        self._profile_settings = None if generate_thumbnails else NO_THUMBNAIL_SETTINGS
+        self._profiles: ProfileCache | None = None
+        if reuse_profiles and self.libreoffice_path:
+            self._profiles = ProfileCache(
+                self.libreoffice_path, settings=self._profile_settings
+            )
 
-        Args:
-            file_path: 변환할 원본 파일 경로
-            to: 변환할 목표 형식 (예: "pdf", "docx" 등)
+        self._pool: SofficeWorkerPool | None = None
+        if pool_size is not None and self.libreoffice_path:
+            self._pool = SofficeWorkerPool(
+                self.libreoffice_path,
+                size=pool_size,
+                max_jobs_per_worker=max_jobs_per_worker,
+                profile_cache=self._profiles,
+                max_worker_rss=max_worker_rss,
+                max_worker_age=max_worker_age,
+            )
+        # 실행 중인 변환의 최종 출력 경로
+        self._outputs = OutputClaims()
+        # 작업이 멈춘 채 끝난 워커의 프로필. 반납 시 워커를 교체한다.
+        self._stalled_profiles: set[Path] = set()
 
-        Returns:
-            Succeed: 변환 성공 시 (원본 경로, 출력 경로 포함)
-            Failed: 변환 실패 시 (에러 메시지 포함)
-        """
-        # 실제 변환 수행 (headless soffice 사용)
-        input_path = Path(file_path)
-        if not input_path.exists():
-            return Failed(file_path=input_path, error_message="File not found")
+    # -----------------------------------------------------------------
+    # Lifecycle
+    # -----------------------------------------------------------------
+    def close(self) -> None:
+        """상주 워커, 프로필 캐시 등 엔진이 보유한 자원을 해제한다."""
+        if self._pool is not None:
+            self._pool.close()
+        if self._profiles is not None:
+            self._profiles.close()
+        with self._process_executor_lock:
+            executor, self._process_executor = self._process_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
 
-        output_dir = str(input_path.parent)
+    def _process_pool(self) -> ThreadPoolExecutor:
+        """비동기 soffice 실행용 전용 executor. 처음 쓸 때 만든다."""
+        with self._process_executor_lock:
+            if self._process_executor is None:
+                self._process_executor = ThreadPoolExecutor(
+                    max_workers=self._process_threads,
+                    thread_name_prefix="libreformer-process",
+                )
+            return self._process_executor
 
-        # self.libreoffice_path가 None일 수 있으므로 체크
-        if not self.libreoffice_path:
-            return Failed(
-                file_path=input_path, error_message="LibreOffice not found in PATH"
-            )
+    def __enter__(self) -> "LibreOfficeEngine":
+        return self
 
-        # Unique user installation directory to avoid lock conflicts during parallel execution
-        import uuid
-        import shutil
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
-        user_installation_dir = Path(f"/tmp/libreoffice_conversion_{uuid.uuid4()}")
+    # -----------------------------------------------------------------
+    # Command helpers
+    # -----------------------------------------------------------------
+    def _build_command(
+        self,
+        input_paths: Sequence[Path],
+        to: str,
+        output_dir: str,
+        profile_dir: Path,
+        import_filter: str | None = None,
+    ) -> list[str]:
+        """headless soffice 변환 명령을 구성한다. 입력 파일은 여러 개일 수 있다.
 
+        ``import_filter``를 지정하면 입력을 해당 필터(모듈)로 불러온다.
+        """
+        assert self.libreoffice_path is not None
         cmd = [
             self.libreoffice_path,
-            f"-env:UserInstallation=file://{user_installation_dir}",
+            f"-env:UserInstallation=file://{profile_dir}",
             "--headless",
             "--norestore",
             "--nolockcheck",
-            "--convert-to",
-            to,
-            "--outdir",
-            output_dir,
-            str(input_path),
         ]
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        if import_filter:
+            cmd.append(f"--infilter={import_filter}")
+        cmd += ["--convert-to", to, "--outdir", output_dir]
+        cmd += [str(p) for p in input_paths]
+        return cmd
 
-            # Clean up temporary user installation directory
-            if user_installation_dir.exists():
-                shutil.rmtree(user_installation_dir, ignore_errors=True)
+    @staticmethod
+    def _find_output(input_path: Path, to: str, output_dir: str) -> Path:
+        """soffice가 생성할 출력 파일 경로를 계산한다.
 
-            if result.returncode != 0:
-                return Failed(
-                    file_path=Path(file_path),
-                    error_message=result.stderr.strip()
-                    or result.stdout.strip()
-                    or "Conversion failed",
-                )
-            # 변환된 파일 경로 구성
-            output_path = input_path.with_suffix(f".{to}")
-            if not output_path.exists():
-                # 일부 형식은 soffice가 .pdf 등 다른 확장자를 사용하므로 디렉터리에서 찾아봄
-                for f in os.listdir(output_dir):
-                    if f.startswith(input_path.stem) and f.lower().endswith(
-                        f".{to.lower()}"
-                    ):
-                        output_path = Path(output_dir) / f
-                        break
+        디렉터리를 뒤져 이름이 비슷한 파일을 고르지 않는다. 같은 디렉터리의
+        다른 입력(``report.txt``와 ``report-final.txt``)이나 이전 실행의 결과를
+        잘못 집을 수 있으므로, 계획한 경로에 파일이 없으면 호출자가 실패로 처리한다.
+        """
+        return Path(output_dir) / f"{input_path.stem}.{to}"
+
+    def _collect_outputs(
+        self,
+        input_paths: Sequence[Path],
+        to: str,
+        output_dir: str,
+        returncode: int,
+        stdout: str,
+        stderr: str,
+    ) -> list[Succeed | Failed]:
+        """soffice 종료 결과를 입력 파일별 ``Succeed``/``Failed``로 해석한다."""
+        if returncode != 0:
+            message = stderr.strip() or stdout.strip() or "Conversion failed"
+            kind = classify_exit(returncode, f"{stderr}\n{stdout}")
+            return [
+                Failed(file_path=p, error_message=message, kind=kind)
+                for p in input_paths
+            ]
 
+        results: list[Succeed | Failed] = []
+        for input_path in input_paths:
+            output_path = self._find_output(input_path, to, output_dir)
             # 출력 파일 존재 확인
             if not output_path.exists():
-                return Failed(
-                    file_path=Path(file_path),
-                    error_message=f"Conversion succeeded but output file not found: {output_path}",
+                results.append(
+                    Failed(
+                        file_path=input_path,
+                        error_message=(
+                            "Conversion succeeded but output file not found: "
+                            f"{output_path}"
+                        ),
+                        kind=FailureKind.OUTPUT_MISSING,
+                    )
                 )
-
-            # Return a Succeed instance with original and output paths
-            return Succeed(file_path=Path(file_path), output_path=output_path.resolve())
-        except Exception as e:
-            return Failed(file_path=input_path, error_message=str(e))
+            else:
+                results.append(
+                    Succeed(file_path=input_path, output_path=output_path.resolve())
+                )
+        return results
 
     # -----------------------------------------------------------------
-    # Async API (신규)
+    # Result cache
     # -----------------------------------------------------------------
-    def _get_semaphore(self) -> asyncio.Semaphore:
-        """이벤트 루프별로 Semaphore를 지연 생성한다."""
-        if self._semaphore is None:
-            self._semaphore = asyncio.Semaphore(self._max_concurrency)
-        return self._semaphore
-
-    @async_log_elapsed_time("LibreOffice async file transformation")
-    async def async_transform(self, file_path: str, to: str) -> Succeed | Failed:
-        """단일 파일을 비동기로 변환하고 결과를 반환합니다.
+    def _cache_lookup(
+        self,
+        input_paths: Sequence[Path],
+        to: str,
+        options: FilterOptions | None = None,
+        output_dir: Path | None = None,
+    ) -> tuple[dict[Path, str], dict[Path, Succeed]]:
+        """캐시 키를 계산하고 적중한 입력은 결과를 출력 위치에 배치한다.
 
-        Args:
-            file_path: 변환할 원본 파일 경로
-            to: 변환할 목표 형식 (예: ``"pdf"``, ``"docx"`` 등)
+        ``output_dir``이 없으면 엔진의 출력 디렉터리(또는 원본 디렉터리)에 둔다.
 
         Returns:
-            변환 성공 시 ``Succeed``, 실패 시 ``Failed``.
+            ``({입력 경로: 캐시 키}, {입력 경로: 적중 결과})``
         """
-        import uuid
-        import shutil
+        if self._cache is None:
+            return {}, {}
+        keys: dict[Path, str] = {}
+        hits: dict[Path, Succeed] = {}
+        token = options.cache_token() if options is not None else ""
+        for input_path in input_paths:
+            route = "\n".join(
+                f"{convert_to}\t{import_filter or ''}"
+                for convert_to, import_filter in plan_hops(input_path, to, options)
+            )
+            try:
+                key = self._cache.key(input_path, to, token, route)
+            except OSError as e:
+                logger.warning("캐시 키 계산 실패: {}", e)
+                continue
+            keys[input_path] = key
+            extension = to.split(":", 1)[0]
+            destination = (
+                output_dir or self._output_dir or input_path.parent
+            ) / f"{input_path.stem}.{extension}"
+            output_path = self._cache.fetch(key, destination)
+            if output_path is None:
+                continue
+            hits[input_path] = Succeed(
+                file_path=input_path,
+                output_path=output_path.resolve(),
+                input_size=file_size(input_path),
+                output_size=file_size(output_path),
+            )
+        return keys, hits
 
-        input_path = Path(file_path)
-        if not input_path.exists():
-            return Failed(file_path=input_path, error_message="File not found")
+    def _cache_merge(
+        self,
+        input_paths: Sequence[Path],
+        keys: dict[Path, str],
+        hits: dict[Path, Succeed],
+        misses: Sequence[Path],
+        converted: Sequence[Succeed | Failed],
+    ) -> list[Succeed | Failed]:
+        """새 변환 결과를 캐시에 저장하고 적중분과 합쳐 입력 순서로 반환한다."""
+        by_path: dict[Path, Succeed | Failed] = dict(hits)
+        for input_path, result in zip(misses, converted):
+            by_path[input_path] = result
+            if (
+                self._cache is not None
+                and isinstance(result, Succeed)
+                and input_path in keys
+            ):
+                self._cache.put(keys[input_path], result.output_path)
+        return [by_path[p] for p in input_paths]
 
-        if not self.libreoffice_path:
-            return Failed(
-                file_path=input_path, error_message="LibreOffice not found in PATH"
-            )
+    # -----------------------------------------------------------------
+    # Profile leasing
+    # -----------------------------------------------------------------
+    @contextmanager
+    def _lease_profile(self) -> Iterator[tuple[Path, int | None]]:
+        """변환에 사용할 ``UserInstallation`` 디렉터리를 빌려준다.
+
+        워커 풀이 있으면 상주 워커의 프로필을, 프로필 캐시가 있으면 캐시의
+        프로필을, 둘 다 없으면 일회용 디렉터리를 사용한다.
+
+        Yields:
+            ``(프로필 디렉터리, 워커 번호)``. 워커를 쓰지 않으면 번호는 ``None``.
+        """
+        if self._pool is not None:
+            try:
+                worker = self._pool.checkout()
+            except WorkerStartError as e:
+                logger.warning("워커 풀 사용 불가, 단발 실행으로 대체: {}", e)
+            else:
+                healthy = True
+                try:
+                    yield worker.profile_dir, worker.worker_id
+                except BaseException:
+                    healthy = False
+                    raise
+                finally:
+                    self._checkin_worker(worker, healthy)
+                return
 
-        output_dir = str(input_path.parent)
+        if self._profiles is not None:
+            with self._profiles.lease() as profile_dir:
+                yield profile_dir, None
+            return
+
+        # Unique user installation directory to avoid lock conflicts
+        # during parallel execution
         user_installation_dir = Path(f"/tmp/libreoffice_conversion_{uuid.uuid4()}")
+        try:
+            if self._profile_settings:
+                write_registry_settings(user_installation_dir, self._profile_settings)
+            yield user_installation_dir, None
+        finally:
+            # Clean up temporary user installation directory
+            if user_installation_dir.exists():
+                shutil.rmtree(user_installation_dir, ignore_errors=True)
 
-        cmd = [
-            self.libreoffice_path,
-            f"-env:UserInstallation=file://{user_installation_dir}",
-            "--headless",
-            "--norestore",
-            "--nolockcheck",
-            "--convert-to",
-            to,
-            "--outdir",
-            output_dir,
-            str(input_path),
-        ]
+    def _discard_profile(self, profile_dir: Path, stalled: bool = False) -> None:
+        """실패한 작업에 쓰인 캐시 프로필을 반납 시 폐기하도록 표시한다.
 
-        semaphore = self._get_semaphore()
-        async with semaphore:
+        ``stalled=True``(타임아웃·취소)면 그 프로필을 쓰는 상주 워커도 반납 시
+        종료하고 교체한다. 타임아웃은 작업을 전달한 클라이언트 프로세스만
+        죽이므로, 멈춘 워커가 유휴 대기열로 돌아가지 않게 하기 위함이다.
+        """
+        if self._profiles is not None:
+            self._profiles.invalidate(profile_dir)
+        if stalled and self._pool is not None:
+            self._stalled_profiles.add(profile_dir)
+
+    def _checkin_worker(self, worker: SofficeWorker, healthy: bool) -> None:
+        """상주 워커를 반납한다. 죽었거나 작업이 멈춘 워커는 교체한다."""
+        stalled = worker.profile_dir in self._stalled_profiles
+        self._stalled_profiles.discard(worker.profile_dir)
+        if not worker.alive:
+            logger.warning("soffice 워커 {} 비정상 종료", worker.worker_id)
+        elif stalled:
+            logger.warning("soffice 워커 {} 응답 없음, 교체", worker.worker_id)
+        assert self._pool is not None
+        self._pool.checkin(worker, healthy=healthy and worker.alive and not stalled)
+
+    @asynccontextmanager
+    async def _async_lease_profile(self) -> AsyncIterator[tuple[Path, int | None]]:
+        """:meth:`_lease_profile`의 비동기 버전."""
+        if self._pool is not None:
             try:
-                proc = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
+                worker = await self._pool.async_checkout()
+            except WorkerStartError as e:
+                logger.warning("워커 풀 사용 불가, 단발 실행으로 대체: {}", e)
+            else:
+                healthy = True
                 try:
-                    stdout, stderr = await asyncio.wait_for(
-                        proc.communicate(), timeout=self._timeout
-                    )
-                except asyncio.TimeoutError:
-                    proc.kill()
-                    await proc.wait()
-                    return Failed(
-                        file_path=input_path,
-                        error_message=f"Conversion timed out after {self._timeout}s",
-                    )
+                    yield worker.profile_dir, worker.worker_id
+                except BaseException:
+                    healthy = False
+                    raise
                 finally:
-                    # Clean up temporary user installation directory
-                    if user_installation_dir.exists():
-                        shutil.rmtree(user_installation_dir, ignore_errors=True)
-
-                if proc.returncode != 0:
-                    stderr_text = stderr.decode().strip() if stderr else ""
-                    stdout_text = stdout.decode().strip() if stdout else ""
-                    return Failed(
-                        file_path=input_path,
-                        error_message=stderr_text or stdout_text or "Conversion failed",
-                    )
+                    self._checkin_worker(worker, healthy)
+                return
 
-                # 변환된 파일 경로 구성
-                output_path = input_path.with_suffix(f".{to}")
-                if not output_path.exists():
-                    for f in os.listdir(output_dir):
-                        if f.startswith(input_path.stem) and f.lower().endswith(
-                            f".{to.lower()}"
-                        ):
-                            output_path = Path(output_dir) / f
-                            break
+        if self._profiles is not None:
+            async with self._profiles.async_lease() as profile_dir:
+                yield profile_dir, None
+            return
 
-                if not output_path.exists():
-                    return Failed(
-                        file_path=input_path,
-                        error_message=f"Conversion succeeded but output file not found: {output_path}",
+        user_installation_dir = Path(f"/tmp/libreoffice_conversion_{uuid.uuid4()}")
+        try:
+            if self._profile_settings:
+                write_registry_settings(user_installation_dir, self._profile_settings)
+            yield user_installation_dir, None
+        finally:
+            if user_installation_dir.exists():
+                await asyncio.shield(
+                    asyncio.to_thread(
+                        shutil.rmtree, user_installation_dir, ignore_errors=True
                     )
-
-                return Succeed(file_path=input_path, output_path=output_path.resolve())
-            except asyncio.TimeoutError:
-                return Failed(
-                    file_path=input_path,
-                    error_message=f"Conversion timed out after {self._timeout}s",
                 )
-            except Exception as e:
-                return Failed(file_path=input_path, error_message=str(e))
 
-    @overload
-    async def async_transform_parallel(
-        self, file_paths: Sequence[str], to: str
-    ) -> AsyncIterator[Succeed | Failed]: ...
-    @overload
-    async def async_transform_parallel(
-        self, file_paths: Sequence[str], to: Sequence[str]
-    ) -> AsyncIterator[Succeed | Failed]: ...
-    async def async_transform_parallel(
+    # -----------------------------------------------------------------
+    # Sync API
+    # -----------------------------------------------------------------
+    @log_elapsed_time("LibreOffice file transformation")
+    def transform(
+        self, file_path: str, to: str, options: FilterOptions | None = None
+    ) -> Succeed | Failed:
+        """단일 파일을 변환하고 변환된 파일 경로를 반환합니다.
+
+        Args:
+            file_path: 변환할 원본 파일 경로
+            to: 변환할 목표 형식 (예: "pdf", "docx" 등)
+            options: 출력 필터와 필터 옵션. ``None``이면 레지스트리의 기본 필터
+
+        Returns:
+            Succeed: 변환 성공 시 (원본 경로, 출력 경로 포함)
+            Failed: 변환 실패 시 (에러 메시지 포함)
+        """
+        return self._transform_many([file_path], to, options)[0]
+
+    @log_elapsed_time("LibreOffice batch transformation")
+    def transform_batch(
         self,
         file_paths: Sequence[str],
-        to: str | Sequence[str],
-    ) -> AsyncIterator[Succeed | Failed]:
-        """복수 파일을 비동기 병렬로 변환하고 완료 순서대로 결과를 yield합니다.
+        to: str,
+        options: FilterOptions | None = None,
+    ) -> list[Succeed | Failed]:
+        """여러 파일을 soffice 한 번의 실행으로 변환합니다.
+
+        상위 디렉터리가 다르거나 stem이 겹치는 파일은 자동으로 나누어 실행한다.
 
         Args:
             file_paths: 변환할 원본 파일 경로 목록
-            to: 단일 포맷 문자열 또는 파일별 포맷 목록
+            to: 변환할 목표 형식
+            options: 출력 필터와 필터 옵션
 
-        Yields:
-            완료 순서대로 ``Succeed`` 또는 ``Failed`` 인스턴스.
+        Returns:
+            입력 순서와 같은 순서의 ``Succeed``/``Failed`` 목록.
+        """
+        pending, failures = self._precheck(file_paths, to)
+        by_path: dict[str, Succeed | Failed] = {}
+        for _, chunk in iter_batches(
+            ((str(p), to) for p in pending), len(pending) or 1
+        ):
+            chunk_paths = [Path(fp) for fp in chunk]
+            results = self._convert_group(chunk_paths, to, options)
+            for fp, result in zip(chunk, results):
+                by_path[fp] = result
+        converted = [by_path[str(p)] for p in pending]
+        return self._merge_results(len(file_paths), failures, converted)
+
+    @log_elapsed_time("LibreOffice bytes transformation")
+    def transform_bytes(
+        self,
+        data: BytesInput,
+        from_ext: str,
+        to: str,
+        options: FilterOptions | None = None,
+        as_mmap: bool = False,
+    ) -> bytes | mmap.mmap:
+        """메모리의 문서를 변환하고 결과를 바이트로 반환합니다.
+
+        입력과 출력은 작업마다 만드는 RAM 기반 임시 디렉터리(가능하면
+        ``/dev/shm``)에만 쓰이며, 엔진의 ``output_dir``은 사용하지 않는다.
+
+        Args:
+            data: 원본 문서. 바이트류 객체 또는 바이너리 파일류 객체
+            from_ext: 원본 형식 확장자 (예: ``"docx"``)
+            to: 변환할 목표 형식
+            options: 출력 필터와 필터 옵션
+            as_mmap: ``True``면 결과를 복사하지 않고 읽기 전용 ``mmap``으로 반환한다.
+
+        Returns:
+            변환 결과.
 
         Raises:
-            ValueError: ``to``가 Sequence이고 길이가 ``file_paths``와 다를 때.
+            ConversionError: 변환에 실패했을 때.
+            ValueError: ``from_ext``가 비어 있을 때.
         """
-        if not isinstance(to, str):
-            if len(to) != len(file_paths):
-                raise ValueError(
-                    f"Length of 'to' ({len(to)}) must match number of file_paths ({len(file_paths)})"
-                )
+        name = input_name(from_ext)
+        with tempfile.TemporaryDirectory(
+            prefix="libreformer_bytes_", dir=fast_temp_dir()
+        ) as tmp:
+            input_path = Path(tmp) / name
+            write_input(input_path, data)
+            pending, failures = self._precheck([str(input_path)], to)
+            if failures:
+                raise ConversionError(failures[0])
+            result = self._convert_group(pending, to, options, Path(tmp))[0]
+            if isinstance(result, Failed):
+                raise ConversionError(result)
+            return read_output(result.output_path, as_mmap)
+
+    def _transform_many(
+        self,
+        file_paths: Sequence[str],
+        to: str,
+        options: FilterOptions | None = None,
+    ) -> list[Succeed | Failed]:
+        """상위 디렉터리와 stem 충돌이 없는 파일들을 한 번에 변환한다."""
+        pending, failures = self._precheck(file_paths, to)
+        converted = self._convert_group(pending, to, options) if pending else []
+        return self._merge_results(len(file_paths), failures, converted)
 
-        tasks: list[asyncio.Task[Succeed | Failed]] = []
-        for idx, fp in enumerate(file_paths):
-            target = to if isinstance(to, str) else to[idx]
-            task = asyncio.create_task(self.async_transform(fp, target))
-            tasks.append(task)
+    def _convert_group(
+        self,
+        input_paths: Sequence[Path],
+        to: str,
+        options: FilterOptions | None = None,
+        output_dir: Path | None = None,
+    ) -> list[Succeed | Failed]:
+        """같은 디렉터리의 입력 파일들을 변환한다. 캐시 적중분은 실행을 건너뛴다.
+
+        ``output_dir``을 지정하면 엔진의 출력 디렉터리 대신 그곳에 출력한다.
+        """
+        keys, hits = self._cache_lookup(input_paths, to, options, output_dir)
+        misses = [p for p in input_paths if p not in hits]
+        converted = self._run_group(misses, to, options, output_dir) if misses else []
+        return self._cache_merge(input_paths, keys, hits, misses, converted)
+
+    def _run_group(
+        self,
+        input_paths: Sequence[Path],
+        to: str,
+        options: FilterOptions | None = None,
+        output_dir: Path | None = None,
+    ) -> list[Succeed | Failed]:
+        """같은 디렉터리의 입력 파일들을 실행 단계별로 묶어 soffice로 변환한다."""
+        destinations = self._destinations(input_paths, to, output_dir)
+        with self._outputs.claim(destinations) as conflicts:
+            results = self._collisions(conflicts)
+            runnable = [p for p in input_paths if p not in conflicts]
+            for hops, paths in self._split_by_hops(runnable, to, options).items():
+                results.update(zip(paths, self._run_route(paths, hops, output_dir)))
+        return [results[p] for p in input_paths]
+
+    def _destinations(
+        self, input_paths: Sequence[Path], to: str, output_dir: Path | None
+    ) -> dict[Path, Path]:
+        """입력별 최종 출력 경로 (절대 경로)."""
+        extension = to.split(":", 1)[0]
+        return {
+            p: (output_dir or self._output_dir or p.parent).absolute()
+            / f"{p.stem}.{extension}"
+            for p in input_paths
+        }
+
+    @staticmethod
+    def _collisions(conflicts: dict[Path, Path]) -> dict[Path, Succeed | Failed]:
+        """다른 입력이 쓰고 있는 출력 경로로 가는 입력의 실패 결과."""
+        return {
+            p: Failed(
+                p,
+                f"Output path collision: {destination} is already being written "
+                "for another input",
+            )
+            for p, destination in conflicts.items()
+        }
+
+    def _run_route(
+        self,
+        input_paths: Sequence[Path],
+        hops: Sequence[Hop],
+        output_dir: Path | None = None,
+    ) -> list[Succeed | Failed]:
+        """변환 경로의 모든 단계를 같은 프로필(워커)에서 차례로 실행한다.
+
+        각 단계는 soffice 한 번으로 모든 입력을 변환하며, 단계별로
+        ``self._timeout``을 입력 수만큼 늘려 적용한다. 경로 전체가 동시 실행
+        슬롯 하나를 쓴다.
+        """
+        timer = self._new_timer(hops)
+        started = timer.start()
+        shared = self._shared_slots.lease() if self._shared_slots else nullcontext()
+        # 프로세스 안의 슬롯을 먼저 얻어, 머신 전역 슬롯을 쥔 채 기다리지 않는다
+        with self._limiter, shared:
+            timer.stop(Stage.SEMAPHORE_WAIT, started)
+            try:
+                started = timer.start()
+                with route_scratch_dir(hops, self._staging) as scratch_dir:
+                    with self._lease_profile() as (profile_dir, worker_id):
+                        timer.stop(Stage.PROFILE_SETUP, started)
+                        run = RouteRun(
+                            input_paths,
+                            hops,
+                            scratch_dir,
+                            worker_id,
+                            output_dir or self._output_dir,
+                            self._staging,
+                        )
+                        while (step := run.next_step()) is not None:
+                            step_dir = str(step.output_dir)
+                            cmd = self._build_command(
+                                step.inputs,
+                                step.convert_to,
+                                step_dir,
+                                profile_dir,
+                                step.import_filter,
+                            )
+                            timeout = self._timeout * len(step.inputs)
+                            try:
+                                result = run_process(cmd, timeout=timeout, timer=timer)
+                            except subprocess.TimeoutExpired:
+                                self._discard_profile(profile_dir, stalled=True)
+                                run.fail(
+                                    f"Conversion timed out after {timeout}s",
+                                    timeout,
+                                    FailureKind.TIMEOUT,
+                                )
+                                break
+                            if result.returncode != 0:
+                                self._discard_profile(profile_dir)
+                            with timer.measure(Stage.OUTPUT_DISCOVERY):
+                                outputs = self._collect_outputs(
+                                    step.inputs,
+                                    step.extension,
+                                    step_dir,
+                                    result.returncode,
+                                    result.stdout,
+                                    result.stderr,
+                                )
+                            run.record(outputs, result)
+                        started = timer.start()
+                timer.stop(Stage.CLEANUP, started)
+                results = run.results()
+                timer.attach(results)
+                self._observe(input_paths, results)
+                return results
+            except Exception as e:
+                return [Failed(file_path=p, error_message=str(e)) for p in input_paths]
+
+    @staticmethod
+    def _split_by_hops(
+        input_paths: Sequence[Path], to: str, options: FilterOptions | None
+    ) -> dict[tuple[Hop, ...], list[Path]]:
+        """입력 파일을 soffice 실행 단계가 같은 것끼리 나눈다.
+
+        입력 포맷마다 출력 필터나 변환 경로가 다를 수 있으므로, 같은 단계를
+        쓰는 파일만 soffice 한 번으로 함께 변환한다.
+        """
+        groups: dict[tuple[Hop, ...], list[Path]] = {}
+        for path in input_paths:
+            groups.setdefault(plan_hops(path, to, options), []).append(path)
+        return groups
 
-        for coro in asyncio.as_completed(tasks):
-            result = await coro
-            yield result
+    # -----------------------------------------------------------------
+    # Async API (신규)
+    # -----------------------------------------------------------------
+    @async_log_elapsed_time("LibreOffice async file transformation")
+    async def async_transform(
+        self, file_path: str, to: str, options: FilterOptions | None = None
+    ) -> Succeed | Failed:
+        """단일 파일을 비동기로 변환하고 결과를 반환합니다.
+
+        Args:
+            file_path: 변환할 원본 파일 경로
+            to: 변환할 목표 형식 (예: ``"pdf"``, ``"docx"`` 등)
+            options: 출력 필터와 필터 옵션. ``None``이면 레지스트리의 기본 필터
+
+        Returns:
+            변환 성공 시 ``Succeed``, 실패 시 ``Failed``.
+        """
+        pending, failures = await self._async_precheck([file_path], to)
+        if failures:
+            return failures[0]
+        return (await self._async_convert_group(pending, to, options))[0]
+
+    @async_log_elapsed_time("LibreOffice async batch transformation")
+    async def async_transform_batch(
+        self,
+        file_paths: Sequence[str],
+        to: str,
+        options: FilterOptions | None = None,
+    ) -> list[Succeed | Failed]:
+        """:meth:`transform_batch`의 비동기 버전.
+
+        나뉜 각 묶음은 동시성 제한 슬롯을 하나씩 사용한다.
+        """
+        pending, failures = await self._async_precheck(file_paths, to)
+        groups = list(iter_batches(((str(p), to) for p in pending), len(pending) or 1))
+        group_results = await asyncio.gather(
+            *(
+                self._async_convert_group([Path(fp) for fp in chunk], to, options)
+                for _, chunk in groups
+            )
+        )
+        by_path: dict[str, Succeed | Failed] = {}
+        for (_, chunk), results in zip(groups, group_results):
+            by_path.update(zip(chunk, results))
+        converted = [by_path[str(p)] for p in pending]
+        return self._merge_results(len(file_paths), failures, converted)
+
+    @async_log_elapsed_time("LibreOffice async bytes transformation")
+    async def async_transform_bytes(
+        self,
+        data: BytesInput,
+        from_ext: str,
+        to: str,
+        options: FilterOptions | None = None,
+        as_mmap: bool = False,
+    ) -> bytes | mmap.mmap:
+        """:meth:`transform_bytes`의 비동기 버전.
+
+        임시 파일 입출력은 이벤트 루프 밖에서 수행한다.
+        """
+        name = input_name(from_ext)
+        tmp = Path(
+            await asyncio.to_thread(
+                tempfile.mkdtemp, prefix="libreformer_bytes_", dir=fast_temp_dir()
+            )
+        )
+        try:
+            input_path = tmp / name
+            await asyncio.to_thread(write_input, input_path, data)
+            pending, failures = await self._async_precheck([str(input_path)], to)
+            if failures:
+                raise ConversionError(failures[0])
+            result = (await self._async_convert_group(pending, to, options, tmp))[0]
+            if isinstance(result, Failed):
+                raise ConversionError(result)
+            return await asyncio.to_thread(read_output, result.output_path, as_mmap)
+        finally:
+            await asyncio.to_thread(shutil.rmtree, tmp, True)
+
+    async def _async_convert_group(
+        self,
+        input_paths: Sequence[Path],
+        to: str,
+        options: FilterOptions | None = None,
+        output_dir: Path | None = None,
+    ) -> list[Succeed | Failed]:
+        """:meth:`_convert_group`의 비동기 버전."""
+        if self._cache is not None:
+            # 입력 해싱은 파일 I/O이므로 이벤트 루프 밖에서 수행
+            keys, hits = await asyncio.to_thread(
+                self._cache_lookup, input_paths, to, options, output_dir
+            )
+        else:
+            keys, hits = {}, {}
+        misses = [p for p in input_paths if p not in hits]
+        converted = (
+            await self._async_run_group(misses, to, options, output_dir)
+            if misses
+            else []
+        )
+        if self._cache is None:
+            return self._cache_merge(input_paths, keys, hits, misses, converted)
+        # 결과 저장은 출력 파일 전체를 복사하므로 이벤트 루프 밖에서 수행
+        return await asyncio.to_thread(
+            self._cache_merge, input_paths, keys, hits, misses, converted
+        )
+
+    async def _async_run_group(
+        self,
+        input_paths: Sequence[Path],
+        to: str,
+        options: FilterOptions | None = None,
+        output_dir: Path | None = None,
+    ) -> list[Succeed | Failed]:
+        """:meth:`_run_group`의 비동기 버전."""
+        destinations = self._destinations(input_paths, to, output_dir)
+        with self._outputs.claim(destinations) as conflicts:
+            results = self._collisions(conflicts)
+            runnable = [p for p in input_paths if p not in conflicts]
+            groups = self._split_by_hops(runnable, to, options)
+            converted = await asyncio.gather(
+                *(
+                    self._async_run_route(paths, hops, output_dir)
+                    for hops, paths in groups.items()
+                )
+            )
+        for paths, group_results in zip(groups.values(), converted):
+            results.update(zip(paths, group_results))
+        return [results[p] for p in input_paths]
+
+    async def _async_run_route(
+        self,
+        input_paths: Sequence[Path],
+        hops: Sequence[Hop],
+        output_dir: Path | None = None,
+    ) -> list[Succeed | Failed]:
+        """:meth:`_run_route`의 비동기 버전."""
+        timer = self._new_timer(hops)
+        started = timer.start()
+        shared = (
+            self._shared_slots.async_lease() if self._shared_slots else nullcontext()
+        )
+        async with self._limiter, shared:
+            timer.stop(Stage.SEMAPHORE_WAIT, started)
+            try:
+                started = timer.start()
+                with route_scratch_dir(hops, self._staging) as scratch_dir:
+                    async with self._async_lease_profile() as (
+                        profile_dir,
+                        worker_id,
+                    ):
+                        timer.stop(Stage.PROFILE_SETUP, started)
+                        run = RouteRun(
+                            input_paths,
+                            hops,
+                            scratch_dir,
+                            worker_id,
+                            output_dir or self._output_dir,
+                            self._staging,
+                        )
+                        while (step := run.next_step()) is not None:
+                            step_dir = str(step.output_dir)
+                            cmd = self._build_command(
+                                step.inputs,
+                                step.convert_to,
+                                step_dir,
+                                profile_dir,
+                                step.import_filter,
+                            )
+                            timeout = self._timeout * len(step.inputs)
+                            try:
+                                result = await async_run_process(
+                                    cmd,
+                                    timeout=timeout,
+                                    timer=timer,
+                                    executor=self._process_pool(),
+                                )
+                            except asyncio.TimeoutError:
+                                self._discard_profile(profile_dir, stalled=True)
+                                run.fail(
+                                    f"Conversion timed out after {timeout}s",
+                                    timeout,
+                                    FailureKind.TIMEOUT,
+                                )
+                                break
+                            except asyncio.CancelledError:
+                                self._discard_profile(profile_dir, stalled=True)
+                                raise
+                            if result.returncode != 0:
+                                self._discard_profile(profile_dir)
+                            with timer.measure(Stage.OUTPUT_DISCOVERY):
+                                outputs = self._collect_outputs(
+                                    step.inputs,
+                                    step.extension,
+                                    step_dir,
+                                    result.returncode,
+                                    result.stdout,
+                                    result.stderr,
+                                )
+                            run.record(outputs, result)
+                        started = timer.start()
+                timer.stop(Stage.CLEANUP, started)
+                results = run.results()
+                timer.attach(results)
+                await self._async_observe(input_paths, results)
+                return results
+            except Exception as e:
+                return [Failed(file_path=p, error_message=str(e)) for p in input_paths]
 
     # -----------------------------------------------------------------
     # Format convenience methods (Engine → FormatRegistry 통합)
@@ -1,6 +1,12 @@
 from .categories import DocumentCategory
 
-__all__ = ["DocumentCategory", "FormatRegistry"]
+__all__ = [
+    "ConversionHop",
+    "ConversionMatrix",
+    "ConversionRoute",
+    "DocumentCategory",
+    "FormatRegistry",
+]
 
 
 # Lazy import to avoid circular dependency with schemas.format_info
@@ -9,4 +15,8 @@ def __getattr__(name: str):
         from .registry import FormatRegistry
 
         return FormatRegistry
+    if name in ("ConversionHop", "ConversionMatrix", "ConversionRoute"):
+        from . import routes
+
+        return getattr(routes, name)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -357,6 +357,42 @@ DRAW_FORMATS: list[FormatInfo] = [
     FormatInfo(
         "sxd", "StarOffice XML (Draw)", None, DocumentCategory.DRAW, True, False
     ),
+    # --- PDF / image import (Draw가 페이지·그림으로 불러온다) ---
+    FormatInfo(
+        "pdf", "draw_pdf_import", "application/pdf", DocumentCategory.DRAW, True, False
+    ),
+    FormatInfo(
+        "png",
+        "PNG - Portable Network Graphic",
+        "image/png",
+        DocumentCategory.DRAW,
+        True,
+        False,
+    ),
+    FormatInfo("jpg", "JPG - JPEG", "image/jpeg", DocumentCategory.DRAW, True, False),
+    FormatInfo("jpeg", "JPG - JPEG", "image/jpeg", DocumentCategory.DRAW, True, False),
+    FormatInfo(
+        "gif",
+        "GIF - Graphics Interchange",
+        "image/gif",
+        DocumentCategory.DRAW,
+        True,
+        False,
+    ),
+    FormatInfo(
+        "bmp", "BMP - MS Windows", "image/bmp", DocumentCategory.DRAW, True, False
+    ),
+    FormatInfo(
+        "svg",
+        "SVG - Scalable Vector Graphics",
+        "image/svg+xml",
+        DocumentCategory.DRAW,
+        True,
+        False,
+    ),
+    FormatInfo(
+        "webp", "WEBP - WebP Image", "image/webp", DocumentCategory.DRAW, True, False
+    ),
 ]
 
 # ---------------------------------------------------------------------------
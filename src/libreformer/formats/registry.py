@@ -2,9 +2,85 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
 from ..schemas.format_info import FormatInfo
 from .categories import DocumentCategory
 from .data import ALL_FORMATS
+from .routes import ConversionMatrix, ConversionRoute, RoutePlanner
+from .sniff import sniff_extension
+
+
+def _normalize(extension: str) -> str:
+    return extension.lstrip(".").lower()
+
+
+class _FormatIndex:
+    """``ALL_FORMATS``에서 한 번만 만드는 읽기 전용 조회 인덱스.
+
+    모든 값은 튜플·frozenset·``MappingProxyType``이므로 호출자가 수정할 수 없다.
+    각 튜플은 ``ALL_FORMATS``의 등록 순서를 유지한다.
+    """
+
+    def __init__(self, formats: tuple[FormatInfo, ...]):
+        by_extension: dict[str, list[FormatInfo]] = {}
+        by_category: dict[DocumentCategory, list[FormatInfo]] = {
+            category: [] for category in DocumentCategory
+        }
+        by_mime: dict[str, list[FormatInfo]] = {}
+        importers: dict[str, list[FormatInfo]] = {}
+        exporters: dict[str, list[FormatInfo]] = {}
+        for fmt in formats:
+            by_extension.setdefault(fmt.extension, []).append(fmt)
+            by_category[fmt.category].append(fmt)
+            if fmt.mime_type:
+                by_mime.setdefault(fmt.mime_type.lower(), []).append(fmt)
+            if fmt.can_import:
+                importers.setdefault(fmt.extension, []).append(fmt)
+            if fmt.can_export:
+                exporters.setdefault(fmt.extension, []).append(fmt)
+
+        self.formats = formats
+        self.by_extension = _freeze(by_extension)
+        self.by_category = _freeze(by_category)
+        self.by_mime = _freeze(by_mime)
+        self.importers = _freeze(importers)
+        self.exporters = _freeze(exporters)
+        self.input_extensions = frozenset(importers)
+        self.output_extensions = frozenset(exporters)
+
+        # 입력 카테고리와 무관하게 사용할 기본 출력 필터 (등록 순서상 첫 번째)
+        self.default_export_filter: Mapping[str, str] = MappingProxyType(
+            {ext: fmts[0].filter_name for ext, fmts in exporters.items()}
+        )
+        # (입력 확장자, 출력 확장자) → 입력과 같은 카테고리의 출력 필터
+        export_filters: dict[tuple[str, str], str] = {}
+        for from_ext, from_fmts in importers.items():
+            categories = {fmt.category for fmt in from_fmts}
+            for to_ext, to_fmts in exporters.items():
+                for fmt in to_fmts:
+                    if fmt.category in categories:
+                        export_filters[from_ext, to_ext] = fmt.filter_name
+                        break
+        self.export_filters: Mapping[tuple[str, str], str] = MappingProxyType(
+            export_filters
+        )
+
+
+def _freeze(index: dict) -> Mapping:
+    return MappingProxyType({key: tuple(values) for key, values in index.items()})
+
+
+_INDEX = _FormatIndex(tuple(ALL_FORMATS))
+_PLANNER = RoutePlanner(_INDEX.formats)
+
+
+@lru_cache(maxsize=1024)
+def _plan_route(from_ext: str, to_ext: str, max_hops: int) -> ConversionRoute | None:
+    return _PLANNER.plan(from_ext, to_ext, max_hops)
 
 
 class FormatRegistry:
@@ -12,22 +88,25 @@ class FormatRegistry:
 
     모든 메서드는 ``@staticmethod``이다. 인스턴스를 만들 필요 없이
     ``FormatRegistry.all_formats()`` 형태로 사용한다.
+
+    조회는 import 시점에 만든 인덱스에서 상수 시간에 이루어진다. 컬렉션을
+    반환하는 메서드는 인덱스를 보호하기 위해 새 ``set``/``list``를 돌려준다.
     """
 
     @staticmethod
     def all_formats() -> list[FormatInfo]:
         """등록된 모든 ``FormatInfo`` 객체를 반환한다."""
-        return list(ALL_FORMATS)
+        return list(_INDEX.formats)
 
     @staticmethod
     def supported_input_formats() -> set[str]:
         """``can_import=True``인 모든 확장자의 집합을 반환한다."""
-        return {fmt.extension for fmt in ALL_FORMATS if fmt.can_import}
+        return set(_INDEX.input_extensions)
 
     @staticmethod
     def supported_output_formats() -> set[str]:
         """``can_export=True``인 모든 확장자의 집합을 반환한다."""
-        return {fmt.extension for fmt in ALL_FORMATS if fmt.can_export}
+        return set(_INDEX.output_extensions)
 
     @staticmethod
     def can_convert(from_ext: str, to_ext: str) -> bool:
@@ -35,15 +114,48 @@ class FormatRegistry:
 
         확장자에 점(``"."``)이 포함되어 있으면 자동 제거한다.
         """
-        from_ext = from_ext.lstrip(".").lower()
-        to_ext = to_ext.lstrip(".").lower()
-        input_ok = any(
-            fmt.extension == from_ext and fmt.can_import for fmt in ALL_FORMATS
+        return (
+            _normalize(from_ext) in _INDEX.input_extensions
+            and _normalize(to_ext) in _INDEX.output_extensions
         )
-        output_ok = any(
-            fmt.extension == to_ext and fmt.can_export for fmt in ALL_FORMATS
-        )
-        return input_ok and output_ok
+
+    @staticmethod
+    def can_route(from_ext: str, to_ext: str, max_hops: int = 3) -> bool:
+        """``from_ext`` → ``to_ext``로 가는 변환 경로가 있는지 여부를 반환한다.
+
+        :meth:`can_convert`와 달리 입력을 불러오는 모듈이 ``to_ext``로
+        내보낼 수 있거나, ``max_hops`` 안에서 중간 포맷을 거쳐 갈 수 있어야
+        ``True``다. 예를 들어 ``csv`` → ``docx``는 ``html``을 거쳐 가능하지만
+        ``csv`` → ``pptx``는 불가능하다.
+        """
+        return FormatRegistry.plan_route(from_ext, to_ext, max_hops) is not None
+
+    @staticmethod
+    def sniff_format(path: str | Path) -> str | None:
+        """파일 앞부분의 매직 바이트로 판별한 확장자를 반환한다.
+
+        PDF·이미지·RTF와 ODF/OOXML 패키지만 판별하며, 판별할 수 없으면 ``None``.
+        """
+        return sniff_extension(Path(path))
+
+    @staticmethod
+    def detect_format(path: str | Path) -> str:
+        """파일의 실제 포맷 확장자를 반환한다.
+
+        내용으로 판별할 수 있으면 그 포맷을, 아니면 파일 확장자를 쓴다.
+        확장자가 없으면 빈 문자열.
+        """
+        path = Path(path)
+        return sniff_extension(path) or _normalize(path.suffix)
+
+    @staticmethod
+    def can_convert_file(path: str | Path, to_ext: str) -> bool:
+        """파일을 ``to_ext``로 변환할 수 있는지 여부를 반환한다.
+
+        :meth:`detect_format`으로 정한 포맷으로 :meth:`can_route`를 판단하므로,
+        이름만 ``.docx``인 PDF처럼 확장자가 내용과 다른 파일도 가려낸다.
+        """
+        return FormatRegistry.can_route(FormatRegistry.detect_format(path), to_ext)
 
     @staticmethod
     def formats_by_category(
@@ -59,7 +171,7 @@ class FormatRegistry:
                 category = DocumentCategory(category.lower())
             except ValueError:
                 return []
-        return [fmt for fmt in ALL_FORMATS if fmt.category == category]
+        return list(_INDEX.by_category.get(category, ()))
 
     @staticmethod
     def get_format(extension: str) -> list[FormatInfo]:
@@ -68,37 +180,53 @@ class FormatRegistry:
         동일 확장자가 여러 카테고리에 존재할 수 있으므로 리스트로 반환한다.
         예: ``"html"`` → Writer HTML + Calc HTML.
         """
-        extension = extension.lstrip(".").lower()
-        return [fmt for fmt in ALL_FORMATS if fmt.extension == extension]
+        return list(_INDEX.by_extension.get(_normalize(extension), ()))
+
+    @staticmethod
+    def import_categories(extension: str) -> set[DocumentCategory]:
+        """``extension``을 불러올 수 있는 카테고리(모듈)의 집합. 없으면 빈 집합."""
+        return {fmt.category for fmt in _INDEX.importers.get(_normalize(extension), ())}
+
+    @staticmethod
+    def get_by_mime(mime_type: str) -> list[FormatInfo]:
+        """MIME 타입으로 포맷 정보를 조회한다. 대소문자를 무시한다.
+
+        매개변수(``; charset=...``)는 무시한다. 없으면 빈 리스트.
+        """
+        mime_type = mime_type.split(";", 1)[0].strip().lower()
+        return list(_INDEX.by_mime.get(mime_type, ()))
 
     @staticmethod
     def get_export_filter(from_ext: str, to_ext: str) -> str | None:
         """변환에 사용할 LibreOffice 필터 이름을 반환한다.
 
-        매핑이 없으면 ``None``.
+        입력과 같은 카테고리의 출력 필터를 우선하고, 없으면 카테고리와
+        무관하게 출력 가능한 필터를 반환한다. 매핑이 없으면 ``None``.
         """
-        from_ext = from_ext.lstrip(".").lower()
-        to_ext = to_ext.lstrip(".").lower()
-
-        # 입력 확장자의 카테고리를 먼저 확인
-        input_categories = {
-            fmt.category
-            for fmt in ALL_FORMATS
-            if fmt.extension == from_ext and fmt.can_import
-        }
+        from_ext = _normalize(from_ext)
+        to_ext = _normalize(to_ext)
+        filter_name = _INDEX.export_filters.get((from_ext, to_ext))
+        if filter_name is not None:
+            return filter_name
+        return _INDEX.default_export_filter.get(to_ext)
 
-        # 출력 확장자 중 입력 카테고리와 동일한 것을 찾기
-        for fmt in ALL_FORMATS:
-            if (
-                fmt.extension == to_ext
-                and fmt.can_export
-                and fmt.category in input_categories
-            ):
-                return fmt.filter_name
-
-        # 카테고리 무관하게 출력 가능한 필터 반환
-        for fmt in ALL_FORMATS:
-            if fmt.extension == to_ext and fmt.can_export:
-                return fmt.filter_name
-
-        return None
+    @staticmethod
+    def conversion_matrix() -> ConversionMatrix:
+        """모듈별 입출력 비트셋으로 된 읽기 전용 변환 행렬을 반환한다.
+
+        ``can_convert``와 달리 같은 모듈 안에서 가능한 변환만 직접 변환으로
+        본다 (예: ``csv`` → ``docx``는 ``False``).
+        """
+        return _PLANNER.matrix
+
+    @staticmethod
+    def plan_route(
+        from_ext: str, to_ext: str, max_hops: int = 3
+    ) -> ConversionRoute | None:
+        """``from_ext`` → ``to_ext``의 최소 비용 변환 경로를 반환한다.
+
+        직접 변환이 가능하면 단계가 하나인 경로를, 중간 포맷을 거쳐야 하면
+        (예: ``csv`` → ``html`` → ``docx``) 여러 단계의 경로를 반환한다.
+        ``max_hops`` 안에 경로가 없으면 ``None``.
+        """
+        return _plan_route(_normalize(from_ext), _normalize(to_ext), max_hops)
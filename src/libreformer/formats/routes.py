@@ -0,0 +1,268 @@
+"""사전 계산된 변환 행렬과 다단계 변환 경로 계획.
+
+LibreOffice는 문서를 한 모듈(Writer, Calc 등)로 불러온 뒤 그 모듈이 지원하는
+필터로만 내보낼 수 있다. 예를 들어 ``csv``(Calc)는 ``docx``(Writer)로 바로
+변환할 수 없지만, Calc가 ``html``로 내보내고 Writer가 그 ``html``을 불러오면
+``docx``로 변환할 수 있다. 이 모듈은 그런 모듈 간 관계를 비트셋 행렬로
+미리 계산하고, 직접 변환이 불가능할 때 비용이 가장 낮은 경로를 찾는다.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from ..schemas.format_info import FormatInfo
+from .categories import DocumentCategory
+
+# 모듈별로 문서를 한 번 불러와 내보내는 데 드는 상대 비용
+DEFAULT_HOP_COSTS: Mapping[DocumentCategory, float] = MappingProxyType(
+    {
+        DocumentCategory.WRITER: 1.0,
+        DocumentCategory.CALC: 1.0,
+        DocumentCategory.IMPRESS: 1.5,
+        DocumentCategory.DRAW: 1.2,
+        DocumentCategory.MATH: 0.5,
+    }
+)
+
+# 중간 포맷으로 거칠 때 손실되는 정보에 대한 추가 비용.
+# ODF 네이티브 포맷은 손실이 없으므로 0, 목록에 없는 포맷은 기본값을 쓴다.
+_LOSSLESS_INTERMEDIATES = frozenset(
+    {"odt", "fodt", "ods", "fods", "odp", "fodp", "odg", "fodg", "odf"}
+)
+_INTERMEDIATE_PENALTIES: Mapping[str, float] = MappingProxyType(
+    {"html": 0.5, "rtf": 0.3, "csv": 1.0, "tsv": 1.0, "txt": 1.0}
+)
+_DEFAULT_INTERMEDIATE_PENALTY = 0.2
+
+
+@dataclass(frozen=True)
+class ConversionHop:
+    """한 번의 soffice 실행으로 수행하는 변환 단계.
+
+    Attributes:
+        from_ext: 입력 확장자.
+        to_ext: 출력 확장자.
+        category: 입력을 불러올 모듈.
+        import_filter: 확장자만으로는 ``category``가 선택되지 않을 때
+            ``--infilter``로 지정할 필터 이름. 필요 없으면 ``None``.
+        export_filter: 출력에 사용할 필터 이름. 그래픽 포맷처럼 모듈마다 필터가
+            다르면 ``None``이며, 이때는 soffice가 필터를 고른다.
+    """
+
+    from_ext: str
+    to_ext: str
+    category: DocumentCategory
+    import_filter: str | None
+    export_filter: str | None
+
+
+@dataclass(frozen=True)
+class ConversionRoute:
+    """입력 포맷에서 출력 포맷까지의 변환 단계 목록과 그 비용."""
+
+    hops: tuple[ConversionHop, ...]
+    cost: float
+
+    @property
+    def from_ext(self) -> str:
+        return self.hops[0].from_ext
+
+    @property
+    def to_ext(self) -> str:
+        return self.hops[-1].to_ext
+
+    @property
+    def intermediates(self) -> tuple[str, ...]:
+        """거쳐 가는 중간 확장자 목록."""
+        return tuple(hop.to_ext for hop in self.hops[:-1])
+
+    @property
+    def is_direct(self) -> bool:
+        """soffice 한 번으로 끝나는 경로인지 여부."""
+        return len(self.hops) == 1
+
+
+class ConversionMatrix:
+    """모듈별 입출력 가능 여부를 확장자 비트셋으로 보관한 변환 행렬.
+
+    각 확장자에 비트 하나를 배정하고, 모듈마다 불러올 수 있는 확장자와
+    내보낼 수 있는 확장자를 정수 비트셋으로 저장한다. 그래픽 포맷
+    (:attr:`DocumentCategory.GRAPHIC`)은 어느 모듈에서든 내보낼 수 있다.
+    """
+
+    def __init__(self, formats: Iterable[FormatInfo]):
+        formats = tuple(formats)
+        self.extensions: tuple[str, ...] = tuple(
+            dict.fromkeys(fmt.extension for fmt in formats)
+        )
+        self._bits: Mapping[str, int] = MappingProxyType(
+            {ext: 1 << i for i, ext in enumerate(self.extensions)}
+        )
+
+        imports: dict[DocumentCategory, int] = {}
+        exports: dict[DocumentCategory, int] = {}
+        universal = 0
+        for fmt in formats:
+            bit = self._bits[fmt.extension]
+            if fmt.category == DocumentCategory.GRAPHIC:
+                if fmt.can_export:
+                    universal |= bit
+                continue
+            if fmt.can_import:
+                imports[fmt.category] = imports.get(fmt.category, 0) | bit
+            if fmt.can_export:
+                exports[fmt.category] = exports.get(fmt.category, 0) | bit
+        for category in imports.keys() | exports.keys():
+            exports[category] = exports.get(category, 0) | universal
+
+        self.imports: Mapping[DocumentCategory, int] = MappingProxyType(imports)
+        self.exports: Mapping[DocumentCategory, int] = MappingProxyType(exports)
+
+        # 입력 확장자별로 한 번에 도달 가능한 출력 비트셋
+        targets: dict[str, int] = {}
+        for category, mask in imports.items():
+            for ext in self._decode(mask):
+                targets[ext] = targets.get(ext, 0) | exports.get(category, 0)
+        self._targets: Mapping[str, int] = MappingProxyType(targets)
+
+    def bit(self, extension: str) -> int:
+        """확장자에 배정된 비트. 알 수 없는 확장자는 0."""
+        return self._bits.get(extension.lstrip(".").lower(), 0)
+
+    def can_convert(self, from_ext: str, to_ext: str) -> bool:
+        """soffice 한 번으로 ``from_ext`` → ``to_ext`` 변환이 가능한지 여부."""
+        from_ext = from_ext.lstrip(".").lower()
+        return bool(self._targets.get(from_ext, 0) & self.bit(to_ext))
+
+    def targets(self, from_ext: str) -> frozenset[str]:
+        """``from_ext``에서 한 번에 변환할 수 있는 출력 확장자 집합."""
+        mask = self._targets.get(from_ext.lstrip(".").lower(), 0)
+        return frozenset(self._decode(mask))
+
+    def categories_for(self, from_ext: str, to_ext: str) -> list[DocumentCategory]:
+        """``from_ext``를 불러와 ``to_ext``로 내보낼 수 있는 모듈 목록."""
+        src, dst = self.bit(from_ext), self.bit(to_ext)
+        if not src or not dst:
+            return []
+        return [
+            category
+            for category, mask in self.imports.items()
+            if mask & src and self.exports.get(category, 0) & dst
+        ]
+
+    def _decode(self, mask: int) -> Iterable[str]:
+        for i, ext in enumerate(self.extensions):
+            if mask >> i & 1:
+                yield ext
+
+
+class RoutePlanner:
+    """:class:`ConversionMatrix`와 비용 모델로 최소 비용 변환 경로를 찾는다.
+
+    경로 탐색 상태는 ``(확장자, 불러올 모듈)``이며, 각 단계의 비용은 모듈의
+    불러오기 비용에 중간 포맷의 손실 비용을 더한 값이다 (Dijkstra).
+
+    Args:
+        formats: 포맷 메타데이터.
+        hop_costs: 모듈별 단계 비용. 지정하지 않은 모듈은 1.0.
+    """
+
+    def __init__(
+        self,
+        formats: Iterable[FormatInfo],
+        hop_costs: Mapping[DocumentCategory, float] | None = None,
+    ):
+        formats = tuple(formats)
+        self.matrix = ConversionMatrix(formats)
+        self.hop_costs = dict(DEFAULT_HOP_COSTS if hop_costs is None else hop_costs)
+
+        self._importers: dict[str, list[tuple[DocumentCategory, str]]] = {}
+        self._exporters: dict[DocumentCategory, dict[str, str | None]] = {}
+        # 그래픽 포맷의 filter_name은 확장자일 뿐이므로 필터를 지정하지 않는다
+        universal: dict[str, str | None] = {}
+        for fmt in formats:
+            if fmt.category == DocumentCategory.GRAPHIC:
+                if fmt.can_export:
+                    universal.setdefault(fmt.extension, None)
+                continue
+            if fmt.can_import:
+                self._importers.setdefault(fmt.extension, []).append(
+                    (fmt.category, fmt.filter_name)
+                )
+            if fmt.can_export:
+                self._exporters.setdefault(fmt.category, {}).setdefault(
+                    fmt.extension, fmt.filter_name
+                )
+        for exporters in self._exporters.values():
+            for ext, filter_name in universal.items():
+                exporters.setdefault(ext, filter_name)
+
+    def plan(
+        self, from_ext: str, to_ext: str, max_hops: int = 3
+    ) -> ConversionRoute | None:
+        """비용이 가장 낮은 변환 경로를 반환한다. 경로가 없으면 ``None``."""
+        from_ext = from_ext.lstrip(".").lower()
+        to_ext = to_ext.lstrip(".").lower()
+        if max_hops < 1 or not self.matrix.bit(to_ext):
+            return None
+
+        counter = itertools.count()
+        heap: list[tuple[float, int, str, DocumentCategory, tuple]] = []
+        for category, _ in self._importers.get(from_ext, ()):
+            heapq.heappush(heap, (0.0, next(counter), from_ext, category, ()))
+
+        settled: set[tuple[str, DocumentCategory]] = set()
+        while heap:
+            cost, _, ext, category, hops = heapq.heappop(heap)
+            if hops and hops[-1].to_ext == to_ext:
+                return ConversionRoute(hops, cost)
+            if (ext, category) in settled or len(hops) >= max_hops:
+                continue
+            settled.add((ext, category))
+
+            visited = {from_ext, *(hop.to_ext for hop in hops)}
+            step = self.hop_costs.get(category, 1.0)
+            import_filter = self._import_filter(ext, category)
+            for out_ext, export_filter in self._exporters.get(category, {}).items():
+                hop = ConversionHop(
+                    ext, out_ext, category, import_filter, export_filter
+                )
+                if out_ext == to_ext:
+                    heapq.heappush(
+                        heap,
+                        (cost + step, next(counter), out_ext, category, (*hops, hop)),
+                    )
+                    continue
+                if out_ext in visited or len(hops) + 1 >= max_hops:
+                    continue
+                penalty = self._penalty(out_ext)
+                for next_category, _ in self._importers.get(out_ext, ()):
+                    heapq.heappush(
+                        heap,
+                        (
+                            cost + step + penalty,
+                            next(counter),
+                            out_ext,
+                            next_category,
+                            (*hops, hop),
+                        ),
+                    )
+        return None
+
+    def _import_filter(self, ext: str, category: DocumentCategory) -> str | None:
+        """``ext``가 기본적으로 ``category``로 열리지 않으면 그 모듈의 필터."""
+        importers = self._importers.get(ext, ())
+        if not importers or importers[0][0] == category:
+            return None
+        return next(name for cat, name in importers if cat == category)
+
+    @staticmethod
+    def _penalty(ext: str) -> float:
+        if ext in _LOSSLESS_INTERMEDIATES:
+            return 0.0
+        return _INTERMEDIATE_PENALTIES.get(ext, _DEFAULT_INTERMEDIATE_PENALTY)
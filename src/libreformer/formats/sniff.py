@@ -0,0 +1,79 @@
+"""파일 앞부분의 매직 바이트로 실제 포맷을 판별한다.
+
+확장자가 내용과 다른 파일(예: 이름만 ``.docx``인 PDF)을 soffice를 띄우기 전에
+가려내는 데 쓴다. 서명이 분명한 포맷만 판별하고, 텍스트 포맷이나 어느 포맷인지
+알 수 없는 컨테이너(OLE2 복합 문서 등)는 ``None``을 돌려 확장자를 믿게 한다.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+# 판별에 읽을 앞부분 크기. ODF의 mimetype 항목까지 충분히 담긴다.
+_HEAD_SIZE = 512
+
+# (서명, 확장자). 앞에서부터 먼저 맞는 것을 쓴다.
+_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"%PDF-", "pdf"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"{\\rtf", "rtf"),
+)
+_ZIP_SIGNATURE = b"PK\x03\x04"
+
+# OOXML 패키지 안의 주 문서 경로 → 확장자
+_OOXML_PARTS: tuple[tuple[str, str], ...] = (
+    ("word/document.xml", "docx"),
+    ("xl/workbook.xml", "xlsx"),
+    ("ppt/presentation.xml", "pptx"),
+)
+
+
+def sniff_extension(path: Path) -> str | None:
+    """``path``의 내용으로 판별한 확장자. 판별할 수 없으면 ``None``.
+
+    읽을 수 없는 파일도 ``None``을 돌려준다.
+    """
+    try:
+        with open(path, "rb") as fh:
+            head = fh.read(_HEAD_SIZE)
+    except OSError:
+        return None
+    for signature, extension in _SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    if head.startswith(_ZIP_SIGNATURE):
+        return _odf_extension(head) or _ooxml_extension(path)
+    return None
+
+
+def _odf_extension(head: bytes) -> str | None:
+    """ODF 패키지의 첫 항목인 비압축 ``mimetype``으로 확장자를 찾는다."""
+    from .registry import FormatRegistry
+
+    if len(head) < 30 or head[8:10] != b"\x00\x00":
+        return None
+    size = int.from_bytes(head[18:22], "little")
+    name_len = int.from_bytes(head[26:28], "little")
+    extra_len = int.from_bytes(head[28:30], "little")
+    if head[30 : 30 + name_len] != b"mimetype":
+        return None
+    start = 30 + name_len + extra_len
+    mime = head[start : start + size].decode("ascii", "replace")
+    formats = FormatRegistry.get_by_mime(mime)
+    return formats[0].extension if formats else None
+
+
+def _ooxml_extension(path: Path) -> str | None:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            names = set(archive.namelist())
+    except (OSError, zipfile.BadZipFile):
+        return None
+    for part, extension in _OOXML_PARTS:
+        if part in names:
+            return extension
+    return None
@@ -0,0 +1,163 @@
+"""병렬 변환 API가 사용하는 작업 스트림 도우미.
+
+입력 경로와 대상 포맷을 ``(file_path, to)`` 작업으로 짝짓고, 배치 모드에서는
+한 번의 soffice 실행 단위로 묶는다. 모든 도우미는 입력을 끝까지 읽지 않고
+스트리밍으로 동작하므로 수백만 개의 경로도 메모리에 올리지 않는다.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, Sized
+
+Job = tuple[str, str]
+Batch = tuple[str, list[str]]
+
+# 동시에 채우는 중인 배치의 최대 개수. 초과하면 가장 오래된 배치를 내보낸다.
+_MAX_OPEN_BATCHES = 256
+
+
+def _length_mismatch(to_len: int | str, paths_len: int | str) -> ValueError:
+    return ValueError(
+        f"Length of 'to' ({to_len}) must match number of file_paths ({paths_len})"
+    )
+
+
+def iter_jobs(file_paths: Iterable[str], to: str | Iterable[str]) -> Iterator[Job]:
+    """경로와 대상 포맷을 ``(file_path, to)`` 작업으로 짝지어 하나씩 내보낸다.
+
+    Raises:
+        ValueError: ``to``가 포맷 목록이고 ``file_paths``와 길이가 다를 때.
+            둘 다 길이를 알 수 있으면 첫 작업 전에, 아니면 불일치를 발견한
+            시점에 발생한다.
+    """
+    if isinstance(to, str):
+        for file_path in file_paths:
+            yield file_path, to
+        return
+
+    if isinstance(file_paths, Sized) and isinstance(to, Sized):
+        if len(to) != len(file_paths):
+            raise _length_mismatch(len(to), len(file_paths))
+
+    targets = iter(to)
+    count = 0
+    for file_path in file_paths:
+        try:
+            target = next(targets)
+        except StopIteration:
+            raise _length_mismatch(count, f">{count}") from None
+        count += 1
+        yield file_path, target
+    if next(targets, None) is not None:
+        raise _length_mismatch(f">{count}", count)
+
+
+async def aiter_jobs(
+    file_paths: Iterable[str] | AsyncIterable[str], to: str | Iterable[str]
+) -> AsyncIterator[Job]:
+    """:func:`iter_jobs`의 비동기 버전. ``file_paths``는 비동기 이터러블일 수 있다."""
+    if not isinstance(file_paths, AsyncIterable):
+        for job in iter_jobs(file_paths, to):
+            yield job
+        return
+
+    if isinstance(to, str):
+        async for file_path in file_paths:
+            yield file_path, to
+        return
+
+    targets = iter(to)
+    count = 0
+    async for file_path in file_paths:
+        try:
+            target = next(targets)
+        except StopIteration:
+            raise _length_mismatch(count, f">{count}") from None
+        count += 1
+        yield file_path, target
+    if next(targets, None) is not None:
+        raise _length_mismatch(f">{count}", count)
+
+
+class BatchGrouper:
+    """``(file_path, to)`` 작업을 점진적으로 배치로 묶는다.
+
+    대상 포맷과 상위 디렉터리가 같은 파일끼리 최대 ``batch_size``개씩 묶는다.
+    같은 디렉터리에 출력되므로 한 묶음 안에서는 파일 stem이 겹치지 않게 한다
+    (``a.docx``와 ``a.txt``는 모두 ``a.pdf``를 만들기 때문).
+    """
+
+    def __init__(self, batch_size: int, max_open: int = _MAX_OPEN_BATCHES):
+        self.batch_size = batch_size
+        self.max_open = max_open
+        # 배치 id → (to, 경로 목록, stem 집합). 생성 순서 유지
+        self._open: OrderedDict[int, tuple[str, list[str], set[str]]] = OrderedDict()
+        # (to, parent) → 해당 키로 채우는 중인 배치 id 목록
+        self._by_key: dict[tuple[str, str], list[int]] = {}
+        self._keys: dict[int, tuple[str, str]] = {}
+        self._next_id = 0
+
+    def add(self, file_path: str, to: str) -> list[Batch]:
+        """작업을 추가하고, 이로 인해 완성된 배치를 반환한다."""
+        if self.batch_size <= 1:
+            return [(to, [file_path])]
+        path = Path(file_path)
+        key = (to, str(path.parent))
+        stem = path.stem
+        for batch_id in self._by_key.get(key, ()):
+            _, paths, stems = self._open[batch_id]
+            if stem in stems:
+                continue
+            paths.append(file_path)
+            stems.add(stem)
+            if len(paths) >= self.batch_size:
+                return [self._close(batch_id)]
+            return []
+
+        batch_id = self._next_id
+        self._next_id += 1
+        self._open[batch_id] = (to, [file_path], {stem})
+        self._by_key.setdefault(key, []).append(batch_id)
+        self._keys[batch_id] = key
+        ready: list[Batch] = []
+        while len(self._open) > self.max_open:
+            ready.append(self._close(next(iter(self._open))))
+        return ready
+
+    def flush(self) -> list[Batch]:
+        """채우는 중인 배치를 모두 생성 순서대로 반환한다."""
+        return [self._close(batch_id) for batch_id in list(self._open)]
+
+    def _close(self, batch_id: int) -> Batch:
+        to, paths, _ = self._open.pop(batch_id)
+        key = self._keys.pop(batch_id)
+        ids = self._by_key[key]
+        ids.remove(batch_id)
+        if not ids:
+            del self._by_key[key]
+        return to, paths
+
+
+def iter_batches(jobs: Iterable[Job], batch_size: int) -> Iterator[Batch]:
+    """작업을 한 번의 soffice 실행 단위인 ``(to, [file_path, ...])``로 묶는다.
+
+    배치는 가득 차는 즉시 내보내고, 남은 배치는 입력이 끝날 때 내보낸다.
+    """
+    grouper = BatchGrouper(batch_size)
+    for file_path, to in jobs:
+        yield from grouper.add(file_path, to)
+    yield from grouper.flush()
+
+
+async def aiter_batches(
+    jobs: AsyncIterable[Job], batch_size: int
+) -> AsyncIterator[Batch]:
+    """:func:`iter_batches`의 비동기 버전."""
+    grouper = BatchGrouper(batch_size)
+    async for file_path, to in jobs:
+        for batch in grouper.add(file_path, to):
+            yield batch
+    for batch in grouper.flush():
+        yield batch
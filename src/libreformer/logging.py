@@ -10,19 +10,21 @@ R = TypeVar("R")
 
 
 def log_elapsed_time(operation_name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
-    """함수의 시작/완료와 소요 시간(ms)을 로깅합니다."""
+    """함수의 소요 시간(ms)을 DEBUG 레벨로 로깅합니다.
+
+    단계별 계측은 :class:`~libreformer.metrics.ConversionMetrics`를 사용한다.
+    """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            logger.info("{} 시작", operation_name)
             start_time = time.perf_counter()
 
             result = func(*args, **kwargs)
 
             end_time = time.perf_counter()
             elapsed_time_ms = (end_time - start_time) * 1000.0
-            logger.info("{} 완료: 소요시간={:.1f}ms", operation_name, elapsed_time_ms)
+            logger.debug("{} 완료: 소요시간={:.1f}ms", operation_name, elapsed_time_ms)
 
             return result
 
@@ -34,21 +36,20 @@ def log_elapsed_time(operation_name: str) -> Callable[[Callable[P, R]], Callable
 def async_log_elapsed_time(
     operation_name: str,
 ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
-    """비동기 함수의 시작/완료와 소요 시간(ms)을 로깅합니다."""
+    """비동기 함수의 소요 시간(ms)을 DEBUG 레벨로 로깅합니다."""
 
     def decorator(
         func: Callable[P, Awaitable[R]],
     ) -> Callable[P, Awaitable[R]]:
         @wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            logger.info("{} 시작", operation_name)
             start_time = time.perf_counter()
 
             result = await func(*args, **kwargs)
 
             end_time = time.perf_counter()
             elapsed_time_ms = (end_time - start_time) * 1000.0
-            logger.info("{} 완료: 소요시간={:.1f}ms", operation_name, elapsed_time_ms)
+            logger.debug("{} 완료: 소요시간={:.1f}ms", operation_name, elapsed_time_ms)
 
             return result
 
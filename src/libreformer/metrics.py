@@ -0,0 +1,255 @@
+"""변환 단계별 소요 시간 계측.
+
+엔진에 :class:`ConversionMetrics`를 넘기면 변환 경로 실행마다 단계별 소요
+시간(대기열, 세마포어, 프로필 준비, 프로세스 기동, soffice 실행, 출력 확인,
+정리)을 측정해 히스토그램에 누적하고, 각 결과 객체의 ``timings``에 붙인다.
+Prometheus 텍스트 형식으로 내보내거나, 콜백으로 OpenTelemetry 등의 외부
+계측기에 전달할 수 있다.
+
+지정하지 않으면 엔진은 아무 일도 하지 않는 :data:`NULL_TIMER`를 사용하므로
+계측 비용이 거의 없다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextlib
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, ContextManager, Iterator, Mapping, Sequence
+
+# 기본 히스토그램 경계(초). 프로세스 기동(ms)부터 대용량 변환(분)까지 포괄한다.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+# (단계 이름, 소요 시간(초), 속성) — OpenTelemetry Histogram.record와 같은 모양
+MetricsCallback = Callable[[str, float, Mapping[str, str]], None]
+
+
+class Stage(str, Enum):
+    """계측하는 변환 단계."""
+
+    QUEUE_WAIT = "queue_wait"
+    """병렬 API에 제출된 작업이 실행되기 시작할 때까지."""
+    SEMAPHORE_WAIT = "semaphore_wait"
+    """동시 실행 슬롯(엔진 한도와 머신 전역 슬롯)을 얻을 때까지. 동기·비동기 공통."""
+    PROFILE_SETUP = "profile_setup"
+    """프로필(또는 워커) 임대와 중간 결과 디렉터리 준비."""
+    PROCESS_SPAWN = "process_spawn"
+    """soffice 프로세스 생성."""
+    SOFFICE_RUN = "soffice_run"
+    """soffice가 변환을 마치고 종료할 때까지."""
+    OUTPUT_DISCOVERY = "output_discovery"
+    """출력 파일 확인과 결과 해석."""
+    CLEANUP = "cleanup"
+    """프로필 반납과 중간 결과 정리."""
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """히스토그램의 특정 시점 값.
+
+    Attributes:
+        buckets: ``(상한, 누적 개수)`` 목록. 마지막 상한은 ``inf``.
+        count: 관측 수.
+        sum: 관측값 합계(초).
+    """
+
+    buckets: tuple[tuple[float, int], ...]
+    count: int
+    sum: float
+
+
+class Histogram:
+    """고정 경계 히스토그램. 여러 스레드에서 동시에 기록해도 안전하다."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self._bounds = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = []
+        running = 0
+        for bound, count in zip((*self._bounds, float("inf")), counts):
+            running += count
+            cumulative.append((bound, running))
+        return HistogramSnapshot(tuple(cumulative), running, total)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self._bounds) + 1)
+            self._sum = 0.0
+
+
+class ConversionMetrics:
+    """단계별 소요 시간 히스토그램 모음.
+
+    Args:
+        buckets: 히스토그램 경계(초).
+        callbacks: 관측마다 ``(단계 이름, 초, 속성)``으로 호출할 함수.
+
+    Example:
+        OpenTelemetry 히스토그램으로 전달하기::
+
+            hist = meter.create_histogram("libreformer.stage.duration", unit="s")
+            metrics = ConversionMetrics(
+                callbacks=[
+                    lambda stage, s, attrs: hist.record(s, {"stage": stage, **attrs})
+                ]
+            )
+            engine = LibreOfficeEngine(metrics=metrics)
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        callbacks: Sequence[MetricsCallback] = (),
+    ):
+        self._histograms = {stage: Histogram(buckets) for stage in Stage}
+        self._callbacks = list(callbacks)
+
+    def add_callback(self, callback: MetricsCallback) -> None:
+        self._callbacks.append(callback)
+
+    def observe(
+        self,
+        stage: Stage,
+        seconds: float,
+        attributes: Mapping[str, str] | None = None,
+    ) -> None:
+        self._histograms[stage].observe(seconds)
+        for callback in self._callbacks:
+            callback(stage.value, seconds, attributes or {})
+
+    def histogram(self, stage: Stage) -> Histogram:
+        return self._histograms[stage]
+
+    def snapshot(self) -> dict[str, HistogramSnapshot]:
+        """``{단계 이름: 스냅숏}``."""
+        return {
+            stage.value: hist.snapshot() for stage, hist in self._histograms.items()
+        }
+
+    def reset(self) -> None:
+        for hist in self._histograms.values():
+            hist.reset()
+
+    def timer(self, attributes: Mapping[str, str] | None = None) -> StageTimer:
+        """변환 한 단위의 단계별 시간을 모을 타이머를 만든다."""
+        return StageTimer(self, attributes)
+
+    def to_prometheus(self, namespace: str = "libreformer") -> str:
+        """Prometheus 텍스트 노출 형식으로 직렬화한다."""
+        name = f"{namespace}_stage_duration_seconds"
+        lines = [
+            f"# HELP {name} Time spent in each conversion stage.",
+            f"# TYPE {name} histogram",
+        ]
+        for stage, snap in self.snapshot().items():
+            for bound, count in snap.buckets:
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{stage="{stage}",le="{le}"}} {count}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {snap.sum!r}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {snap.count}')
+        return "\n".join(lines) + "\n"
+
+
+class StageTimer:
+    """변환 한 단위(경로 실행)의 단계별 소요 시간을 모은다.
+
+    측정값은 즉시 히스토그램에 기록되고, :meth:`attach`로 결과 객체에도 붙는다.
+    """
+
+    __slots__ = ("_metrics", "_attributes", "durations")
+
+    def __init__(
+        self,
+        metrics: ConversionMetrics,
+        attributes: Mapping[str, str] | None = None,
+    ):
+        self._metrics = metrics
+        self._attributes = attributes
+        self.durations: dict[Stage, float] = {}
+
+    def start(self) -> float:
+        return time.perf_counter()
+
+    def stop(self, stage: Stage, started: float) -> None:
+        self.add(stage, time.perf_counter() - started)
+
+    def add(self, stage: Stage, seconds: float) -> None:
+        self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+        self._metrics.observe(stage, seconds, self._attributes)
+
+    @contextlib.contextmanager
+    def measure(self, stage: Stage) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stop(stage, started)
+
+    def attach(self, results: Sequence[object]) -> None:
+        """각 결과의 ``timings``에 지금까지의 단계별 시간을 더한다."""
+        for result in results:
+            timings = getattr(result, "timings", None)
+            if timings is None:
+                result.timings = dict(self.durations)  # type: ignore[attr-defined]
+            else:
+                for stage, seconds in self.durations.items():
+                    timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+class _NullStageTimer:
+    """계측이 꺼져 있을 때 쓰는 아무 일도 하지 않는 타이머."""
+
+    __slots__ = ()
+
+    _NULL_CONTEXT = contextlib.nullcontext()
+
+    def start(self) -> float:
+        return 0.0
+
+    def stop(self, stage: Stage, started: float) -> None:
+        pass
+
+    def add(self, stage: Stage, seconds: float) -> None:
+        pass
+
+    def measure(self, stage: Stage) -> ContextManager[None]:
+        return self._NULL_CONTEXT
+
+    def attach(self, results: Sequence[object]) -> None:
+        pass
+
+
+NULL_TIMER: StageTimer = _NullStageTimer()  # type: ignore[assignment]
@@ -0,0 +1,467 @@
+"""상주(warm) headless soffice 워커 풀.
+
+각 워커는 자신만의 ``-env:UserInstallation`` 프로필을 독점하는 장시간 실행
+soffice 프로세스이다. 같은 프로필을 지정한 ``soffice --convert-to`` 호출은
+LibreOffice 단일 인스턴스 IPC 파이프를 통해 이미 초기화된 워커로 전달되므로,
+매 변환마다 오피스 전체를 콜드 스타트하는 비용을 피할 수 있다.
+
+오래 실행된 soffice는 메모리가 점점 늘어나므로, 작업 수·RSS·수명 한도에 도달한
+워커는 백그라운드에서 새 프로필로 교체 워커를 미리 띄운 뒤 교체한다. 교체 워커가
+준비될 때까지는 기존 워커가 계속 작업을 받으므로 교체 중에도 처리량이 줄지 않는다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from loguru import logger
+
+from .process import kill_process_group, process_tree_rss, signal_process_group
+from .profiles import ProfileCache
+
+
+class WorkerStartError(RuntimeError):
+    """워커가 제한 시간 내에 준비되지 못했을 때 발생한다."""
+
+
+class SofficeWorker:
+    """프로필 하나를 점유하는 상주 soffice 프로세스.
+
+    Attributes:
+        worker_id: 풀 내부에서의 워커 번호.
+        profile_dir: 워커 전용 ``UserInstallation`` 디렉터리.
+        jobs_done: 현재 프로세스가 처리한 작업 수 (재시작 시 0으로 초기화).
+        retired: 교체 워커에 자리를 넘겨 더 이상 작업을 받지 않는지 여부.
+    """
+
+    def __init__(self, soffice_path: str, worker_id: int, profile_dir: Path):
+        self.soffice_path = soffice_path
+        self.worker_id = worker_id
+        self.profile_dir = profile_dir
+        self.jobs_done = 0
+        self.retired = False
+        self._process: subprocess.Popen[bytes] | None = None
+        self._started_at: float | None = None
+
+    @property
+    def pipe_name(self) -> str:
+        """워커가 ``--accept``로 대기하는 UNO 파이프 이름."""
+        return f"libreformer_{self.profile_dir.name}"
+
+    @property
+    def pid(self) -> int | None:
+        """워커 프로세스 ID. 실행 중이 아니면 ``None``."""
+        return self._process.pid if self._process is not None else None
+
+    @property
+    def alive(self) -> bool:
+        """워커 프로세스가 실행 중인지 여부."""
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def age(self) -> float:
+        """현재 프로세스가 기동된 뒤 지난 시간(초). 실행 중이 아니면 0."""
+        if self._started_at is None:
+            return 0.0
+        return time.monotonic() - self._started_at
+
+    def rss(self) -> int | None:
+        """워커 프로세스 트리의 현재 RSS(바이트). 측정할 수 없으면 ``None``."""
+        pid = self.pid
+        return process_tree_rss(pid) if pid is not None else None
+
+    def start(self, startup_timeout: float) -> None:
+        """워커를 띄우고 IPC 파이프가 준비될 때까지 대기한다.
+
+        LibreOffice는 단일 인스턴스 파이프를 연 직후 프로필에 ``.lock`` 파일을
+        만들기 때문에, 이 파일의 등장을 준비 완료 신호로 사용한다.
+
+        Raises:
+            WorkerStartError: 프로세스가 종료되었거나 제한 시간을 넘겼을 때.
+        """
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        lock_file = self.profile_dir / ".lock"
+        lock_file.unlink(missing_ok=True)
+
+        cmd = [
+            self.soffice_path,
+            f"-env:UserInstallation=file://{self.profile_dir}",
+            "--headless",
+            "--invisible",
+            "--norestore",
+            "--nologo",
+            "--nodefault",
+            f"--accept=pipe,name={self.pipe_name};urp;StarOffice.ComponentContext",
+        ]
+        self._process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self.jobs_done = 0
+        self._started_at = time.monotonic()
+
+        deadline = time.monotonic() + startup_timeout
+        while not lock_file.exists():
+            if not self.alive:
+                raise WorkerStartError(
+                    f"soffice worker {self.worker_id} exited during startup"
+                )
+            if time.monotonic() > deadline:
+                self.stop()
+                raise WorkerStartError(
+                    f"soffice worker {self.worker_id} not ready "
+                    f"after {startup_timeout}s"
+                )
+            time.sleep(0.05)
+        logger.debug("soffice 워커 {} 준비 완료", self.worker_id)
+
+    def stop(self, grace: float = 5.0) -> None:
+        """워커 프로세스를 종료한다. 응답이 없으면 강제 종료한다."""
+        proc = self._process
+        self._process = None
+        self._started_at = None
+        if proc is None or proc.poll() is not None:
+            return
+        signal_process_group(proc, signal.SIGTERM)
+        try:
+            proc.wait(timeout=grace)
+        except subprocess.TimeoutExpired:
+            kill_process_group(proc)
+            proc.wait()
+
+
+class SofficeWorkerPool:
+    """고정 크기의 상주 soffice 워커 풀.
+
+    워커는 첫 사용 시 지연 기동되며, 한 번에 하나의 작업만 배정된다.
+    비정상 종료된 워커는 다음 배정 전에 재시작된다.
+
+    ``max_jobs_per_worker``·``max_worker_rss``·``max_worker_age`` 중 하나에
+    도달한 워커는 반납 시 백그라운드에서 교체 워커를 기동한다. 교체 워커가
+    준비되면 유휴 상태인 기존 워커는 즉시, 작업 중인 기존 워커는 작업을 마치는
+    대로 종료된다. 교체 워커 기동에 실패하면 기존 워커를 계속 쓰고 다음 반납
+    때 다시 시도한다.
+
+    Args:
+        soffice_path: soffice(또는 libreoffice) 실행 파일 경로.
+        size: 워커 수.
+        max_jobs_per_worker: 워커 교체 전 처리할 최대 작업 수.
+        startup_timeout: 워커 기동 대기 시간(초).
+        profile_cache: 지정하면 워커 프로필을 사전 초기화된 템플릿에서 복제한다.
+        max_worker_rss: 워커 프로세스 트리의 RSS 한도(바이트). ``/proc``에서 읽는다.
+        max_worker_age: 워커 수명 한도(초).
+
+    Attributes:
+        recycled: 교체를 마친 워커 수.
+    """
+
+    def __init__(
+        self,
+        soffice_path: str,
+        size: int,
+        max_jobs_per_worker: int = 200,
+        startup_timeout: float = 30.0,
+        profile_cache: ProfileCache | None = None,
+        max_worker_rss: int | None = None,
+        max_worker_age: float | None = None,
+    ):
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        if max_jobs_per_worker < 1:
+            raise ValueError(
+                f"max_jobs_per_worker must be >= 1, got {max_jobs_per_worker}"
+            )
+        if max_worker_rss is not None and max_worker_rss < 1:
+            raise ValueError(f"max_worker_rss must be >= 1, got {max_worker_rss}")
+        if max_worker_age is not None and max_worker_age <= 0:
+            raise ValueError(f"max_worker_age must be > 0, got {max_worker_age}")
+        self.soffice_path = soffice_path
+        self.size = size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.startup_timeout = startup_timeout
+        self.profile_cache = profile_cache
+        self.max_worker_rss = max_worker_rss
+        self.max_worker_age = max_worker_age
+        self.recycled = 0
+
+        self._root = Path(tempfile.mkdtemp(prefix="libreformer_pool_"))
+        self._workers: list[SofficeWorker] = []
+        self._idle: deque[SofficeWorker] = deque()
+        # 기동 중인 교체 워커와 교체가 진행 중인 워커 번호
+        self._warming: list[SofficeWorker] = []
+        self._replacing: set[int] = set()
+        self._serial = itertools.count(1)
+        self._cond = threading.Condition()
+        # async_checkout에서 반납을 기다리는 (이벤트 루프, future)
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._closed = False
+        # 인터프리터 종료 시에도 상주 프로세스가 남지 않도록 보장
+        self._finalizer = weakref.finalize(
+            self, _shutdown_workers, [self._workers, self._warming], self._root
+        )
+
+    def checkout(self) -> SofficeWorker:
+        """유휴 워커를 하나 배정받는다. 모두 사용 중이면 반납될 때까지 대기한다.
+
+        Raises:
+            WorkerStartError: 워커 기동에 실패했을 때.
+            RuntimeError: 풀이 이미 닫혔을 때.
+        """
+        with self._cond:
+            while (worker := self._take()) is None:
+                self._cond.wait()
+        self._prepare(worker)
+        return worker
+
+    def _take(self) -> SofficeWorker | None:
+        """유휴 워커를 꺼내거나 새 워커 자리를 만든다. ``self._cond`` 안에서 호출."""
+        if self._closed:
+            raise RuntimeError("worker pool is closed")
+        if self._idle:
+            return self._idle.popleft()
+        if len(self._workers) < self.size:
+            worker = SofficeWorker(
+                self.soffice_path,
+                len(self._workers),
+                self._root / f"worker_{len(self._workers)}",
+            )
+            self._workers.append(worker)
+            return worker
+        return None
+
+    def _prepare(self, worker: SofficeWorker) -> None:
+        """배정한 워커가 멈춰 있으면 기동한다. 실패하면 반납하고 예외를 던진다."""
+        if worker.alive:
+            return
+        # 새로 띄우는 워커는 사전 초기화된 템플릿 복제본으로 시작
+        if self.profile_cache is not None:
+            self._reseed_profile(worker)
+        try:
+            worker.start(self.startup_timeout)
+        except Exception:
+            self.checkin(worker, healthy=False)
+            raise
+
+    def _notify(self, broadcast: bool = False) -> None:
+        """반납을 기다리는 스레드와 코루틴을 깨운다. ``self._cond`` 안에서 호출."""
+        if broadcast:
+            self._cond.notify_all()
+        else:
+            self._cond.notify()
+        while self._waiters:
+            loop, waiter = self._waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                # 이미 닫힌 이벤트 루프의 대기자
+                continue
+            if not broadcast:
+                break
+
+    def _reseed_profile(self, worker: SofficeWorker) -> None:
+        assert self.profile_cache is not None
+        template = self.profile_cache.template()
+        if template is None:
+            return
+        shutil.rmtree(worker.profile_dir, ignore_errors=True)
+        try:
+            shutil.copytree(template, worker.profile_dir, symlinks=True)
+        except OSError as e:
+            logger.warning("워커 {} 프로필 복제 실패: {}", worker.worker_id, e)
+            shutil.rmtree(worker.profile_dir, ignore_errors=True)
+
+    async def async_checkout(self) -> SofficeWorker:
+        """:meth:`checkout`의 비동기 버전.
+
+        반납을 기다리는 동안 스레드를 점유하지 않고 이벤트 루프에서 대기하며,
+        워커 기동만 스레드에서 실행한다. 기동 중 취소되더라도 뒤늦게 준비된
+        워커는 풀로 반납된다.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                worker = self._take()
+                if worker is None:
+                    waiter = loop.create_future()
+                    self._waiters.append((loop, waiter))
+            if worker is not None:
+                break
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._cond:
+                    try:
+                        self._waiters.remove((loop, waiter))
+                    except ValueError:
+                        # 이미 깨워진 뒤 취소되었으면 다음 대기자에게 넘긴다
+                        self._notify()
+                raise
+
+        if worker.alive:
+            return worker
+        future = asyncio.ensure_future(asyncio.to_thread(self._prepare, worker))
+        try:
+            await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(lambda f: self._return_abandoned(f, worker))
+            raise
+        return worker
+
+    def _return_abandoned(self, future: asyncio.Future, worker: SofficeWorker) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self.checkin(worker)
+
+    def checkin(self, worker: SofficeWorker, healthy: bool = True) -> None:
+        """작업을 마친 워커를 반납한다.
+
+        ``healthy=False``인 워커는 종료되며 다음 배정 시 새 프로세스로
+        재시작된다. 한도에 도달한 워커는 백그라운드 교체를 시작하고, 이미
+        교체된 워커는 종료한다.
+        """
+        worker.jobs_done += 1
+        reason = None
+        if not healthy or not worker.alive:
+            logger.debug(
+                "soffice 워커 {} 재시작 예정 (jobs={}, healthy={})",
+                worker.worker_id,
+                worker.jobs_done,
+                healthy,
+            )
+            worker.stop()
+        else:
+            reason = self._recycle_reason(worker)
+        with self._cond:
+            if self._closed:
+                worker.stop()
+                return
+            if worker.retired:
+                retire = True
+            else:
+                retire = False
+                self._idle.append(worker)
+                self._notify()
+                if reason is not None and worker.worker_id not in self._replacing:
+                    self._replacing.add(worker.worker_id)
+                    threading.Thread(
+                        target=self._replace,
+                        args=(worker.worker_id, reason),
+                        name=f"libreformer-recycle-{worker.worker_id}",
+                        daemon=True,
+                    ).start()
+        if retire:
+            _retire(worker)
+
+    def _recycle_reason(self, worker: SofficeWorker) -> str | None:
+        """워커가 도달한 교체 한도. 한도 안이면 ``None``."""
+        if worker.jobs_done >= self.max_jobs_per_worker:
+            return f"jobs={worker.jobs_done}"
+        if self.max_worker_age is not None and worker.age >= self.max_worker_age:
+            return f"age={worker.age:.0f}s"
+        if self.max_worker_rss is not None:
+            rss = worker.rss()
+            if rss is not None and rss >= self.max_worker_rss:
+                return f"rss={rss}"
+        return None
+
+    def _replace(self, worker_id: int, reason: str) -> None:
+        """교체 워커를 기동해 준비되면 ``worker_id`` 자리의 워커와 바꾼다."""
+        logger.debug("soffice 워커 {} 교체 시작 ({})", worker_id, reason)
+        replacement = SofficeWorker(
+            self.soffice_path,
+            worker_id,
+            self._root / f"worker_{worker_id}_{next(self._serial)}",
+        )
+        with self._cond:
+            if self._closed:
+                self._replacing.discard(worker_id)
+                return
+            self._warming.append(replacement)
+        try:
+            if self.profile_cache is not None:
+                self._reseed_profile(replacement)
+            replacement.start(self.startup_timeout)
+        except Exception as e:
+            _retire(replacement)
+            with self._cond:
+                self._warming.remove(replacement)
+                self._replacing.discard(worker_id)
+                closed = self._closed
+            # 풀을 닫으면서 기동 중인 교체 워커를 종료한 경우는 실패가 아니다
+            if not closed:
+                logger.warning("soffice 워커 {} 교체 실패: {}", worker_id, e)
+            return
+
+        previous: SofficeWorker | None = None
+        with self._cond:
+            self._warming.remove(replacement)
+            self._replacing.discard(worker_id)
+            if self._closed:
+                previous = replacement
+            else:
+                current = self._workers[worker_id]
+                current.retired = True
+                self._workers[worker_id] = replacement
+                self._idle.append(replacement)
+                self._notify()
+                # 작업 중인 워커는 반납될 때 종료된다
+                if current in self._idle:
+                    self._idle.remove(current)
+                    previous = current
+        if previous is not None:
+            _retire(previous)
+        if previous is not replacement:
+            with self._cond:
+                self.recycled += 1
+            logger.debug("soffice 워커 {} 교체 완료", worker_id)
+
+    @contextmanager
+    def lease(self) -> Iterator[SofficeWorker]:
+        """``checkout``/``checkin``을 감싼 컨텍스트 매니저."""
+        worker = self.checkout()
+        healthy = True
+        try:
+            yield worker
+        except BaseException:
+            healthy = False
+            raise
+        finally:
+            self.checkin(worker, healthy=healthy and worker.alive)
+
+    def close(self) -> None:
+        """모든 워커를 종료하고 프로필 디렉터리를 정리한다."""
+        with self._cond:
+            self._closed = True
+            self._notify(broadcast=True)
+        self._finalizer()
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _retire(worker: SofficeWorker) -> None:
+    worker.stop()
+    shutil.rmtree(worker.profile_dir, ignore_errors=True)
+
+
+def _shutdown_workers(groups: list[list[SofficeWorker]], root: Path) -> None:
+    for workers in groups:
+        for worker in list(workers):
+            worker.stop()
+    shutil.rmtree(root, ignore_errors=True)
@@ -0,0 +1,288 @@
+"""soffice 자식 프로세스 실행 도우미.
+
+``soffice`` 래퍼 스크립트는 실제 작업을 ``soffice.bin`` 자식 프로세스에 맡긴다.
+래퍼만 종료하면 ``soffice.bin``이 남아 프로필 잠금과 메모리를 계속 점유하므로,
+변환 프로세스는 새 세션(프로세스 그룹)에서 실행하고 타임아웃이나 취소 시
+그룹 전체를 종료한다.
+
+자식은 ``wait4``로 회수해 CPU 시간과 최대 RSS도 함께 얻는다. 비동기 실행도
+이벤트 루프 대신 스레드에서 같은 방식으로 회수한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import os
+import selectors
+import signal
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Sequence
+
+from .metrics import NULL_TIMER, Stage, StageTimer
+
+# 그룹을 SIGKILL로 종료한 뒤 파이프가 닫히기를 기다리는 최대 시간(초)
+_REAP_TIMEOUT = 5.0
+
+# 파이프를 기다리는 한 번의 select 대기 시간(초). 중단 요청을 이 간격으로 확인한다
+_POLL_INTERVAL = 0.1
+_READ_SIZE = 64 * 1024
+
+# ru_maxrss 단위: macOS는 바이트, 그 외(Linux 등)는 KiB
+_MAXRSS_SCALE = 1 if sys.platform == "darwin" else 1024
+
+
+class ProcessResult(subprocess.CompletedProcess):
+    """종료 상태·출력과 자원 사용량을 담은 실행 결과.
+
+    Attributes:
+        wall_time: 프로세스 생성부터 종료까지 걸린 시간(초).
+        cpu_time: 프로세스(와 프로세스가 회수한 자손)의 user+system CPU 시간(초).
+            측정할 수 없으면 ``None``.
+        max_rss: 최대 RSS(바이트). 측정할 수 없으면 ``None``.
+    """
+
+    def __init__(
+        self,
+        args: Any,
+        returncode: int,
+        stdout: str,
+        stderr: str,
+        wall_time: float,
+        rusage: Any = None,
+    ):
+        super().__init__(args, returncode, stdout, stderr)
+        self.wall_time = wall_time
+        self.cpu_time: float | None = None
+        self.max_rss: int | None = None
+        if rusage is not None:
+            self.cpu_time = rusage.ru_utime + rusage.ru_stime
+            self.max_rss = rusage.ru_maxrss * _MAXRSS_SCALE
+
+
+class _Child:
+    """새 프로세스 그룹에서 실행한 자식 프로세스.
+
+    ``Popen.communicate``/``wait``는 ``waitpid``로 자식을 회수해 자원 사용량을
+    버리므로, 파이프는 직접 읽고 자식은 ``wait4``로 회수한 뒤 ``returncode``를
+    채워 둔다. 블로킹 호출이므로 비동기 실행은 스레드에서 :meth:`communicate`를
+    호출한다.
+    """
+
+    def __init__(self, cmd: Sequence[str]):
+        self.proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+        self.rusage: Any = None
+        self._abandoned = threading.Event()
+
+    def abandon(self) -> None:
+        """진행 중인 :meth:`communicate`를 중단시킨다."""
+        self._abandoned.set()
+
+    def communicate(self, timeout: float | None) -> tuple[str, str]:
+        """출력을 끝까지 읽은 뒤 자식을 회수하고 ``(stdout, stderr)``를 반환한다.
+
+        Raises:
+            subprocess.TimeoutExpired: ``timeout`` 안에 끝나지 않았거나
+                :meth:`abandon`이 호출된 경우. 자식은 회수하지 않는다.
+        """
+        proc = self.proc
+        if not hasattr(os, "wait4"):
+            stdout, stderr = proc.communicate(timeout=timeout)
+            return _decode(stdout), _decode(stderr)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        chunks: dict[Any, list[bytes]] = {proc.stdout: [], proc.stderr: []}
+        with selectors.DefaultSelector() as selector:
+            for stream in chunks:
+                selector.register(stream, selectors.EVENT_READ)
+            while selector.get_map():
+                wait = min(self._remaining(deadline, timeout), _POLL_INTERVAL)
+                for key, _ in selector.select(wait):
+                    data = os.read(key.fd, _READ_SIZE)
+                    if data:
+                        chunks[key.fileobj].append(data)
+                    else:
+                        selector.unregister(key.fileobj)
+
+        # 파이프가 닫혔으면 대개 곧바로 종료하지만, 그 전에 파이프만 닫는 경우도 있다
+        delay = 0.0005
+        while True:
+            pid, status, rusage = os.wait4(proc.pid, os.WNOHANG)
+            if pid:
+                break
+            time.sleep(min(delay, self._remaining(deadline, timeout)))
+            delay = min(delay * 2, 0.05)
+        self.rusage = rusage
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        return (
+            _decode(b"".join(chunks[proc.stdout])),
+            _decode(b"".join(chunks[proc.stderr])),
+        )
+
+    def _remaining(self, deadline: float | None, timeout: float | None) -> float:
+        if self._abandoned.is_set():
+            raise subprocess.TimeoutExpired(self.proc.args, timeout or 0.0)
+        if deadline is None:
+            return _POLL_INTERVAL
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(self.proc.args, timeout or 0.0)
+        return remaining
+
+
+def _decode(data: bytes | None) -> str:
+    return data.decode(errors="replace") if data else ""
+
+
+def process_tree_rss(pid: int) -> int | None:
+    """``pid``와 그 자손 프로세스의 현재 RSS 합계(바이트).
+
+    ``/proc``에서 읽으며, 읽을 수 없는 플랫폼이거나 프로세스가 이미 종료되었으면
+    ``None``을 반환한다.
+    """
+    page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+    total = 0
+    found = False
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f"/proc/{current}/statm") as fh:
+                total += int(fh.read().split()[1]) * page_size
+            found = True
+            with open(f"/proc/{current}/task/{current}/children") as fh:
+                stack.extend(int(child) for child in fh.read().split())
+        except (OSError, ValueError, IndexError):
+            continue
+    return total if found else None
+
+
+def signal_process_group(
+    proc: subprocess.Popen | asyncio.subprocess.Process, sig: int
+) -> None:
+    """``proc``이 이끄는 프로세스 그룹 전체에 시그널을 보낸다.
+
+    프로세스 그룹을 지원하지 않는 플랫폼에서는 ``proc``에만 보낸다.
+    이미 종료된 프로세스는 무시한다.
+    """
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, sig)
+        else:
+            proc.send_signal(sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def kill_process_group(proc: subprocess.Popen | asyncio.subprocess.Process) -> None:
+    """``proc``의 프로세스 그룹 전체를 강제 종료한다."""
+    signal_process_group(proc, getattr(signal, "SIGKILL", signal.SIGTERM))
+
+
+def run_process(
+    cmd: Sequence[str],
+    timeout: float | None = None,
+    timer: StageTimer = NULL_TIMER,
+) -> ProcessResult:
+    """``cmd``를 새 프로세스 그룹에서 실행하고 출력을 수집한다.
+
+    프로세스 생성과 실행 시간은 ``timer``에 각각 기록한다.
+
+    Raises:
+        subprocess.TimeoutExpired: ``timeout`` 안에 끝나지 않은 경우.
+            예외를 던지기 전에 프로세스 그룹을 종료하고 회수한다.
+    """
+    started = time.perf_counter()
+    spawn = timer.start()
+    child = _Child(cmd)
+    with child.proc as proc:
+        timer.stop(Stage.PROCESS_SPAWN, spawn)
+        try:
+            with timer.measure(Stage.SOFFICE_RUN):
+                stdout, stderr = child.communicate(timeout)
+        except BaseException:
+            kill_process_group(proc)
+            proc.wait()
+            raise
+    return ProcessResult(
+        cmd,
+        proc.returncode,
+        stdout,
+        stderr,
+        time.perf_counter() - started,
+        child.rusage,
+    )
+
+
+async def async_run_process(
+    cmd: Sequence[str],
+    timeout: float | None = None,
+    timer: StageTimer = NULL_TIMER,
+    executor: concurrent.futures.Executor | None = None,
+) -> ProcessResult:
+    """:func:`run_process`의 비동기 버전.
+
+    출력 수집과 회수는 ``executor``(``None``이면 기본 executor)의 스레드에서
+    실행하므로 CPU 시간과 최대 RSS도 채워진다. 제한 시간은 프로세스를 만든
+    시점부터 이벤트 루프에서 재므로, 스레드를 늦게 얻어도 타임아웃이 밀리지
+    않는다. 다른 작업과 스레드를 나눠 쓰지 않도록 동시 실행 수만큼의 전용
+    executor를 넘기는 것이 좋다. 타임아웃뿐 아니라 태스크가 취소되어도
+    프로세스 그룹을 종료한다.
+
+    Raises:
+        asyncio.TimeoutError: ``timeout`` 안에 끝나지 않은 경우.
+    """
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    with timer.measure(Stage.PROCESS_SPAWN):
+        child = _Child(cmd)
+    proc = child.proc
+    task = loop.run_in_executor(executor, child.communicate, None)
+    try:
+        with timer.measure(Stage.SOFFICE_RUN):
+            stdout, stderr = await asyncio.wait_for(asyncio.shield(task), timeout)
+    except BaseException:
+        child.abandon()
+        kill_process_group(proc)
+        try:
+            await asyncio.shield(
+                asyncio.wait_for(_reap(task, proc, executor), _REAP_TIMEOUT)
+            )
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+        raise
+    finally:
+        # 스레드가 아직 파이프를 읽는 중이면 닫지 않는다 (fd 재사용 방지)
+        if task.done():
+            for stream in (proc.stdout, proc.stderr):
+                if stream is not None:
+                    stream.close()
+    assert proc.returncode is not None
+    return ProcessResult(
+        list(cmd),
+        proc.returncode,
+        stdout,
+        stderr,
+        time.perf_counter() - started,
+        child.rusage,
+    )
+
+
+async def _reap(
+    task: asyncio.Future,
+    proc: subprocess.Popen,
+    executor: concurrent.futures.Executor | None,
+) -> None:
+    """읽기 스레드가 멈춘 뒤 종료된 자식을 회수한다."""
+    await asyncio.wait({task})
+    if not task.cancelled():
+        task.exception()
+    await asyncio.get_running_loop().run_in_executor(executor, proc.wait)
@@ -0,0 +1,239 @@
+"""사전 초기화된 LibreOffice ``UserInstallation`` 프로필 캐시.
+
+빈 디렉터리를 ``-env:UserInstallation``으로 넘기면 soffice는 매번 사용자
+프로필(registrymodifications, 확장 캐시 등)을 처음부터 만든다. 이 모듈은
+프로필을 한 번만 초기화해 템플릿으로 보관하고, 템플릿을 복제한 프로필을
+작업 간에 빌려주고 돌려받아 재사용한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import shutil
+import subprocess
+import tempfile
+import threading
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import AsyncIterator, Iterator, Mapping, Union
+from xml.sax.saxutils import escape, quoteattr
+
+from loguru import logger
+
+from .process import run_process
+
+# 첫 실행에서 프로필을 만든 뒤 재시작을 요청할 때 soffice가 반환하는 코드
+_EXIT_RESTART_REQUIRED = 81
+
+RegistrySettings = Mapping[str, Mapping[str, Union[bool, int, str]]]
+
+# ODF 저장 시 첫 페이지를 렌더링해 썸네일을 만드는 단계를 끈다
+NO_THUMBNAIL_SETTINGS: RegistrySettings = {
+    "/org.openoffice.Office.Common/Save/Document": {"GenerateThumbnail": False},
+}
+
+_XCU_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<oor:items xmlns:oor="http://openoffice.org/2001/registry" '
+    'xmlns:xs="http://www.w3.org/2001/XMLSchema" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">\n'
+)
+_XCU_FOOTER = "</oor:items>\n"
+
+
+def write_registry_settings(profile_dir: Path, settings: RegistrySettings) -> None:
+    """프로필의 ``registrymodifications.xcu``에 설정 항목을 추가한다.
+
+    Args:
+        profile_dir: ``UserInstallation`` 디렉터리.
+        settings: ``{노드 경로: {속성 이름: 값}}``. 예:
+            ``{"/org.openoffice.Office.Common/Save/Document":
+            {"GenerateThumbnail": False}}``.
+    """
+    items = []
+    for node, props in settings.items():
+        for name, value in props.items():
+            if isinstance(value, bool):
+                text = "true" if value else "false"
+            else:
+                text = str(value)
+            items.append(
+                f"<item oor:path={quoteattr(node)}>"
+                f'<prop oor:name={quoteattr(name)} oor:op="fuse">'
+                f"<value>{escape(text)}</value></prop></item>\n"
+            )
+    xcu = profile_dir / "user" / "registrymodifications.xcu"
+    xcu.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        current = xcu.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        current = ""
+    if _XCU_FOOTER.strip() in current:
+        head, _, _ = current.rpartition(_XCU_FOOTER.strip())
+        content = head + "".join(items) + _XCU_FOOTER
+    else:
+        content = _XCU_HEADER + "".join(items) + _XCU_FOOTER
+    xcu.write_text(content, encoding="utf-8")
+
+
+class ProfileCache:
+    """재사용 가능한 ``UserInstallation`` 프로필 풀.
+
+    프로필 하나는 동시에 하나의 soffice 프로세스만 사용하도록 빌려준다.
+    실패한 작업에 쓰인 프로필은 손상되었을 수 있으므로 폐기한다.
+
+    Args:
+        soffice_path: soffice(또는 libreoffice) 실행 파일 경로.
+        max_idle: 보관할 최대 유휴 프로필 수. 초과분은 반납 시 삭제한다.
+        init_timeout: 템플릿 프로필 초기화 제한 시간(초).
+        settings: 템플릿에 미리 기록할 설정 (:func:`write_registry_settings`).
+    """
+
+    def __init__(
+        self,
+        soffice_path: str,
+        max_idle: int = 64,
+        init_timeout: float = 120.0,
+        settings: RegistrySettings | None = None,
+    ):
+        self.soffice_path = soffice_path
+        self.max_idle = max_idle
+        self.init_timeout = init_timeout
+        self.settings = settings
+
+        self._root = Path(tempfile.mkdtemp(prefix="libreformer_profiles_"))
+        self._template: Path | None = None
+        self._template_ready = False
+        self._idle: list[Path] = []
+        self._leased: set[Path] = set()
+        self._invalid: set[Path] = set()
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._template_lock = threading.Lock()
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, str(self._root), ignore_errors=True
+        )
+
+    @property
+    def root(self) -> Path:
+        """캐시가 관리하는 모든 프로필의 상위 디렉터리."""
+        return self._root
+
+    def template(self) -> Path | None:
+        """초기화된 템플릿 프로필 경로. 초기화에 실패했으면 ``None``.
+
+        최초 호출 시 ``--terminate_after_init``으로 soffice를 한 번 실행해 만든다.
+        제한 시간을 넘기면 soffice.bin 자식까지 프로세스 그룹 전체를 종료한다.
+        """
+        with self._template_lock:
+            if self._template_ready:
+                return self._template
+            self._template_ready = True
+            template = self._root / "template"
+            cmd = [
+                self.soffice_path,
+                f"-env:UserInstallation=file://{template}",
+                "--headless",
+                "--norestore",
+                "--terminate_after_init",
+            ]
+            try:
+                result = run_process(cmd, timeout=self.init_timeout)
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.warning("템플릿 프로필 초기화 실패: {}", e)
+                return None
+            if (
+                result.returncode not in (0, _EXIT_RESTART_REQUIRED)
+                or not (template / "user").is_dir()
+            ):
+                logger.warning("템플릿 프로필 초기화 실패 (exit={})", result.returncode)
+                return None
+            (template / ".lock").unlink(missing_ok=True)
+            if self.settings:
+                try:
+                    write_registry_settings(template, self.settings)
+                except OSError as e:
+                    logger.warning("템플릿 프로필 설정 기록 실패: {}", e)
+            self._template = template
+            return template
+
+    def checkout(self) -> Path:
+        """프로필 하나를 빌린다. 유휴 프로필이 없으면 템플릿을 복제한다."""
+        with self._lock:
+            if self._idle:
+                profile = self._idle.pop()
+                self._leased.add(profile)
+                return profile
+            profile = self._root / f"profile_{next(self._counter)}"
+            self._leased.add(profile)
+
+        template = self.template()
+        if template is not None:
+            try:
+                shutil.copytree(template, profile, symlinks=True)
+            except OSError as e:
+                logger.warning("프로필 복제 실패, 빈 프로필 사용: {}", e)
+                shutil.rmtree(profile, ignore_errors=True)
+        return profile
+
+    def invalidate(self, profile: Path) -> None:
+        """빌려준 프로필을 반납 시 폐기하도록 표시한다."""
+        with self._lock:
+            if profile in self._leased:
+                self._invalid.add(profile)
+
+    def checkin(self, profile: Path, healthy: bool = True) -> None:
+        """프로필을 반납한다. 손상 가능성이 있으면 삭제한다."""
+        with self._lock:
+            self._leased.discard(profile)
+            invalid = profile in self._invalid
+            self._invalid.discard(profile)
+            keep = healthy and not invalid and len(self._idle) < self.max_idle
+            if keep:
+                (profile / ".lock").unlink(missing_ok=True)
+                self._idle.append(profile)
+        if not keep:
+            shutil.rmtree(profile, ignore_errors=True)
+
+    @contextmanager
+    def lease(self) -> Iterator[Path]:
+        """``checkout``/``checkin``을 감싼 컨텍스트 매니저."""
+        profile = self.checkout()
+        healthy = False
+        try:
+            yield profile
+            healthy = True
+        finally:
+            self.checkin(profile, healthy=healthy)
+
+    @asynccontextmanager
+    async def async_lease(self) -> AsyncIterator[Path]:
+        """:meth:`lease`의 비동기 버전.
+
+        템플릿 초기화(soffice 실행)와 프로필 복제·삭제는 이벤트 루프 밖에서
+        수행한다. 대기 중 취소되더라도 뒤늦게 빌린 프로필은 반납된다.
+        """
+        future = asyncio.ensure_future(asyncio.to_thread(self.checkout))
+        try:
+            profile = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(self._return_abandoned)
+            raise
+        healthy = False
+        try:
+            yield profile
+            healthy = True
+        finally:
+            await asyncio.shield(asyncio.to_thread(self.checkin, profile, healthy))
+
+    def _return_abandoned(self, future: asyncio.Future[Path]) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self.checkin(future.result(), healthy=False)
+
+    def close(self) -> None:
+        """모든 프로필을 삭제한다."""
+        with self._lock:
+            self._idle.clear()
+        self._finalizer()
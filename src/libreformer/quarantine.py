@@ -0,0 +1,218 @@
+"""반복해서 soffice를 멈추게 하거나 죽이는 입력(poison file)의 격리 목록.
+
+입력 내용의 해시를 키로 타임아웃·크래시 횟수를 디스크의 JSONL 색인에 기록한다.
+한도에 도달한 입력은 격리되어, 이후 실행(다른 프로세스 포함)에서 soffice를
+띄우지 않고 곧바로 실패로 처리된다. 색인은 덧붙이기만 하므로 여러 프로세스가
+같은 파일을 함께 쓸 수 있고, 조회할 때 다른 프로세스가 덧붙인 줄을 읽어 들인다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from .cache import file_digest
+from .schemas import Failed, FailureKind
+
+
+@dataclass(frozen=True)
+class QuarantineEntry:
+    """격리 목록의 항목 하나.
+
+    Attributes:
+        digest: 입력 내용의 BLAKE2b 해시(hex).
+        kind: 마지막 실패 분류.
+        error_message: 마지막 실패 사유.
+        file_path: 마지막으로 실패한 입력 경로.
+        strikes: 기록된 실패 횟수.
+        last_failure: 마지막 실패 시각 (Unix 시간).
+    """
+
+    digest: str
+    kind: FailureKind
+    error_message: str
+    file_path: str
+    strikes: int
+    last_failure: float
+
+
+class Quarantine:
+    """내용 해시로 입력을 격리하는 디스크 기반 목록.
+
+    Args:
+        path: JSONL 색인 파일 경로. 없으면 만든다.
+        max_strikes: 격리하기까지 허용하는 실패 횟수.
+        kinds: 실패 횟수로 셀 실패 분류.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_strikes: int = 2,
+        kinds: frozenset[FailureKind] = frozenset(
+            {FailureKind.TIMEOUT, FailureKind.CRASH}
+        ),
+    ):
+        if max_strikes < 1:
+            raise ValueError(f"max_strikes must be >= 1, got {max_strikes}")
+        self.path = Path(path)
+        self.max_strikes = max_strikes
+        self.kinds = kinds
+        self._lock = threading.Lock()
+        self._entries: dict[str, QuarantineEntry] = {}
+        self._offset = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch()
+        with self._lock:
+            self._refresh()
+
+    def __len__(self) -> int:
+        """격리된 입력 수."""
+        with self._lock:
+            self._refresh()
+            return sum(1 for e in self._entries.values() if self._isolated(e))
+
+    def __contains__(self, digest: object) -> bool:
+        with self._lock:
+            self._refresh()
+            entry = self._entries.get(digest)  # type: ignore[arg-type]
+            return entry is not None and self._isolated(entry)
+
+    def entries(self) -> list[QuarantineEntry]:
+        """격리된 항목 목록."""
+        with self._lock:
+            self._refresh()
+            return [e for e in self._entries.values() if self._isolated(e)]
+
+    def lookup(self, input_path: Path) -> QuarantineEntry | None:
+        """``input_path``가 격리되었으면 그 항목, 아니면 ``None``.
+
+        격리된 항목이 없으면 입력을 해시하지 않는다.
+        """
+        with self._lock:
+            self._refresh()
+            if not any(self._isolated(e) for e in self._entries.values()):
+                return None
+        try:
+            digest = file_digest(input_path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(digest)
+        return entry if entry is not None and self._isolated(entry) else None
+
+    def record(self, result: Failed) -> bool:
+        """실패 하나를 기록한다. 이번 기록으로 격리되었으면 ``True``."""
+        if result.kind not in self.kinds:
+            return False
+        try:
+            digest = file_digest(result.file_path)
+        except OSError:
+            return False
+        line = {
+            "digest": digest,
+            "kind": result.kind.value,
+            "error_message": result.error_message,
+            "file_path": str(result.file_path),
+            "time": time.time(),
+        }
+        with self._lock:
+            self._append(line)
+            self._refresh()
+            entry = self._entries[digest]
+            isolated = entry.strikes == self.max_strikes
+        if isolated:
+            logger.warning(
+                "입력 격리: {} ({} {}회)",
+                result.file_path,
+                entry.kind.value,
+                entry.strikes,
+            )
+        return isolated
+
+    def release(self, digest: str) -> bool:
+        """항목을 목록에서 지운다. 있었으면 ``True``."""
+        with self._lock:
+            self._refresh()
+            if digest not in self._entries:
+                return False
+            del self._entries[digest]
+            self._rewrite()
+            return True
+
+    def clear(self) -> None:
+        """모든 항목을 지운다."""
+        with self._lock:
+            self._entries.clear()
+            self._rewrite()
+
+    def _isolated(self, entry: QuarantineEntry) -> bool:
+        return entry.strikes >= self.max_strikes
+
+    def _append(self, line: dict) -> None:
+        # O_APPEND의 한 번 쓰기는 다른 프로세스의 쓰기와 섞이지 않는다
+        data = (json.dumps(line, ensure_ascii=False) + "\n").encode()
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def _refresh(self) -> None:
+        """색인에 새로 덧붙은 줄을 읽는다. ``self._lock``을 쥔 채로 호출한다."""
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size == self._offset:
+            return
+        if size < self._offset:
+            # 다른 프로세스가 항목을 지우고 다시 썼다
+            self._entries.clear()
+            self._offset = 0
+        with open(self.path, "rb") as fh:
+            fh.seek(self._offset)
+            data = fh.read(size - self._offset)
+        # 쓰는 중인 마지막 줄은 다음에 읽는다
+        complete = data[: data.rfind(b"\n") + 1]
+        self._offset += len(complete)
+        for raw in complete.splitlines():
+            try:
+                line = json.loads(raw)
+                self._apply(line)
+            except (ValueError, KeyError) as e:
+                logger.warning("격리 목록의 잘못된 줄 무시: {}", e)
+
+    def _apply(self, line: dict) -> None:
+        previous = self._entries.get(line["digest"])
+        self._entries[line["digest"]] = QuarantineEntry(
+            digest=line["digest"],
+            kind=FailureKind(line["kind"]),
+            error_message=line["error_message"],
+            file_path=line["file_path"],
+            strikes=(previous.strikes if previous else 0) + line.get("strikes", 1),
+            last_failure=line["time"],
+        )
+
+    def _rewrite(self) -> None:
+        """현재 항목만으로 색인을 다시 쓴다. ``self._lock``을 쥔 채로 호출한다."""
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            for e in self._entries.values():
+                line = {
+                    "digest": e.digest,
+                    "kind": e.kind.value,
+                    "error_message": e.error_message,
+                    "file_path": e.file_path,
+                    "time": e.last_failure,
+                    "strikes": e.strikes,
+                }
+                fh.write(json.dumps(line, ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+        self._offset = self.path.stat().st_size
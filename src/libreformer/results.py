@@ -0,0 +1,353 @@
+"""대량 변환 결과를 적은 메모리로 모으는 열(column) 기반 저장소.
+
+수백만 개의 ``Succeed``/``Failed`` 객체를 리스트로 들고 있는 대신, 결과를
+타입 배열(``array``) 열로 풀어서 저장한다. 디렉터리 경로와 오류 메시지는
+인터닝하고 파일 이름은 하나의 바이트 버퍼에 이어 붙인다. ``spill_path``를
+지정하면 메모리의 행이 일정 수를 넘을 때마다 JSONL 파일에 덧붙이고 비운다.
+요약 통계는 비운 행까지 포함해 유지된다.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterable, Iterable, Iterator
+
+from .schemas import Failed, FailureKind, Succeed, TransformResult
+
+_FAILED = 0
+_SUCCEED = 1
+_NONE = -1
+
+_KINDS = list(FailureKind)
+
+
+class _Interner:
+    """같은 문자열을 번호 하나로 저장한다."""
+
+    def __init__(self) -> None:
+        self._index: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def add(self, value: str) -> int:
+        idx = self._index.get(value)
+        if idx is None:
+            idx = self._index[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+
+class _StringColumn:
+    """UTF-8로 인코딩한 문자열을 하나의 버퍼에 이어 붙여 저장한다."""
+
+    def __init__(self) -> None:
+        self._blob = bytearray()
+        self._ends = array("Q")
+
+    def append(self, value: str) -> None:
+        self._blob += value.encode()
+        self._ends.append(len(self._blob))
+
+    def __getitem__(self, i: int) -> str:
+        start = self._ends[i - 1] if i else 0
+        return self._blob[start : self._ends[i]].decode()
+
+    def clear(self) -> None:
+        self._blob = bytearray()
+        self._ends = array("Q")
+
+
+def _opt_float(value: float | None) -> float:
+    return math.nan if value is None else value
+
+
+def _from_float(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def _opt_int(value: int | None) -> int:
+    return _NONE if value is None else value
+
+
+def _from_int(value: int) -> int | None:
+    return None if value == _NONE else value
+
+
+@dataclass(frozen=True)
+class ResultSummary:
+    """저장된 모든 결과의 요약 통계.
+
+    Attributes:
+        total: 결과 수.
+        succeeded: 성공 수.
+        failed: 실패 수.
+        input_bytes: 입력 파일 크기 합계.
+        output_bytes: 출력 파일 크기 합계.
+        cpu_time: soffice CPU 시간 합계(초).
+        wall_time: 실행 시간(초)의 ``p50``/``p95``/``p99``/``mean``/``max``.
+            실행 시간이 기록된 결과만 포함한다.
+    """
+
+    total: int
+    succeeded: int
+    failed: int
+    input_bytes: int
+    output_bytes: int
+    cpu_time: float
+    wall_time: dict[str, float]
+
+
+class ResultStore:
+    """변환 결과를 열 기반으로 모으는 저장소.
+
+    Args:
+        spill_path: 지정하면 메모리의 행을 이 JSONL 파일에 덧붙이고 비운다.
+            파일이 이미 있으면 내용을 지운다.
+        spill_threshold: 메모리에 둘 최대 행 수.
+
+    Example:
+        ::
+
+            with ResultStore(spill_path="report.jsonl") as store:
+                store.extend(engine.transform_parallel(paths, "pdf"))
+                print(store.summary())
+                for failure in store.failures():
+                    ...
+    """
+
+    def __init__(
+        self, spill_path: str | Path | None = None, spill_threshold: int = 100_000
+    ):
+        if spill_threshold < 1:
+            raise ValueError(f"spill_threshold must be >= 1, got {spill_threshold}")
+        self._spill_path = Path(spill_path) if spill_path is not None else None
+        self._spill_threshold = spill_threshold
+        self._spilled = 0
+        if self._spill_path is not None:
+            self._spill_path.write_text("")
+
+        self._dirs = _Interner()
+        self._errors = _Interner()
+        self._names = _StringColumn()
+        self._output_names = _StringColumn()
+        self._reset_columns()
+
+        # 요약 통계 (비운 행 포함)
+        self._succeeded = 0
+        self._failed = 0
+        self._input_bytes = 0
+        self._output_bytes = 0
+        self._cpu_time = 0.0
+        self._wall_times = array("d")
+
+    def _reset_columns(self) -> None:
+        self._status = array("b")
+        self._dir = array("I")
+        self._output_dir = array("i")
+        self._error = array("i")
+        self._wall = array("d")
+        self._cpu = array("d")
+        self._rss = array("q")
+        self._input_size = array("q")
+        self._output_size = array("q")
+        self._worker = array("i")
+        self._attempt = array("H")
+        self._kind = array("b")
+        self._names.clear()
+        self._output_names.clear()
+
+    # -----------------------------------------------------------------
+    # Ingest
+    # -----------------------------------------------------------------
+    def add(self, result: Succeed | Failed) -> None:
+        """결과 하나를 추가한다."""
+        path = Path(result.file_path)
+        self._dir.append(self._dirs.add(str(path.parent)))
+        self._names.append(path.name)
+        if isinstance(result, Succeed):
+            output = Path(result.output_path)
+            self._status.append(_SUCCEED)
+            self._output_dir.append(self._dirs.add(str(output.parent)))
+            self._output_names.append(output.name)
+            self._error.append(_NONE)
+            self._output_size.append(_opt_int(result.output_size))
+            self._kind.append(_NONE)
+            self._succeeded += 1
+            self._output_bytes += result.output_size or 0
+        else:
+            self._status.append(_FAILED)
+            self._output_dir.append(_NONE)
+            self._output_names.append("")
+            self._error.append(self._errors.add(result.error_message))
+            self._output_size.append(_NONE)
+            self._kind.append(_KINDS.index(result.kind))
+            self._failed += 1
+        self._wall.append(_opt_float(result.wall_time))
+        self._cpu.append(_opt_float(result.cpu_time))
+        self._rss.append(_opt_int(result.max_rss))
+        self._input_size.append(_opt_int(result.input_size))
+        self._worker.append(_opt_int(result.worker_id))
+        self._attempt.append(result.attempt)
+
+        if result.wall_time is not None:
+            self._wall_times.append(result.wall_time)
+        self._cpu_time += result.cpu_time or 0.0
+        self._input_bytes += result.input_size or 0
+
+        if self._spill_path is not None and len(self._status) >= self._spill_threshold:
+            self.flush()
+
+    def extend(self, results: Iterable[Succeed | Failed]) -> ResultStore:
+        """이터러블(예: ``transform_parallel``의 결과)을 모두 추가한다."""
+        for result in results:
+            self.add(result)
+        return self
+
+    async def aextend(self, results: AsyncIterable[Succeed | Failed]) -> ResultStore:
+        """비동기 이터러블(예: ``async_transform_parallel``의 결과)을 모두 추가한다."""
+        async for result in results:
+            self.add(result)
+        return self
+
+    def flush(self) -> None:
+        """메모리의 행을 ``spill_path``에 덧붙이고 비운다."""
+        if self._spill_path is None or not len(self._status):
+            return
+        with open(self._spill_path, "a", encoding="utf-8") as fh:
+            for i in range(len(self._status)):
+                fh.write(json.dumps(_to_record(self._row(i)), ensure_ascii=False))
+                fh.write("\n")
+        self._spilled += len(self._status)
+        self._reset_columns()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> ResultStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # -----------------------------------------------------------------
+    # Read
+    # -----------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._spilled + len(self._status)
+
+    def __iter__(self) -> Iterator[Succeed | Failed]:
+        """추가된 순서대로 결과 객체를 다시 만들어 돌려준다."""
+        if self._spill_path is not None and self._spilled:
+            with open(self._spill_path, encoding="utf-8") as fh:
+                for line in fh:
+                    yield _from_record(json.loads(line))
+        for i in range(len(self._status)):
+            yield self._row(i)
+
+    def failures(self) -> Iterator[Failed]:
+        for result in self:
+            if isinstance(result, Failed):
+                yield result
+
+    def summary(self) -> ResultSummary:
+        walls = sorted(self._wall_times)
+        wall_time = {
+            "p50": _percentile(walls, 50),
+            "p95": _percentile(walls, 95),
+            "p99": _percentile(walls, 99),
+            "mean": sum(walls) / len(walls) if walls else 0.0,
+            "max": walls[-1] if walls else 0.0,
+        }
+        return ResultSummary(
+            total=len(self),
+            succeeded=self._succeeded,
+            failed=self._failed,
+            input_bytes=self._input_bytes,
+            output_bytes=self._output_bytes,
+            cpu_time=self._cpu_time,
+            wall_time=wall_time,
+        )
+
+    def to_transform_result(self) -> TransformResult:
+        """모든 결과를 객체 리스트로 된 :class:`TransformResult`로 만든다."""
+        succeeds: list[Succeed] = []
+        failed: list[Failed] = []
+        for result in self:
+            (succeeds if isinstance(result, Succeed) else failed).append(result)
+        return TransformResult(succeeds=succeeds, failed=failed)
+
+    def _row(self, i: int) -> Succeed | Failed:
+        file_path = Path(self._dirs.values[self._dir[i]]) / self._names[i]
+        details = dict(
+            wall_time=_from_float(self._wall[i]),
+            cpu_time=_from_float(self._cpu[i]),
+            max_rss=_from_int(self._rss[i]),
+            input_size=_from_int(self._input_size[i]),
+            worker_id=_from_int(self._worker[i]),
+            attempt=self._attempt[i],
+        )
+        if self._status[i] == _SUCCEED:
+            output_path = (
+                Path(self._dirs.values[self._output_dir[i]]) / self._output_names[i]
+            )
+            return Succeed(
+                file_path,
+                output_path,
+                output_size=_from_int(self._output_size[i]),
+                **details,
+            )
+        return Failed(
+            file_path,
+            self._errors.values[self._error[i]],
+            kind=_KINDS[self._kind[i]],
+            **details,
+        )
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """정렬된 값의 선형 보간 백분위수."""
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+_DETAIL_FIELDS = ("wall_time", "cpu_time", "max_rss", "input_size", "worker_id")
+
+
+def _to_record(result: Succeed | Failed) -> dict:
+    record: dict = {"file_path": str(result.file_path)}
+    if isinstance(result, Succeed):
+        record["output_path"] = str(result.output_path)
+        record["output_size"] = result.output_size
+    else:
+        record["error_message"] = result.error_message
+        record["kind"] = result.kind.value
+    for name in _DETAIL_FIELDS:
+        record[name] = getattr(result, name)
+    record["attempt"] = result.attempt
+    return record
+
+
+def _from_record(record: dict) -> Succeed | Failed:
+    details = {name: record.get(name) for name in _DETAIL_FIELDS}
+    details["attempt"] = record.get("attempt", 1)
+    file_path = Path(record["file_path"])
+    if "output_path" in record:
+        return Succeed(
+            file_path,
+            Path(record["output_path"]),
+            output_size=record.get("output_size"),
+            **details,
+        )
+    return Failed(
+        file_path,
+        record["error_message"],
+        kind=FailureKind(record.get("kind", FailureKind.UNKNOWN)),
+        **details,
+    )
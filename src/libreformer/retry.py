@@ -0,0 +1,145 @@
+"""실패 분류와 병렬 API의 재시도 정책.
+
+soffice는 실패 원인과 상관없이 0이 아닌 종료 코드를 돌려주므로, 종료 코드와
+출력 메시지로 실패를 :class:`~libreformer.FailureKind`로 분류한다. 병렬 API에
+:class:`RetryPolicy`를 지정하면 다시 시도할 가치가 있는 분류의 실패만 지터를
+섞은 지수 백오프 후 재시도한다. 백오프 중인 재시도는 실행 슬롯을 차지하지
+않는다.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+from .profiles import _EXIT_RESTART_REQUIRED
+from .scheduling import ScheduledUnit
+from .schemas import Failed, FailureKind, Succeed
+
+# 다시 시도하면 사라질 수 있는 오류 메시지 (소문자)
+_TRANSIENT_MARKERS = (
+    "user installation could not be completed",
+    "is locked",
+    "lock file",
+    "already in use",
+    "resource temporarily unavailable",
+)
+_UNSUPPORTED_MARKERS = (
+    "could not be loaded",
+    "no export filter",
+    "general input/output error",
+)
+
+
+def classify_exit(returncode: int, output: str) -> FailureKind:
+    """soffice 종료 코드와 출력 메시지로 실패를 분류한다."""
+    if returncode < 0:
+        return FailureKind.CRASH
+    if returncode == _EXIT_RESTART_REQUIRED:
+        return FailureKind.TRANSIENT
+    message = output.lower()
+    if any(marker in message for marker in _TRANSIENT_MARKERS):
+        return FailureKind.TRANSIENT
+    if any(marker in message for marker in _UNSUPPORTED_MARKERS):
+        return FailureKind.UNSUPPORTED_FORMAT
+    return FailureKind.UNKNOWN
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """병렬 API의 실패 재시도 정책.
+
+    ``n``번째 실패 뒤 대기 시간은 ``min(max_delay, base_delay * 2**(n-1))``에서
+    최대 ``jitter`` 비율만큼 무작위로 줄인 값이다. 재시도는 파일 하나씩
+    실행한다.
+
+    Attributes:
+        max_attempts: 파일 하나의 최대 시도 횟수 (첫 시도 포함).
+        base_delay: 첫 재시도 전 대기 시간(초).
+        max_delay: 재시도 전 최대 대기 시간(초).
+        jitter: 대기 시간을 무작위로 줄일 최대 비율 (0이면 지터 없음, 1이면
+            0부터 전체 대기 시간 사이).
+        retry_on: 재시도할 실패 분류.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    jitter: float = 1.0
+    retry_on: frozenset[FailureKind] = frozenset({FailureKind.TRANSIENT})
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {self.max_attempts}")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("base_delay and max_delay must be >= 0")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError(f"jitter must be between 0 and 1, got {self.jitter}")
+
+    def should_retry(self, result: Failed) -> bool:
+        return result.kind in self.retry_on and result.attempt < self.max_attempts
+
+    def delay(self, attempt: int) -> float:
+        """``attempt``번째 시도가 실패한 뒤 기다릴 시간(초)."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+
+class RetryQueue:
+    """백오프 중인 재시도 단위를 시작 시각 순으로 보관한다.
+
+    ``policy``가 없으면 아무것도 재시도하지 않는다.
+    """
+
+    def __init__(self, policy: RetryPolicy | None):
+        self._policy = policy
+        self._heap: list[tuple[float, int, ScheduledUnit]] = []
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def settle(
+        self, unit: ScheduledUnit, results: Sequence[Succeed | Failed]
+    ) -> list[Succeed | Failed]:
+        """끝난 단위의 결과에 시도 횟수를 붙이고, 재시도할 실패는 예약한다.
+
+        Returns:
+            지금 내보낼 결과.
+        """
+        final: list[Succeed | Failed] = []
+        for result in results:
+            result.attempt = unit.attempt
+            if (
+                isinstance(result, Failed)
+                and self._policy is not None
+                and self._policy.should_retry(result)
+            ):
+                retry = ScheduledUnit(
+                    unit.target,
+                    [str(result.file_path)],
+                    cost=unit.cost / len(unit.paths),
+                    heavy=unit.heavy,
+                    attempt=unit.attempt + 1,
+                )
+                due = time.monotonic() + self._policy.delay(unit.attempt)
+                heapq.heappush(self._heap, (due, next(self._seq), retry))
+            else:
+                final.append(result)
+        return final
+
+    def pop_due(self) -> ScheduledUnit | None:
+        """대기 시간이 끝난 재시도 단위. 없으면 ``None``."""
+        if self._heap and self._heap[0][0] <= time.monotonic():
+            return heapq.heappop(self._heap)[2]
+        return None
+
+    def next_due_in(self) -> float | None:
+        """다음 재시도까지 남은 시간(초). 예약된 재시도가 없으면 ``None``."""
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - time.monotonic())
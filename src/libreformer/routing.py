@@ -0,0 +1,318 @@
+"""변환 단계 계획과 다단계 변환 경로의 실행 상태.
+
+엔진은 입력 파일마다 :func:`plan_hops`로 soffice 실행 단계(``--convert-to``
+인자와 ``--infilter``)를 정하고, 같은 단계를 쓰는 파일끼리 묶어 실행한다.
+:meth:`FormatRegistry.plan_route`가 여러 단계 경로를 계획하면 중간 결과물은
+원본 디렉터리가 아닌 RAM 기반 임시 디렉터리(가능하면 ``/dev/shm``)에 두고,
+마지막 단계만 출력 디렉터리(기본값은 원본 디렉터리)에 출력한다. 스테이징을
+켜면 마지막 단계도 임시 디렉터리에 출력한 뒤 완성된 파일을 출력 디렉터리로
+원자적으로 옮긴다(:func:`publish`). 동기·비동기 실행 루프가 같은 상태 객체를
+공유하며, 최종 결과에는 단계별 soffice 실행 시간과 자원 사용량을 합산해
+기록한다. 실행 중인 변환의 최종 출력 경로는 :class:`OutputClaims`로 점유해,
+stem이 같은 입력끼리 서로의 출력을 덮어쓰지 않게 한다.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Mapping, Sequence
+
+from .formats import FormatRegistry
+from .process import ProcessResult
+from .schemas import Failed, FailureKind, Succeed
+from .schemas.filter_options import FilterOptions
+from .utils import fast_temp_dir
+
+# (--convert-to 인자, --infilter 필터 이름)
+Hop = tuple[str, str | None]
+
+_NO_OPTIONS = FilterOptions()
+
+
+def plan_hops(
+    input_path: Path, to: str, options: FilterOptions | None = None
+) -> tuple[Hop, ...]:
+    """입력 파일을 ``to``로 변환하는 soffice 실행 단계를 계획한다.
+
+    레지스트리가 아는 변환은 출력 필터 이름을 명시한다. 경로를 알 수 없는
+    입력이나 필터를 직접 지정한 ``to`` (예: ``"pdf:writer_pdf_Export"``)는
+    그대로 한 단계로 실행한다. ``options``는 마지막 단계에만 적용한다.
+    """
+    if ":" in to:
+        return ((to, None),)
+    options = options or _NO_OPTIONS
+    route = FormatRegistry.plan_route(input_path.suffix, to)
+    if route is None:
+        return ((options.convert_arg(to, None), None),)
+    last = len(route.hops) - 1
+    return tuple(
+        (
+            (options if i == last else _NO_OPTIONS).convert_arg(
+                hop.to_ext, hop.export_filter
+            ),
+            hop.import_filter,
+        )
+        for i, hop in enumerate(route.hops)
+    )
+
+
+@dataclass(frozen=True)
+class RouteStep:
+    """soffice 한 번으로 실행할 변환 단계.
+
+    Attributes:
+        inputs: 이 단계의 입력 경로.
+        convert_to: ``--convert-to`` 인자 (예: ``"pdf:writer_pdf_Export"``).
+        output_dir: 출력 디렉터리.
+        import_filter: ``--infilter``로 지정할 필터 이름. 없으면 ``None``.
+    """
+
+    inputs: list[Path]
+    convert_to: str
+    output_dir: Path
+    import_filter: str | None
+
+    @property
+    def extension(self) -> str:
+        """출력 파일 확장자."""
+        return self.convert_to.split(":", 1)[0]
+
+
+@contextmanager
+def route_scratch_dir(
+    hops: Sequence[Hop], staging: bool = False
+) -> Iterator[Path | None]:
+    """중간 결과물과 스테이징 출력을 둘 임시 디렉터리.
+
+    단일 단계 경로이고 스테이징도 하지 않으면 ``None``.
+    """
+    if len(hops) < 2 and not staging:
+        yield None
+        return
+    with tempfile.TemporaryDirectory(
+        prefix="libreformer_route_", dir=fast_temp_dir()
+    ) as scratch:
+        yield Path(scratch)
+
+
+def publish(staged: Path, destination: Path) -> Path:
+    """스테이징된 출력 파일을 ``destination``으로 원자적으로 옮긴다.
+
+    같은 파일 시스템이면 이름만 바꾸고, 아니면 대상 디렉터리의 임시 파일로
+    복사한 뒤 이름을 바꾼다. 어느 쪽이든 ``destination``에 쓰다 만 파일이
+    보이는 일은 없다.
+    """
+    try:
+        os.replace(staged, destination)
+        return destination
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    tmp = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        shutil.copyfile(staged, tmp)
+        os.replace(tmp, destination)
+    finally:
+        tmp.unlink(missing_ok=True)
+    staged.unlink(missing_ok=True)
+    return destination
+
+
+class OutputClaims:
+    """실행 중인 변환이 쓰고 있는 최종 출력 경로의 목록.
+
+    stem이 같은 두 입력(예: 서로 다른 디렉터리의 ``report.docx``)을 같은 출력
+    디렉터리로 동시에 변환하면 soffice와 :func:`publish`는 서로의 결과를 말없이
+    덮어쓴다. 변환 전에 출력 경로를 점유해, 다른 입력이 이미 쓰고 있는
+    경로로 가는 입력을 가려낸다. 같은 입력은 같은 경로를 여러 번 점유할 수 있다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # 출력 경로 -> (점유한 입력, 점유 횟수)
+        self._owners: dict[Path, tuple[Path, int]] = {}
+
+    @contextmanager
+    def claim(self, destinations: Mapping[Path, Path]) -> Iterator[dict[Path, Path]]:
+        """``{입력: 출력 경로}``를 블록이 끝날 때까지 점유한다.
+
+        Yields:
+            다른 입력이 이미 점유해 쓸 수 없는 ``{입력: 출력 경로}``.
+        """
+        claimed: list[Path] = []
+        conflicts: dict[Path, Path] = {}
+        with self._lock:
+            for source, destination in destinations.items():
+                owner = self._owners.get(destination)
+                if owner is not None and owner[0] != source:
+                    conflicts[source] = destination
+                    continue
+                self._owners[destination] = (source, owner[1] + 1 if owner else 1)
+                claimed.append(destination)
+        try:
+            yield conflicts
+        finally:
+            with self._lock:
+                for destination in claimed:
+                    source, count = self._owners[destination]
+                    if count == 1:
+                        del self._owners[destination]
+                    else:
+                        self._owners[destination] = (source, count - 1)
+
+
+class RouteRun:
+    """경로의 단계를 차례로 내보내고 단계별 결과를 원본 입력에 대응시킨다.
+
+    어느 단계에서 실패한 입력은 이후 단계에서 제외되며, 최종 결과의
+    ``file_path``는 항상 원본 입력 경로다. 실행 시간과 CPU 시간은 단계별 합계,
+    최대 RSS는 단계 중 최댓값이다.
+
+    Args:
+        input_paths: 원본 입력 경로. 모두 같은 디렉터리에 있어야 한다.
+        hops: :func:`plan_hops`가 계획한 실행 단계.
+        scratch_dir: 중간 결과물 디렉터리. 여러 단계 경로나 스테이징에서 필요하다.
+        worker_id: 실행을 맡은 상주 워커 번호. 없으면 ``None``.
+        output_dir: 최종 출력 디렉터리. ``None``이면 원본 디렉터리.
+        staging: ``True``면 마지막 단계도 ``scratch_dir`` 아래에 출력하고, 성공한
+            결과를 :func:`publish`로 ``output_dir``에 옮긴다.
+    """
+
+    def __init__(
+        self,
+        input_paths: Sequence[Path],
+        hops: Sequence[Hop],
+        scratch_dir: Path | None,
+        worker_id: int | None = None,
+        output_dir: Path | None = None,
+        staging: bool = False,
+    ):
+        self._hops = list(hops)
+        self._originals = list(input_paths)
+        self._output_dir = output_dir or self._originals[0].parent
+        self._scratch_dir = scratch_dir
+        self._staged_dir: Path | None = None
+        if staging:
+            assert scratch_dir is not None
+            # 중간 결과물과 이름이 겹치지 않도록 하위 디렉터리를 쓴다
+            self._staged_dir = scratch_dir / "staged"
+            self._staged_dir.mkdir()
+        # (원본 경로, 현재 단계의 입력 경로)
+        self._pending = [(p, p) for p in self._originals]
+        self._results: dict[Path, Succeed | Failed] = {}
+        self._index = 0
+        self._worker_id = worker_id
+        self._wall_time: float | None = None
+        self._cpu_time: float | None = None
+        self._max_rss: int | None = None
+
+    def next_step(self) -> RouteStep | None:
+        """다음에 실행할 단계. 모든 단계를 마쳤거나 남은 입력이 없으면 ``None``."""
+        if not self._pending or self._index >= len(self._hops):
+            return None
+        convert_to, import_filter = self._hops[self._index]
+        if not self._is_last:
+            output_dir = self._scratch_dir
+        else:
+            output_dir = self._staged_dir or self._output_dir
+        assert output_dir is not None
+        return RouteStep(
+            [current for _, current in self._pending],
+            convert_to,
+            output_dir,
+            import_filter,
+        )
+
+    def record(
+        self,
+        results: Sequence[Succeed | Failed],
+        process: ProcessResult | None = None,
+        wall_time: float | None = None,
+    ) -> None:
+        """:meth:`next_step`이 반환한 단계의 입력별 결과를 기록한다.
+
+        ``process``는 이 단계를 실행한 soffice의 실행 결과로, 자원 사용량을
+        누적하는 데 쓴다. 별도 프로세스 없이 실행한 단계는 ``wall_time``만
+        넘긴다.
+        """
+        if process is not None:
+            self._add_usage(process)
+        elif wall_time is not None:
+            self._wall_time = (self._wall_time or 0.0) + wall_time
+        remaining: list[tuple[Path, Path]] = []
+        for (original, _), result in zip(self._pending, results):
+            if isinstance(result, Failed):
+                self._results[original] = Failed(
+                    original, result.error_message, kind=result.kind
+                )
+            elif self._is_last:
+                self._results[original] = self._finish(original, result.output_path)
+            else:
+                remaining.append((original, result.output_path))
+        self._pending = remaining
+        self._index += 1
+
+    def fail(
+        self,
+        error_message: str,
+        wall_time: float | None = None,
+        kind: FailureKind = FailureKind.UNKNOWN,
+    ) -> None:
+        """남은 모든 입력을 실패로 기록하고 실행을 끝낸다.
+
+        ``wall_time``은 실패한 단계가 소비한 시간(예: 타임아웃)이다.
+        """
+        if wall_time is not None:
+            self._wall_time = (self._wall_time or 0.0) + wall_time
+        for original, _ in self._pending:
+            self._results[original] = Failed(original, error_message, kind=kind)
+        self._pending = []
+
+    def results(self) -> list[Succeed | Failed]:
+        """원본 입력 순서대로 실행 정보를 채운 최종 결과를 반환한다."""
+        results = [self._results[p] for p in self._originals]
+        for result in results:
+            result.wall_time = self._wall_time
+            result.cpu_time = self._cpu_time
+            result.max_rss = self._max_rss
+            result.worker_id = self._worker_id
+            result.input_size = file_size(result.file_path)
+            if isinstance(result, Succeed):
+                result.output_size = file_size(result.output_path)
+        return results
+
+    def _finish(self, original: Path, output_path: Path) -> Succeed | Failed:
+        if self._staged_dir is None:
+            return Succeed(original, output_path)
+        destination = self._output_dir / output_path.name
+        try:
+            return Succeed(original, publish(output_path, destination))
+        except OSError as e:
+            return Failed(original, f"Failed to publish output to {destination}: {e}")
+
+    def _add_usage(self, process: ProcessResult) -> None:
+        self._wall_time = (self._wall_time or 0.0) + process.wall_time
+        if process.cpu_time is not None:
+            self._cpu_time = (self._cpu_time or 0.0) + process.cpu_time
+        if process.max_rss is not None:
+            self._max_rss = max(self._max_rss or 0, process.max_rss)
+
+    @property
+    def _is_last(self) -> bool:
+        return self._index == len(self._hops) - 1
+
+
+def file_size(path: Path) -> int | None:
+    """파일 크기(바이트). 읽을 수 없으면 ``None``."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
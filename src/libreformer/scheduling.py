@@ -0,0 +1,173 @@
+"""병렬 변환 작업의 비용 추정과 실행 순서 결정.
+
+병렬 API는 기본적으로 입력 순서대로 작업을 시작하므로, 배치 끝에 있는 큰
+스프레드시트 하나가 전체 완료 시간을 좌우할 수 있다. :class:`Scheduler`를
+넘기면 입력을 ``lookahead``개까지 미리 읽어 파일 크기와 문서 카테고리로 추정한
+비용 순으로 작업을 시작하고, 무거운 Calc/Impress 작업이 한꺼번에 실행되지
+않도록 동시에 실행 중인 무거운 작업 수를 제한한다.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import os
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Mapping
+
+from .formats import DocumentCategory, FormatRegistry
+
+# 파일 크기와 무관한 변환당 고정 비용(바이트 환산). 기동·저장 비용을 반영한다.
+_BASE_COST_BYTES = 64 * 1024
+
+# 카테고리별 바이트당 상대 비용
+DEFAULT_CATEGORY_WEIGHTS: Mapping[DocumentCategory, float] = {
+    DocumentCategory.WRITER: 1.0,
+    DocumentCategory.CALC: 3.0,
+    DocumentCategory.IMPRESS: 2.0,
+    DocumentCategory.DRAW: 1.5,
+    DocumentCategory.MATH: 0.5,
+    DocumentCategory.GRAPHIC: 1.0,
+}
+
+
+class SchedulePolicy(str, Enum):
+    """작업 시작 순서."""
+
+    FIFO = "fifo"
+    """입력 순서."""
+    LONGEST_FIRST = "longest_first"
+    """추정 비용이 큰 작업부터. 전체 완료 시간(makespan)을 줄인다."""
+    SHORTEST_FIRST = "shortest_first"
+    """추정 비용이 작은 작업부터. 평균 지연 시간을 줄인다."""
+
+
+@dataclass(frozen=True)
+class Scheduler:
+    """병렬 API의 작업 순서와 무거운 작업의 동시 실행을 제어한다.
+
+    Attributes:
+        policy: 작업 시작 순서.
+        lookahead: 순서를 정하기 위해 미리 읽어 둘 최대 작업(배치) 수.
+        max_heavy: 동시에 실행할 무거운 작업의 최대 수. ``None``이면 제한 없음.
+        heavy_categories: 무거운 작업으로 볼 문서 카테고리.
+        heavy_min_bytes: 이 크기 이상인 ``heavy_categories`` 파일만 무겁게 본다.
+        category_weights: 카테고리별 바이트당 상대 비용.
+    """
+
+    policy: SchedulePolicy = SchedulePolicy.LONGEST_FIRST
+    lookahead: int = 4096
+    max_heavy: int | None = None
+    heavy_categories: frozenset[DocumentCategory] = frozenset(
+        {DocumentCategory.CALC, DocumentCategory.IMPRESS}
+    )
+    heavy_min_bytes: int = 1024 * 1024
+    category_weights: Mapping[DocumentCategory, float] = field(
+        default_factory=lambda: dict(DEFAULT_CATEGORY_WEIGHTS), hash=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.lookahead < 1:
+            raise ValueError(f"lookahead must be >= 1, got {self.lookahead}")
+        if self.max_heavy is not None and self.max_heavy < 1:
+            raise ValueError(f"max_heavy must be >= 1, got {self.max_heavy}")
+
+    def estimate(self, file_path: str) -> tuple[float, bool]:
+        """파일 하나의 ``(추정 비용, 무거운 작업 여부)``.
+
+        읽을 수 없는 파일은 크기 0으로 본다. 카테고리는 확장자로 정하며, 여러
+        카테고리에 속하는 확장자는 가장 먼저 등록된 카테고리를 쓴다.
+        """
+        try:
+            size = os.stat(file_path).st_size
+        except OSError:
+            size = 0
+        _, ext = os.path.splitext(file_path)
+        formats = FormatRegistry.get_format(ext)
+        category = formats[0].category if formats else DocumentCategory.WRITER
+        weight = self.category_weights.get(category, 1.0)
+        heavy = category in self.heavy_categories and size >= self.heavy_min_bytes
+        return weight * (size + _BASE_COST_BYTES), heavy
+
+
+@dataclass
+class ScheduledUnit:
+    """실행 단위 하나(파일 하나 또는 배치)와 추정 비용."""
+
+    target: str
+    paths: list[str]
+    cost: float = 0.0
+    heavy: bool = False
+    attempt: int = 1
+
+
+class UnitQueue:
+    """실행 단위를 정책 순서로 내보내는 대기열.
+
+    ``scheduler``가 없으면 한 번에 하나만 받아 입력 순서대로 내보내므로,
+    기존의 스트리밍 동작과 같다.
+    """
+
+    def __init__(self, scheduler: Scheduler | None = None):
+        self._scheduler = scheduler
+        self._capacity = scheduler.lookahead if scheduler is not None else 1
+        self._heap: list[tuple[float, int, ScheduledUnit]] = []
+        self._seq = itertools.count()
+        self._running_heavy = 0
+
+    def wants_more(self) -> bool:
+        """더 읽어 둘 자리가 있는지 여부."""
+        return len(self._heap) < self._capacity
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, target: str, paths: list[str]) -> None:
+        unit = ScheduledUnit(target, paths)
+        scheduler = self._scheduler
+        if scheduler is not None and (
+            scheduler.policy is not SchedulePolicy.FIFO
+            or scheduler.max_heavy is not None
+        ):
+            for path in paths:
+                cost, heavy = scheduler.estimate(path)
+                unit.cost += cost
+                unit.heavy = unit.heavy or heavy
+        seq = next(self._seq)
+        if scheduler is None or scheduler.policy is SchedulePolicy.FIFO:
+            key = float(seq)
+        elif scheduler.policy is SchedulePolicy.LONGEST_FIRST:
+            key = -unit.cost
+        else:
+            key = unit.cost
+        heapq.heappush(self._heap, (key, seq, unit))
+
+    def requeue(self, unit: ScheduledUnit) -> None:
+        """재시도할 단위를 다른 모든 단위보다 앞에 넣는다."""
+        heapq.heappush(self._heap, (-math.inf, next(self._seq), unit))
+
+    def pop(self) -> ScheduledUnit | None:
+        """다음에 시작할 단위. 없거나 무거운 작업 한도로 막혀 있으면 ``None``."""
+        max_heavy = self._scheduler.max_heavy if self._scheduler else None
+        blocked: list[tuple[float, int, ScheduledUnit]] = []
+        chosen = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            unit = entry[2]
+            if unit.heavy and max_heavy is not None:
+                if self._running_heavy >= max_heavy:
+                    blocked.append(entry)
+                    continue
+                self._running_heavy += 1
+            chosen = unit
+            break
+        for entry in blocked:
+            heapq.heappush(self._heap, entry)
+        return chosen
+
+    def finish(self, unit: ScheduledUnit) -> None:
+        """:meth:`pop`으로 내보낸 단위가 끝났음을 알린다."""
+        if unit.heavy and self._scheduler and self._scheduler.max_heavy is not None:
+            self._running_heavy -= 1
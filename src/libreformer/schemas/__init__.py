@@ -1,6 +1,15 @@
 from .failed import Failed
+from .failure_kind import FailureKind
+from .filter_options import FilterOptions
 from .format_info import FormatInfo
 from .succeed import Succeed
 from .transform_result import TransformResult
 
-__all__ = ["Failed", "FormatInfo", "Succeed", "TransformResult"]
+__all__ = [
+    "Failed",
+    "FailureKind",
+    "FilterOptions",
+    "FormatInfo",
+    "Succeed",
+    "TransformResult",
+]
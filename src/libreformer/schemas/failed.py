@@ -1,8 +1,38 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from .failure_kind import FailureKind
+
 
-@dataclass
+@dataclass(slots=True)
 class Failed:
+    """변환 실패 결과.
+
+    실행 정보 필드는 :class:`~libreformer.schemas.Succeed`와 같다. soffice를
+    실행하기 전에 실패했다면 ``None``이다.
+
+    Attributes:
+        file_path: 원본 파일 경로.
+        error_message: 실패 사유.
+        wall_time: soffice 실행 시간(초).
+        cpu_time: soffice 프로세스의 CPU 시간(초). 워커 풀에서는 클라이언트만의 값.
+        max_rss: soffice 프로세스의 최대 RSS(바이트). 워커 풀에서는 클라이언트만의 값.
+        input_size: 원본 파일 크기(바이트).
+        worker_id: 변환을 처리한 상주 워커 번호.
+        attempt: 몇 번째 시도에서 얻은 결과인지 (1부터).
+        timings: 단계 이름 -> 소요 시간(초).
+        kind: 실패 원인 분류.
+    """
+
     file_path: Path
     error_message: str
+    wall_time: float | None = field(default=None, compare=False)
+    cpu_time: float | None = field(default=None, compare=False)
+    max_rss: int | None = field(default=None, compare=False)
+    input_size: int | None = field(default=None, compare=False)
+    worker_id: int | None = field(default=None, compare=False)
+    attempt: int = field(default=1, compare=False)
+    timings: dict[str, float] | None = field(default=None, compare=False, repr=False)
+    kind: FailureKind = field(default=FailureKind.UNKNOWN, compare=False)
@@ -0,0 +1,22 @@
+from enum import Enum
+
+
+class FailureKind(str, Enum):
+    """변환 실패 원인 분류."""
+
+    TRANSIENT = "transient"
+    """프로필 잠금, 첫 실행 프로필 초기화 등 다시 시도하면 성공할 수 있는 실패."""
+    TIMEOUT = "timeout"
+    """제한 시간 안에 변환이 끝나지 않았다."""
+    CRASH = "crash"
+    """soffice가 시그널로 종료되었거나 상주 워커가 죽었다."""
+    UNSUPPORTED_FORMAT = "unsupported_format"
+    """입력을 읽을 수 없거나(손상된 파일 포함) 대상 포맷으로 내보낼 수 없다."""
+    INPUT_NOT_FOUND = "input_not_found"
+    """입력 파일이 없다."""
+    OUTPUT_MISSING = "output_missing"
+    """soffice는 성공했지만 출력 파일이 없다."""
+    QUARANTINED = "quarantined"
+    """이전 실행에서 반복해서 실패해 격리된 입력이라 실행하지 않았다."""
+    UNKNOWN = "unknown"
+    """그 밖의 실패."""
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Mapping, Union
+
+FilterValue = Union[bool, int, float, str]
+
+# LibreOffice 텍스트 인코딩 번호 (rtl_TextEncoding)
+_TEXT_ENCODINGS: dict[str, int] = {
+    "utf-8": 76,
+    "utf8": 76,
+    "iso-8859-1": 12,
+    "latin-1": 12,
+    "windows-1252": 1,
+    "cp1252": 1,
+    "ascii": 11,
+    "us-ascii": 11,
+}
+
+
+@dataclass(frozen=True)
+class FilterOptions:
+    """soffice ``--convert-to``에 넘길 출력 필터와 필터 옵션.
+
+    ``ext:FilterName:options`` 형태의 인자로 직렬화된다. 필터 이름을 지정하지
+    않으면 엔진이 입력·출력 포맷에 맞는 필터를 레지스트리에서 고른다.
+
+    Attributes:
+        filter_name: 출력 필터 이름. ``None``이면 레지스트리에서 고른다.
+        options: 필터별 토큰 문자열 (예: CSV의 ``"44,34,76,1"``).
+        properties: 필터 속성. LibreOffice 7.4 이상의 JSON 필터 옵션으로
+            직렬화한다. ``options``와 함께 지정할 수 없다.
+    """
+
+    filter_name: str | None = None
+    options: str | None = None
+    properties: Mapping[str, FilterValue] = field(default_factory=dict, hash=False)
+
+    def __post_init__(self) -> None:
+        if self.options and self.properties:
+            raise ValueError("options and properties are mutually exclusive")
+
+    def serialize(self) -> str:
+        """필터 옵션 부분만 직렬화한다. 옵션이 없으면 빈 문자열."""
+        if self.options:
+            return self.options
+        if not self.properties:
+            return ""
+        return json.dumps(
+            {name: _typed(value) for name, value in self.properties.items()},
+            separators=(",", ":"),
+        )
+
+    def convert_arg(self, extension: str, default_filter: str | None) -> str:
+        """``--convert-to`` 인자를 만든다.
+
+        사용할 필터 이름이 없으면 soffice가 필터를 고르도록 확장자만 반환하며,
+        이 경우 옵션은 전달되지 않는다.
+        """
+        filter_name = self.filter_name or default_filter
+        if not filter_name:
+            return extension
+        options = self.serialize()
+        if options:
+            return f"{extension}:{filter_name}:{options}"
+        return f"{extension}:{filter_name}"
+
+    def cache_token(self) -> str:
+        """변환 결과 캐시 키에 포함할 문자열."""
+        return f"{self.filter_name or ''}\0{self.serialize()}"
+
+    # -----------------------------------------------------------------
+    # Presets
+    # -----------------------------------------------------------------
+    @classmethod
+    def pdf_compact(cls, quality: int = 75, max_resolution: int = 150) -> FilterOptions:
+        """이미지를 다운샘플링·JPEG 압축해 작은 PDF를 만드는 프리셋.
+
+        Args:
+            quality: JPEG 품질 (1-100).
+            max_resolution: 이미지 최대 해상도(DPI).
+        """
+        if not 1 <= quality <= 100:
+            raise ValueError(f"quality must be in 1..100, got {quality}")
+        return cls(
+            properties={
+                "UseLosslessCompression": False,
+                "Quality": quality,
+                "ReduceImageResolution": True,
+                "MaxImageResolution": max_resolution,
+            }
+        )
+
+    @classmethod
+    def pdf_fast(cls) -> FilterOptions:
+        """태그·북마크·주석 등 부가 구조를 생략해 PDF 내보내기를 빠르게 하는 프리셋."""
+        return cls(
+            properties={
+                "UseTaggedPDF": False,
+                "ExportBookmarks": False,
+                "ExportNotes": False,
+                "ExportFormFields": False,
+                "EmbedStandardFonts": False,
+            }
+        )
+
+    @classmethod
+    def csv(
+        cls,
+        separator: str = ",",
+        quote: str = '"',
+        encoding: str = "utf-8",
+        sheet: int | None = None,
+    ) -> FilterOptions:
+        """CSV 구분자·인용 부호·인코딩을 지정하는 프리셋.
+
+        Args:
+            separator: 필드 구분자 (한 글자).
+            quote: 텍스트 인용 부호 (한 글자).
+            encoding: 출력 인코딩. ``utf-8``, ``iso-8859-1``, ``windows-1252``,
+                ``ascii`` 중 하나.
+            sheet: 내보낼 시트 번호(1부터). ``-1``이면 시트마다 파일을 만든다.
+                ``None``이면 첫 시트.
+        """
+        if len(separator) != 1 or len(quote) != 1:
+            raise ValueError("separator and quote must be single characters")
+        try:
+            charset = _TEXT_ENCODINGS[encoding.lower()]
+        except KeyError:
+            raise ValueError(f"Unsupported CSV encoding: {encoding}") from None
+        tokens = [str(ord(separator)), str(ord(quote)), str(charset), "1"]
+        if sheet is not None:
+            tokens += ["", "", "false", "true", "true", "false", "false", str(sheet)]
+        return cls(filter_name="Text - txt - csv (StarCalc)", options=",".join(tokens))
+
+
+def _typed(value: FilterValue) -> dict[str, str]:
+    """JSON 필터 옵션의 ``{"type": ..., "value": ...}`` 형식으로 변환한다."""
+    if isinstance(value, bool):
+        return {"type": "boolean", "value": "true" if value else "false"}
+    if isinstance(value, int):
+        return {"type": "long", "value": str(value)}
+    if isinstance(value, float):
+        return {"type": "double", "value": repr(value)}
+    return {"type": "string", "value": value}
@@ -1,8 +1,39 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class Succeed:
+    """변환 성공 결과.
+
+    경로 외의 필드는 실행 정보이며 동등 비교에 쓰이지 않는다. 여러 파일을 한
+    번에 변환한 경우 실행 시간·자원 사용량은 그 soffice 실행 전체의 값이다.
+
+    Attributes:
+        file_path: 원본 파일 경로.
+        output_path: 변환된 파일 경로.
+        wall_time: soffice 실행 시간(초). 여러 단계 경로면 합계.
+        cpu_time: soffice 프로세스의 CPU 시간(초). 측정할 수 없으면 ``None``.
+            워커 풀을 쓰면 변환을 상주 워커에 전달하는 클라이언트 프로세스의
+            값이며 워커 자신의 사용량은 포함되지 않는다.
+        max_rss: soffice 프로세스의 최대 RSS(바이트). 측정할 수 없으면 ``None``.
+            ``cpu_time``과 마찬가지로 워커 풀에서는 클라이언트만의 값이다.
+        input_size: 원본 파일 크기(바이트).
+        output_size: 출력 파일 크기(바이트).
+        worker_id: 변환을 처리한 상주 워커 번호. 워커 풀을 쓰지 않았으면 ``None``.
+        attempt: 몇 번째 시도에서 얻은 결과인지 (1부터).
+        timings: 단계 이름 -> 소요 시간(초). 엔진에 metrics를 지정했을 때만 채워진다.
+    """
+
     file_path: Path
     output_path: Path
+    wall_time: float | None = field(default=None, compare=False)
+    cpu_time: float | None = field(default=None, compare=False)
+    max_rss: int | None = field(default=None, compare=False)
+    input_size: int | None = field(default=None, compare=False)
+    output_size: int | None = field(default=None, compare=False)
+    worker_id: int | None = field(default=None, compare=False)
+    attempt: int = field(default=1, compare=False)
+    timings: dict[str, float] | None = field(default=None, compare=False, repr=False)
@@ -0,0 +1,272 @@
+"""여러 프로세스가 나눠 쓰는 머신 전역 동시 실행 슬롯.
+
+서비스 프로세스(gunicorn·celery 워커 등)마다 엔진을 만들면 각 엔진의
+``max_concurrency``가 따로 적용되어 머신 전체의 soffice 수가 프로세스 수만큼
+불어난다. :class:`SharedSlots`는 공유 디렉터리의 슬롯 파일
+(``slot-<번호>.lock``)에 ``flock``을 걸어 머신 전체의 동시 실행 수를 제한한다.
+
+- 잠금은 파일을 연 프로세스가 죽으면 커널이 풀어 주므로, 크래시한 프로세스가
+  쥐고 있던 슬롯은 따로 정리하지 않아도 회수된다.
+- 슬롯을 바로 얻지 못한 호출자는 번호표 파일(``wait-<번호>``)을 잠근 채
+  대기열에 서고, 가장 앞선 대기자만 빈 슬롯을 가져간다. 잠금이 풀린 번호표는
+  대기 중 죽은 프로세스의 것이므로 지운다.
+- 대기열 조작은 ``queue.lock``을 잠근 채로 수행한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+class _Ticket:
+    """대기열 번호표. 잠금을 쥐고 있는 동안 살아 있는 대기자로 취급된다."""
+
+    __slots__ = ("path", "fd")
+
+    def __init__(self, path: Path, fd: int):
+        self.path = path
+        self.fd = fd
+
+    def close(self) -> None:
+        self.path.unlink(missing_ok=True)
+        os.close(self.fd)
+
+
+class SharedSlots:
+    """``flock`` 기반의 프로세스 간 동시 실행 슬롯.
+
+    같은 ``directory``를 쓰는 모든 프로세스(와 스레드)가 ``slots``개의 슬롯을
+    나눠 쓴다. 슬롯 수는 디렉터리를 처음 만든 쪽의 값으로 고정되며, 다른 값을
+    넘기면 경고를 남기고 기존 값을 따른다.
+
+    Args:
+        directory: 슬롯·대기열 파일을 둘 디렉터리. 모든 프로세스가 같은 경로를
+            지정해야 한다.
+        slots: 머신 전체의 최대 동시 실행 수. ``None``이면 CPU 수.
+        poll_interval: 대기 중 빈 슬롯을 다시 확인하는 간격(초).
+
+    Raises:
+        RuntimeError: ``fcntl``을 쓸 수 없는 플랫폼일 때.
+
+    Example:
+        ::
+
+            slots = SharedSlots("/run/libreformer", slots=8)
+            engine = LibreOfficeEngine(max_concurrency=4, shared_slots=slots)
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        slots: int | None = None,
+        poll_interval: float = 0.05,
+    ):
+        if fcntl is None:
+            raise RuntimeError("SharedSlots requires fcntl.flock (POSIX only)")
+        if slots is not None and slots < 1:
+            raise ValueError(f"slots must be >= 1, got {slots}")
+        if poll_interval <= 0:
+            raise ValueError(f"poll_interval must be > 0, got {poll_interval}")
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._queue_lock():
+            self.slots = self._agree_slots(slots or os.cpu_count() or 4)
+
+    # -----------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------
+    @contextmanager
+    def lease(self) -> Iterator[int]:
+        """슬롯 하나를 얻을 때까지 기다렸다가 빌려준다.
+
+        Yields:
+            슬롯 번호.
+        """
+        ticket = None
+        try:
+            while True:
+                acquired, ticket = self._step(ticket)
+                if acquired is not None:
+                    break
+                time.sleep(self.poll_interval)
+        except BaseException:
+            if ticket is not None:
+                ticket.close()
+            raise
+        index, fd = acquired
+        try:
+            yield index
+        finally:
+            os.close(fd)
+
+    @asynccontextmanager
+    async def async_lease(self) -> AsyncIterator[int]:
+        """:meth:`lease`의 비동기 버전. 대기 중에는 이벤트 루프를 막지 않는다.
+
+        대기열 조작은 ``queue.lock``을 블로킹으로 잠그므로 스레드에서 실행한다.
+        조작 도중 취소되면 그 결과로 얻은 슬롯과 번호표는 끝나는 대로 반납한다.
+        """
+        ticket = None
+        try:
+            while True:
+                future = asyncio.ensure_future(asyncio.to_thread(self._step, ticket))
+                try:
+                    acquired, ticket = await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    owned, ticket = ticket, None
+                    future.add_done_callback(
+                        lambda f: self._release_abandoned(f, owned)
+                    )
+                    raise
+                if acquired is not None:
+                    break
+                await asyncio.sleep(self.poll_interval)
+        except BaseException:
+            if ticket is not None:
+                ticket.close()
+            raise
+        index, fd = acquired
+        try:
+            yield index
+        finally:
+            os.close(fd)
+
+    def in_use(self) -> int:
+        """현재 다른 호출자가 점유 중인 슬롯 수."""
+        busy = 0
+        for index in range(self.slots):
+            fd = self._open(f"slot-{index}.lock")
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                busy += 1
+            finally:
+                os.close(fd)
+        return busy
+
+    # -----------------------------------------------------------------
+    # Internals
+    # -----------------------------------------------------------------
+    def _open(self, name: str) -> int:
+        return os.open(self.directory / name, os.O_RDWR | os.O_CREAT, 0o666)
+
+    @contextmanager
+    def _queue_lock(self) -> Iterator[None]:
+        fd = self._open("queue.lock")
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _release_abandoned(future: asyncio.Future, ticket: _Ticket | None) -> None:
+        """취소된 :meth:`async_lease`가 남긴 ``_step`` 결과를 정리한다."""
+        if future.cancelled() or future.exception() is not None:
+            # _step이 실패하면 넘겨받은 번호표는 그대로 남아 있다
+            if ticket is not None:
+                ticket.close()
+            return
+        acquired, ticket = future.result()
+        if acquired is not None:
+            os.close(acquired[1])
+        if ticket is not None:
+            ticket.close()
+
+    def _agree_slots(self, slots: int) -> int:
+        path = self.directory / "slots"
+        try:
+            stored = int(path.read_text())
+        except (FileNotFoundError, ValueError):
+            path.write_text(f"{slots}\n")
+            return slots
+        if stored != slots:
+            logger.warning(
+                "공유 슬롯 수 불일치: 요청 {}, 기존 {} 사용 ({})",
+                slots,
+                stored,
+                self.directory,
+            )
+        return stored
+
+    def _step(
+        self, ticket: _Ticket | None
+    ) -> tuple[tuple[int, int] | None, _Ticket | None]:
+        """슬롯을 한 번 시도한다.
+
+        대기열이 비었거나 ``ticket``이 맨 앞이면 빈 슬롯을 찾는다. 얻지 못했고
+        아직 번호표가 없으면 대기열에 선다.
+
+        Returns:
+            ``((슬롯 번호, 파일 디스크립터) 또는 None, 번호표 또는 None)``.
+        """
+        with self._queue_lock():
+            waiters = self._live_waiters()
+            first = not waiters if ticket is None else waiters[0] == ticket.path
+            if first:
+                acquired = self._try_slot()
+                if acquired is not None:
+                    if ticket is not None:
+                        ticket.close()
+                    return acquired, None
+            if ticket is None:
+                ticket = self._enqueue()
+            return None, ticket
+
+    def _try_slot(self) -> tuple[int, int] | None:
+        for index in range(self.slots):
+            fd = self._open(f"slot-{index}.lock")
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            # 진단용으로 점유 프로세스를 기록한다
+            os.ftruncate(fd, 0)
+            os.pwrite(fd, f"{os.getpid()}\n".encode(), 0)
+            return index, fd
+        return None
+
+    def _enqueue(self) -> _Ticket:
+        counter = self.directory / "ticket"
+        try:
+            number = int(counter.read_text())
+        except (FileNotFoundError, ValueError):
+            number = 0
+        counter.write_text(f"{number + 1}\n")
+        path = self.directory / f"wait-{number:016d}"
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return _Ticket(path, fd)
+
+    def _live_waiters(self) -> list[Path]:
+        """살아 있는 대기자의 번호표를 순서대로 반환하고, 죽은 대기자의 것은 지운다."""
+        live = []
+        for path in sorted(self.directory.glob("wait-*")):
+            try:
+                fd = os.open(path, os.O_RDWR)
+            except FileNotFoundError:
+                continue
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                live.append(path)
+            else:
+                logger.debug("종료된 대기자의 번호표 정리: {}", path.name)
+                path.unlink(missing_ok=True)
+            finally:
+                os.close(fd)
+        return live
@@ -0,0 +1,394 @@
+"""UNO 브리지로 상주 soffice와 통신하는 변환 엔진.
+
+:class:`~libreformer.LibreOfficeEngine`은 변환마다 ``soffice --convert-to``를
+실행하므로, 워커 풀을 쓰더라도 요청마다 CLI 인자 해석과 단일 인스턴스 IPC를
+거친다. :class:`UnoEngine`은 ``--accept``로 대기하는 상주 soffice 워커에 UNO
+브리지로 연결해, 이미 초기화된 오피스 프로세스 안에서 문서를 ``Hidden``
+상태로 열고 ``storeToURL``로 저장한다.
+
+LibreOffice의 파이썬 바인딩(``uno`` 모듈, 보통 ``python3-uno`` 패키지)이
+필요하다. 변환 경로 계획과 결과 타입은 CLI 엔진과 같다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any, Sequence
+
+from .breaker import CircuitBreaker
+from .concurrency import ConcurrencyLimiter
+from .engine import BaseEngine
+from .logging import async_log_elapsed_time, log_elapsed_time
+from .metrics import ConversionMetrics, Stage
+from .pool import SofficeWorker, SofficeWorkerPool, WorkerStartError
+from .quarantine import Quarantine
+from .routing import RouteRun, RouteStep, plan_hops, route_scratch_dir
+from .schemas import Failed, FailureKind, FilterOptions, Succeed
+from .utils import check_install, get_path, install
+
+
+class _Uno:
+    """지연 로드한 ``uno`` 모듈과 자주 쓰는 UNO 타입."""
+
+    def __init__(self) -> None:
+        try:
+            import uno
+            from com.sun.star.beans import PropertyValue
+            from com.sun.star.connection import NoConnectException
+        except ImportError as e:
+            raise ImportError(
+                "UnoEngine requires the LibreOffice Python bindings (python3-uno)"
+            ) from e
+        self.uno = uno
+        self.PropertyValue = PropertyValue
+        self.NoConnectException = NoConnectException
+
+    def props(self, **values: Any) -> tuple:
+        """``PropertyValue`` 튜플을 만든다."""
+        result = []
+        for name, value in values.items():
+            prop = self.PropertyValue()
+            prop.Name = name
+            prop.Value = value
+            result.append(prop)
+        return tuple(result)
+
+    def url(self, path: Path) -> str:
+        return self.uno.systemPathToFileUrl(str(path))
+
+
+def split_convert_arg(convert_to: str) -> tuple[str, str | None, str | None]:
+    """``--convert-to`` 인자를 ``(확장자, 필터 이름, 필터 옵션)``으로 나눈다."""
+    extension, _, rest = convert_to.partition(":")
+    filter_name, _, options = rest.partition(":")
+    return extension, filter_name or None, options or None
+
+
+# 문서 모듈을 판별할 서비스. Impress 문서도 그리기 문서 서비스를 지원하므로
+# 프레젠테이션을 먼저 확인한다.
+_MODULE_SERVICES = (
+    ("com.sun.star.presentation.PresentationDocument", "impress"),
+    ("com.sun.star.drawing.DrawingDocument", "draw"),
+    ("com.sun.star.sheet.SpreadsheetDocument", "calc"),
+    ("com.sun.star.text.TextDocument", "writer"),
+)
+# 그래픽 확장자 -> 모듈별 내보내기 필터 이름의 포맷 토큰
+_GRAPHIC_FILTER_TOKENS = {
+    "png": "png",
+    "jpg": "jpg",
+    "jpeg": "jpg",
+    "svg": "svg",
+    "webp": "webp",
+}
+
+
+def graphic_export_filter(document: Any, extension: str) -> str | None:
+    """불러온 문서의 모듈에 맞는 그래픽 내보내기 필터 이름을 반환한다.
+
+    변환 경로는 그래픽 출력의 필터를 비워 두고 soffice CLI가 고르게 하지만,
+    ``storeToURL``은 필터 이름이 필요하다 (예: ``"writer_png_Export"``).
+    그래픽 포맷이 아니거나 모듈을 알 수 없으면 ``None``.
+    """
+    token = _GRAPHIC_FILTER_TOKENS.get(extension.lower())
+    if token is None:
+        return None
+    for service, module in _MODULE_SERVICES:
+        if document.supportsService(service):
+            return f"{module}_{token}_Export"
+    return None
+
+
+class UnoEngine(BaseEngine):
+    """상주 soffice 워커에 UNO 브리지로 변환을 요청하는 엔진.
+
+    ``max_concurrency``개의 워커를 지연 기동하며, 워커 하나는 한 번에 문서
+    하나를 변환한다. 변환이 ``timeout``을 넘기면 워커를 종료하고 실패로
+    기록하며, 종료된 워커는 다음 사용 시 재시작된다.
+
+    Raises:
+        ImportError: ``uno`` 모듈을 불러올 수 없을 때.
+    """
+
+    def __init__(
+        self,
+        auto_install: bool = True,
+        max_concurrency: int | None = None,
+        timeout: float = 300.0,
+        max_jobs_per_worker: int = 200,
+        startup_timeout: float = 30.0,
+        metrics: ConversionMetrics | None = None,
+        max_worker_rss: int | None = None,
+        max_worker_age: float | None = None,
+        quarantine: Quarantine | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        preflight: bool = True,
+    ):
+        """
+        Args:
+            auto_install: LibreOffice가 설치되어 있지 않을 때 자동으로 설치할지 여부
+            max_concurrency: 상주 워커 수이자 최대 동시 변환 수.
+                None이면 os.cpu_count() 사용.
+            timeout: 변환 단계 하나(불러오기+저장)의 타임아웃(초).
+            max_jobs_per_worker: 워커를 교체하기 전 처리할 최대 작업 수.
+            startup_timeout: 워커 기동과 UNO 연결 대기 시간(초).
+            metrics: 단계별 소요 시간을 기록할 계측기.
+            max_worker_rss: 워커 프로세스 트리의 RSS 한도(바이트).
+            max_worker_age: 워커 수명 한도(초).
+            quarantine: 격리 목록. 타임아웃·크래시를 기록하고, 격리된 입력은
+                실행하지 않고 실패시킨다.
+            circuit_breaker: 지정하면 크래시·타임아웃이 잦을 때 동시 변환 수를
+                낮춘다.
+            preflight: ``True``면 레지스트리가 불가능하다고 보는 변환을 워커에
+                보내지 않고 실패시킨다.
+        """
+        super().__init__(max_concurrency, metrics)
+        if timeout <= 0:
+            raise ValueError(f"timeout must be > 0, got {timeout}")
+        self._uno = _Uno()
+        self._timeout = timeout
+        self._startup_timeout = startup_timeout
+        self._quarantine = quarantine
+        self._circuit_breaker = circuit_breaker
+        self._preflight = preflight
+        # 워커 수보다 낮출 때(서킷 브레이커)만 실제로 대기가 생긴다
+        self._limiter = ConcurrencyLimiter(self._max_concurrency)
+        if circuit_breaker is not None:
+            circuit_breaker.subscribe(self._limiter.set_cap)
+
+        if auto_install and not check_install():
+            install()
+        self.libreoffice_path = get_path()
+
+        self._pool: SofficeWorkerPool | None = None
+        if self.libreoffice_path:
+            self._pool = SofficeWorkerPool(
+                self.libreoffice_path,
+                size=self._max_concurrency,
+                max_jobs_per_worker=max_jobs_per_worker,
+                startup_timeout=startup_timeout,
+                max_worker_rss=max_worker_rss,
+                max_worker_age=max_worker_age,
+            )
+        # 워커 번호 -> (연결한 프로세스 ID, Desktop)
+        self._desktops: dict[int, tuple[int | None, Any]] = {}
+        self._lock = threading.Lock()
+
+    # -----------------------------------------------------------------
+    # Lifecycle
+    # -----------------------------------------------------------------
+    def close(self) -> None:
+        """상주 워커를 종료한다."""
+        with self._lock:
+            self._desktops.clear()
+        if self._pool is not None:
+            self._pool.close()
+
+    def __enter__(self) -> "UnoEngine":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # -----------------------------------------------------------------
+    # Sync API
+    # -----------------------------------------------------------------
+    @log_elapsed_time("UNO file transformation")
+    def transform(
+        self, file_path: str, to: str, options: FilterOptions | None = None
+    ) -> Succeed | Failed:
+        """파일 하나를 상주 워커에서 변환합니다."""
+        return self._transform_many([file_path], to, options)[0]
+
+    @log_elapsed_time("UNO batch transformation")
+    def transform_batch(
+        self,
+        file_paths: Sequence[str],
+        to: str,
+        options: FilterOptions | None = None,
+    ) -> list[Succeed | Failed]:
+        """여러 파일을 차례로 변환하고 입력 순서대로 결과를 반환합니다."""
+        return self._transform_many(file_paths, to, options)
+
+    def _transform_many(
+        self,
+        file_paths: Sequence[str],
+        to: str,
+        options: FilterOptions | None = None,
+    ) -> list[Succeed | Failed]:
+        pending, failures = self._precheck(file_paths, to)
+        converted = [self._convert_one(p, to, options) for p in pending]
+        return self._merge_results(len(file_paths), failures, converted)
+
+    # -----------------------------------------------------------------
+    # Async API
+    # -----------------------------------------------------------------
+    @async_log_elapsed_time("UNO async file transformation")
+    async def async_transform(
+        self, file_path: str, to: str, options: FilterOptions | None = None
+    ) -> Succeed | Failed:
+        """:meth:`transform`의 비동기 버전. UNO 호출은 스레드에서 실행한다.
+
+        취소되어도 이미 시작한 변환은 끝까지 실행된다.
+        """
+        return (
+            await asyncio.to_thread(self._transform_many, [file_path], to, options)
+        )[0]
+
+    @async_log_elapsed_time("UNO async batch transformation")
+    async def async_transform_batch(
+        self,
+        file_paths: Sequence[str],
+        to: str,
+        options: FilterOptions | None = None,
+    ) -> list[Succeed | Failed]:
+        """:meth:`transform_batch`의 비동기 버전."""
+        return await asyncio.to_thread(self._transform_many, file_paths, to, options)
+
+    # -----------------------------------------------------------------
+    # Conversion
+    # -----------------------------------------------------------------
+    def _convert_one(
+        self, input_path: Path, to: str, options: FilterOptions | None
+    ) -> Succeed | Failed:
+        """변환 경로의 모든 단계를 같은 워커에서 차례로 실행한다."""
+        assert self._pool is not None
+        hops = plan_hops(input_path, to, options)
+        timer = self._new_timer(hops)
+        try:
+            started = timer.start()
+            with self._limiter, route_scratch_dir(hops) as scratch_dir:
+                with self._pool.lease() as worker:
+                    desktop = self._desktop(worker)
+                    timer.stop(Stage.PROFILE_SETUP, started)
+                    run = RouteRun([input_path], hops, scratch_dir, worker.worker_id)
+                    while (step := run.next_step()) is not None:
+                        begun = time.perf_counter()
+                        with timer.measure(Stage.SOFFICE_RUN):
+                            result = self._run_step(worker, desktop, step)
+                        if result is None:
+                            run.fail(
+                                f"Conversion timed out after {self._timeout}s",
+                                self._timeout,
+                                FailureKind.TIMEOUT,
+                            )
+                            break
+                        run.record([result], wall_time=time.perf_counter() - begun)
+                    started = timer.start()
+            timer.stop(Stage.CLEANUP, started)
+            results = run.results()
+            timer.attach(results)
+            self._observe([input_path], results)
+            return results[0]
+        except Exception as e:
+            return Failed(file_path=input_path, error_message=str(e))
+
+    def _run_step(
+        self, worker: SofficeWorker, desktop: Any, step: RouteStep
+    ) -> Succeed | Failed | None:
+        """문서 하나를 열어 저장한다. 타임아웃이면 워커를 종료하고 ``None``."""
+        (input_path,) = step.inputs
+        extension, filter_name, filter_options = split_convert_arg(step.convert_to)
+        output_path = step.output_dir / f"{input_path.stem}.{extension}"
+
+        expired = threading.Event()
+
+        def expire() -> None:
+            expired.set()
+            worker.stop(grace=0)
+
+        watchdog = threading.Timer(self._timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            load = {"Hidden": True, "ReadOnly": True}
+            if step.import_filter:
+                load["FilterName"] = step.import_filter
+            document = desktop.loadComponentFromURL(
+                self._uno.url(input_path.resolve()),
+                "_blank",
+                0,
+                self._uno.props(**load),
+            )
+            if document is None:
+                return Failed(
+                    input_path,
+                    "Document could not be loaded",
+                    kind=FailureKind.UNSUPPORTED_FORMAT,
+                )
+            try:
+                if filter_name is None:
+                    filter_name = graphic_export_filter(document, extension)
+                if filter_name is None:
+                    return Failed(
+                        input_path,
+                        f"No export filter known for {input_path.suffix} -> "
+                        f"{extension}",
+                        kind=FailureKind.UNSUPPORTED_FORMAT,
+                    )
+                store: dict[str, Any] = {"FilterName": filter_name, "Overwrite": True}
+                if filter_options:
+                    store["FilterOptions"] = filter_options
+                document.storeToURL(
+                    self._uno.url(output_path), self._uno.props(**store)
+                )
+            finally:
+                try:
+                    document.close(True)
+                except Exception:
+                    # 워커가 종료되어 브리지가 끊긴 경우
+                    pass
+        except Exception as e:
+            if expired.is_set():
+                return None
+            kind = FailureKind.UNKNOWN if worker.alive else FailureKind.CRASH
+            return Failed(input_path, f"UNO conversion failed: {e}", kind=kind)
+        finally:
+            watchdog.cancel()
+
+        if not output_path.exists():
+            return Failed(
+                input_path,
+                f"Conversion succeeded but output file not found: {output_path}",
+                kind=FailureKind.OUTPUT_MISSING,
+            )
+        return Succeed(input_path, output_path.resolve())
+
+    def _desktop(self, worker: SofficeWorker) -> Any:
+        """워커의 ``Desktop`` 객체. 워커가 재시작되었으면 다시 연결한다."""
+        with self._lock:
+            cached = self._desktops.get(worker.worker_id)
+        if cached is not None and cached[0] == worker.pid:
+            return cached[1]
+        desktop = self._connect(worker)
+        with self._lock:
+            self._desktops[worker.worker_id] = (worker.pid, desktop)
+        return desktop
+
+    def _connect(self, worker: SofficeWorker) -> Any:
+        """워커의 UNO 파이프에 연결해 ``Desktop``을 얻는다.
+
+        Raises:
+            WorkerStartError: 제한 시간 안에 연결하지 못했을 때.
+        """
+        local = self._uno.uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        url = f"uno:pipe,name={worker.pipe_name};urp;StarOffice.ComponentContext"
+        deadline = time.monotonic() + self._startup_timeout
+        while True:
+            try:
+                context = resolver.resolve(url)
+                break
+            except self._uno.NoConnectException:
+                if not worker.alive or time.monotonic() > deadline:
+                    raise WorkerStartError(
+                        f"cannot connect to soffice worker {worker.worker_id} over UNO"
+                    ) from None
+                time.sleep(0.05)
+        return context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
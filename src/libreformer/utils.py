@@ -1,5 +1,7 @@
 from invoke import run
 import logging
+import os
+import tempfile
 import shutil
 import shutil
 from loguru import logger
@@ -19,6 +21,17 @@ def get_path() -> str | None:
     return shutil.which("libreoffice")
 
 
+def fast_temp_dir() -> str:
+    """Return a RAM-backed temporary directory (``/dev/shm``) when available.
+
+    Falls back to the platform default temporary directory.
+    """
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK | os.X_OK):
+        return shm
+    return tempfile.gettempdir()
+
+
 def install() -> bool:
     """Install LibreOffice using `apt`.
 
@@ -6,6 +6,7 @@ one-time file generation across the entire test session.
 
 import pytest
 from pathlib import Path
+from typing import Callable
 import sys
 import os
 
@@ -36,6 +37,7 @@ from fixture_helpers.impress import (
     create_odp,
     create_empty_pptx,
 )
+from fixture_helpers.soffice import FakeSoffice, create_fake_soffice
 
 
 # ---------------------------------------------------------------------------
@@ -216,3 +218,56 @@ def special_chars_txt(tmp_path_factory: pytest.TempPathFactory) -> Path:
     tmp_dir = tmp_path_factory.mktemp("fixtures")
     path = tmp_dir / "special_chars.txt"
     return create_special_chars_txt(path)
+
+
+# ---------------------------------------------------------------------------
+# Fake soffice (engine behaviour without LibreOffice)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def fake_soffice(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> FakeSoffice:
+    """Install a fake soffice as the engine's LibreOffice executable."""
+    bin_dir = tmp_path_factory.mktemp("fake_soffice")
+    fake = FakeSoffice(
+        path=create_fake_soffice(bin_dir / "soffice"),
+        log_path=bin_dir / "invocations.jsonl",
+    )
+    monkeypatch.setenv("FAKE_SOFFICE_LOG", str(fake.log_path))
+    monkeypatch.setattr("libreformer.engine.get_path", lambda: str(fake.path))
+    return fake
+
+
+@pytest.fixture
+def make_inputs(tmp_path: Path) -> Callable[..., list[str]]:
+    """Factory that writes small input files under ``tmp_path``.
+
+    ``make_inputs("a.txt", "sub/b.docx")`` writes the named files (creating
+    subdirectories) and ``make_inputs(count=3)`` writes ``doc_0.txt`` to
+    ``doc_2.txt``; ``prefix`` changes that stem. Each file gets distinct text
+    unless ``content`` gives the text for all of them or ``size`` asks for that
+    many bytes. Returns the paths as strings, in order.
+    """
+
+    def make(
+        *names: str,
+        count: int = 0,
+        prefix: str = "doc",
+        content: str | None = None,
+        size: int | None = None,
+    ) -> list[str]:
+        names += tuple(f"{prefix}_{i}.txt" for i in range(count))
+        files = []
+        for name in names:
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if size is not None:
+                path.write_bytes(b"x" * size)
+            else:
+                path.write_text(f"Content of {name}" if content is None else content)
+            files.append(str(path))
+        return files
+
+    return make
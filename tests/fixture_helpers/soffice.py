@@ -0,0 +1,139 @@
+"""Stand-in ``soffice`` executable for exercising the engine without LibreOffice.
+
+The generated script understands the subset of the soffice command line the
+engine uses:
+
+- ``--accept=...``: behaves like a resident worker; creates ``<profile>/.lock``
+  and sleeps until terminated.
+- ``--terminate_after_init``: initializes ``<profile>/user`` and exits.
+- ``--convert-to <ext[:filter[:options]]> --outdir <dir> <inputs...>``: copies
+  each input to ``<dir>/<stem>.<ext>``.
+
+Input file names steer failure modes: ``*fail*`` exits with status 1,
+``*hang*`` sleeps far beyond any test timeout, ``*orphan*`` additionally spawns
+a sleeping child and records its pid in ``<outdir>/<name>.childpid``,
+``*crash*`` kills itself with SIGSEGV, ``*nooutput*`` exits 0 without
+writing anything and ``*flaky*`` fails like a fresh profile needing a restart
+(status 81) the first time it sees an input, then succeeds. Every invocation
+is appended as one JSON line to ``$FAKE_SOFFICE_LOG`` when it is set.
+"""
+
+import json
+import stat
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+_SCRIPT = r"""
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+
+argv = sys.argv[1:]
+log = os.environ.get("FAKE_SOFFICE_LOG")
+if log:
+    with open(log, "a") as fh:
+        fh.write(json.dumps({"pid": os.getpid(), "argv": argv}) + "\n")
+
+profile = None
+convert_to = None
+outdir = "."
+inputs = []
+accept = False
+init_only = False
+it = iter(argv)
+for arg in it:
+    if arg.startswith("-env:UserInstallation=file://"):
+        profile = arg[len("-env:UserInstallation=file://"):]
+    elif arg.startswith("--accept="):
+        accept = True
+    elif arg == "--terminate_after_init":
+        init_only = True
+    elif arg == "--convert-to":
+        convert_to = next(it)
+    elif arg == "--outdir":
+        outdir = next(it)
+    elif arg.startswith("-"):
+        continue
+    else:
+        inputs.append(arg)
+
+if profile:
+    os.makedirs(os.path.join(profile, "user"), exist_ok=True)
+
+if accept:
+    open(os.path.join(profile, ".lock"), "w").close()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    while True:
+        time.sleep(0.1)
+
+if init_only:
+    with open(os.path.join(profile, "user", "registrymodifications.xcu"), "w") as fh:
+        fh.write("<oor:items/>")
+    sys.exit(0)
+
+delay = float(os.environ.get("FAKE_SOFFICE_DELAY", "0"))
+ext = convert_to.split(":", 1)[0]
+status = 0
+for src in inputs:
+    name = os.path.basename(src)
+    if "orphan" in name:
+        # Mimic the soffice wrapper leaving a hung soffice.bin child behind.
+        child = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(3600)"]
+        )
+        with open(os.path.join(outdir, name + ".childpid"), "w") as fh:
+            fh.write(str(child.pid))
+        time.sleep(3600)
+    if "hang" in name:
+        time.sleep(3600)
+    if "crash" in name:
+        os.kill(os.getpid(), signal.SIGSEGV)
+    if "fail" in name:
+        print("Error: source file could not be loaded", file=sys.stderr)
+        status = 1
+        continue
+    if "flaky" in name and not os.path.exists(src + ".attempted"):
+        open(src + ".attempted", "w").close()
+        print("Error: user installation could not be completed", file=sys.stderr)
+        status = 81
+        continue
+    if delay:
+        time.sleep(delay)
+    if "nooutput" in name:
+        continue
+    stem = os.path.splitext(name)[0]
+    shutil.copyfile(src, os.path.join(outdir, stem + "." + ext))
+    print("convert %s -> %s" % (src, ext))
+sys.exit(status)
+"""
+
+
+def create_fake_soffice(path: Path) -> Path:
+    """Write an executable fake soffice script to *path* and return it."""
+    path.write_text(f"#!{sys.executable}\n{_SCRIPT}")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+@dataclass
+class FakeSoffice:
+    """Handle to an installed fake soffice and its invocation log."""
+
+    path: Path
+    log_path: Path
+
+    def invocations(self) -> list[list[str]]:
+        """Return the argv of every recorded invocation, oldest first."""
+        if not self.log_path.exists():
+            return []
+        lines = self.log_path.read_text().splitlines()
+        return [json.loads(line)["argv"] for line in lines]
+
+    def conversions(self) -> list[list[str]]:
+        """Return only invocations that requested a conversion."""
+        return [argv for argv in self.invocations() if "--convert-to" in argv]
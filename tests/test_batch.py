@@ -0,0 +1,95 @@
+"""다중 파일 배치 변환 테스트.
+
+가짜 soffice의 호출 기록으로 한 번의 실행에 여러 파일이 묶이는지 검증한다.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from libreformer import FailureKind, LibreOfficeEngine, Succeed, Failed
+from libreformer.jobs import iter_batches
+
+
+class TestIterBatches:
+    def test_chunks_by_size(self):
+        jobs = [(f"/d/f{i}.txt", "pdf") for i in range(5)]
+        batches = list(iter_batches(jobs, 2))
+        assert [len(chunk) for _, chunk in batches] == [2, 2, 1]
+
+    def test_groups_by_target_and_parent(self):
+        jobs = [
+            ("/a/x.txt", "pdf"),
+            ("/b/y.txt", "pdf"),
+            ("/a/z.txt", "html"),
+            ("/a/w.txt", "pdf"),
+        ]
+        batches = list(iter_batches(jobs, 10))
+        assert batches == [
+            ("pdf", ["/a/x.txt", "/a/w.txt"]),
+            ("pdf", ["/b/y.txt"]),
+            ("html", ["/a/z.txt"]),
+        ]
+
+    def test_same_stem_never_shares_a_batch(self):
+        jobs = [("/d/report.docx", "pdf"), ("/d/report.txt", "pdf")]
+        batches = list(iter_batches(jobs, 10))
+        assert len(batches) == 2
+
+
+class TestBatchedTransform:
+    def test_transform_batch_single_invocation(self, fake_soffice, make_inputs):
+        files = make_inputs(count=4)
+        engine = LibreOfficeEngine(auto_install=False)
+        results = engine.transform_batch(files, "pdf")
+        assert [r.file_path for r in results] == [Path(f) for f in files]
+        assert all(isinstance(r, Succeed) and r.output_path.exists() for r in results)
+        assert len(fake_soffice.conversions()) == 1
+
+    def test_transform_batch_maps_partial_failures(
+        self, fake_soffice, tmp_path: Path, make_inputs
+    ):
+        files = make_inputs("good.txt", "nooutput.txt")
+        files.append(str(tmp_path / "missing.txt"))
+        engine = LibreOfficeEngine(auto_install=False)
+        good, no_output, missing = engine.transform_batch(files, "pdf")
+        assert isinstance(good, Succeed)
+        assert isinstance(no_output, Failed)
+        assert "output file not found" in no_output.error_message
+        assert isinstance(missing, Failed)
+        assert missing.error_message == "File not found"
+
+    def test_missing_output_ignores_similar_names(self, fake_soffice, make_inputs):
+        # 이전 실행이 남긴 비슷한 이름의 파일을 결과로 집지 않아야 한다
+        files = make_inputs("nooutput.txt")
+        make_inputs("nooutput_old.pdf")
+        engine = LibreOfficeEngine(auto_install=False)
+        (result,) = engine.transform_batch(files, "pdf")
+        assert isinstance(result, Failed)
+        assert result.kind is FailureKind.OUTPUT_MISSING
+
+    def test_transform_parallel_batch_size(self, fake_soffice, make_inputs):
+        files = make_inputs(count=7)
+        engine = LibreOfficeEngine(auto_install=False)
+        results = list(engine.transform_parallel(files, "pdf", batch_size=3))
+        assert len(results) == 7
+        assert all(isinstance(r, Succeed) for r in results)
+        assert len(fake_soffice.conversions()) == 3
+
+    def test_invalid_batch_size(self, tmp_path: Path):
+        engine = LibreOfficeEngine(auto_install=False)
+        with pytest.raises(ValueError, match="batch_size must be >= 1"):
+            list(engine.transform_parallel([str(tmp_path / "a.txt")], "pdf", 0))
+
+    @pytest.mark.asyncio
+    async def test_async_transform_parallel_batch_size(self, fake_soffice, make_inputs):
+        files = make_inputs("a/x.txt", "a/y.txt", "a/z.txt")
+        files += make_inputs("b/x.txt")
+        engine = LibreOfficeEngine(auto_install=False)
+        results = [
+            r async for r in engine.async_transform_parallel(files, "pdf", batch_size=8)
+        ]
+        assert len(results) == 4
+        assert all(isinstance(r, Succeed) for r in results)
+        # 디렉터리가 다른 파일은 별도 실행
+        assert len(fake_soffice.conversions()) == 2
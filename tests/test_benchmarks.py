@@ -0,0 +1,70 @@
+"""벤치마크 하네스(집계·스윕 계획·회귀 비교) 테스트."""
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.corpus import build_corpus
+from benchmarks.run import DEFAULT_MODES, Case, compare, plan_cases, run_case
+from benchmarks.stats import percentile, summarize_latencies
+
+
+class TestStats:
+    def test_percentile_interpolates(self):
+        values = [1.0, 2.0, 3.0, 4.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+        assert percentile([], 95) == 0.0
+
+    def test_summary_in_milliseconds(self):
+        summary = summarize_latencies([0.1, 0.2, 0.3])
+        assert summary["p50"] == 200.0
+        assert summary["max"] == 300.0
+
+
+class TestSweep:
+    def test_sequential_mode_runs_once(self):
+        cases = plan_cases(["writer"], ["transform", "async-batched"], [1, 4], 8)
+        assert cases == [
+            Case("writer", "transform", 1, None),
+            Case("writer", "async-batched", 1, 8),
+            Case("writer", "async-batched", 4, 8),
+        ]
+
+    def test_uno_mode_is_opt_in(self):
+        assert "uno" not in DEFAULT_MODES
+        (case,) = plan_cases(["writer"], ["uno"], [2], 8)
+        assert case == Case("writer", "uno", 2, None)
+
+    def test_compare_flags_regressions(self):
+        def report(fps: float, p95: float) -> dict:
+            return {
+                "results": [
+                    {
+                        "corpus": "calc",
+                        "mode": "parallel",
+                        "concurrency": 2,
+                        "batch_size": None,
+                        "files_per_sec": fps,
+                        "latency_ms": {"p95": p95},
+                    }
+                ]
+            }
+
+        assert compare(report(95.0, 10.5), report(100.0, 10.0), 0.10) == []
+        regressions = compare(report(80.0, 12.0), report(100.0, 10.0), 0.10)
+        assert len(regressions) == 2
+        assert regressions[0].startswith("calc/parallel/2/None")
+
+
+@pytest.mark.parametrize("mode", ["transform", "parallel-batched", "async", "pooled"])
+def test_run_case(fake_soffice, tmp_path: Path, mode: str):
+    files = build_corpus("calc", 4, tmp_path / "calc")
+    assert [f.suffix for f in files] == [".xlsx", ".ods", ".csv", ".tsv"]
+
+    result = run_case(Case("calc", mode, 2, 2), files, "pdf")
+    assert result["succeeded"] == 4
+    assert result["files_per_sec"] > 0
+    assert result["latency_ms"]["p50"] > 0
+    assert result["peak_rss_mb"] > 0
@@ -0,0 +1,81 @@
+"""메모리 입출력 변환 API 테스트."""
+
+import io
+import mmap
+from pathlib import Path
+
+import pytest
+
+from libreformer import ConversionError, Failed, LibreOfficeEngine
+
+
+@pytest.fixture
+def engine(fake_soffice) -> LibreOfficeEngine:
+    return LibreOfficeEngine(auto_install=False)
+
+
+class TestTransformBytes:
+    @pytest.mark.parametrize(
+        "data",
+        [b"hello", bytearray(b"hello"), memoryview(b"hello"), io.BytesIO(b"hello")],
+        ids=["bytes", "bytearray", "memoryview", "fileobj"],
+    )
+    def test_input_kinds(self, engine: LibreOfficeEngine, data):
+        assert engine.transform_bytes(data, "txt", "pdf") == b"hello"
+
+    def test_extension_is_normalized(self, engine: LibreOfficeEngine, fake_soffice):
+        engine.transform_bytes(b"x", ".DOCX", "pdf")
+        (argv,) = fake_soffice.conversions()
+        assert Path(argv[-1]).name == "input.docx"
+
+    def test_mmap(self, engine: LibreOfficeEngine):
+        out = engine.transform_bytes(b"hello", "txt", "pdf", as_mmap=True)
+        assert isinstance(out, mmap.mmap)
+        # 임시 파일이 지워진 뒤에도 매핑은 유효하다
+        assert out[:] == b"hello"
+        out.close()
+
+    def test_empty_output_with_mmap(self, engine: LibreOfficeEngine):
+        assert engine.transform_bytes(b"", "txt", "pdf", as_mmap=True) == b""
+
+    def test_ignores_engine_output_dir(self, fake_soffice, tmp_path: Path):
+        out = tmp_path / "out"
+        engine = LibreOfficeEngine(auto_install=False, output_dir=out, staging=True)
+        assert engine.transform_bytes(b"hello", "txt", "pdf") == b"hello"
+        assert not list(out.iterdir())
+
+    def test_leaves_no_files_behind(self, engine: LibreOfficeEngine, fake_soffice):
+        engine.transform_bytes(b"hello", "txt", "pdf")
+        (argv,) = fake_soffice.conversions()
+        assert not Path(argv[-1]).parent.exists()
+
+    def test_failure_raises(self, fake_soffice):
+        # 가짜 soffice는 이름에 "fail"이 들어간 입력을 실패시킨다.
+        # "fail"은 레지스트리에 없는 확장자이므로 사전 검사를 끈다.
+        engine = LibreOfficeEngine(auto_install=False, preflight=False)
+        with pytest.raises(ConversionError) as excinfo:
+            engine.transform_bytes(b"x", "fail", "pdf")
+        assert isinstance(excinfo.value.result, Failed)
+        assert "could not be loaded" in str(excinfo.value)
+
+    def test_missing_soffice_raises(self, engine: LibreOfficeEngine):
+        engine.libreoffice_path = None
+        with pytest.raises(ConversionError, match="LibreOffice not found"):
+            engine.transform_bytes(b"x", "txt", "pdf")
+
+    def test_empty_extension(self, engine: LibreOfficeEngine):
+        with pytest.raises(ValueError, match="from_ext"):
+            engine.transform_bytes(b"x", ".", "pdf")
+
+
+class TestAsyncTransformBytes:
+    @pytest.mark.asyncio
+    async def test_roundtrip(self, engine: LibreOfficeEngine, fake_soffice):
+        assert await engine.async_transform_bytes(b"hello", "txt", "pdf") == b"hello"
+        (argv,) = fake_soffice.conversions()
+        assert not Path(argv[-1]).parent.exists()
+
+    @pytest.mark.asyncio
+    async def test_failure_raises(self, engine: LibreOfficeEngine):
+        with pytest.raises(ConversionError):
+            await engine.async_transform_bytes(io.BytesIO(b"x"), "fail", "pdf")
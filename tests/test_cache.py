@@ -0,0 +1,167 @@
+"""변환 결과 캐시 테스트."""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from libreformer import ConversionCache, LibreOfficeEngine, Succeed
+
+
+class TestConversionCache:
+    def test_key_depends_on_content_format_and_options(self, make_inputs):
+        a, b = map(Path, make_inputs("a.txt", "b.txt", content="same"))
+        (c,) = map(Path, make_inputs("c.txt", content="different"))
+        assert ConversionCache.key(a, "pdf") == ConversionCache.key(b, "pdf")
+        assert ConversionCache.key(a, "pdf") != ConversionCache.key(c, "pdf")
+        assert ConversionCache.key(a, "pdf") != ConversionCache.key(a, "html")
+        assert ConversionCache.key(a, "pdf") != ConversionCache.key(a, "pdf", "opts")
+
+    def test_key_depends_on_extension_and_route(self, make_inputs):
+        txt, csv = map(Path, make_inputs("t.txt", "s.csv", content="a,b"))
+        assert ConversionCache.key(txt, "pdf") != ConversionCache.key(csv, "pdf")
+        assert ConversionCache.key(txt, "pdf", route="pdf:writer_pdf_Export") != (
+            ConversionCache.key(txt, "pdf", route="pdf:calc_pdf_Export")
+        )
+
+    def test_put_get_and_stats(self, tmp_path: Path, make_inputs):
+        cache = ConversionCache(tmp_path / "cache")
+        (output,) = map(Path, make_inputs("out.pdf", content="pdf bytes"))
+        assert cache.get("ab" * 32) is None
+        cache.put("ab" * 32, output)
+        cached = cache.get("ab" * 32)
+        assert cached is not None and cached.read_text() == "pdf bytes"
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+        assert stats.bytes_served == len("pdf bytes")
+
+    def test_size_based_lru_eviction(self, tmp_path: Path, make_inputs):
+        cache = ConversionCache(tmp_path / "cache", max_bytes=25)
+        (out,) = map(Path, make_inputs("out.pdf", content="x" * 10))
+        cache.put("aa" * 32, out)
+        cache.put("bb" * 32, out)
+        assert cache.get("aa" * 32) is not None  # aa가 가장 최근 접근
+        cache.put("cc" * 32, out)
+        assert cache.get("bb" * 32) is None
+        assert cache.get("aa" * 32) is not None
+        assert cache.total_bytes <= 25
+        assert cache.stats.evictions == 1
+
+    def test_age_based_eviction(self, tmp_path: Path, make_inputs):
+        cache = ConversionCache(tmp_path / "cache", max_age=60)
+        cache.put("aa" * 32, Path(make_inputs("out.pdf", content="x")[0]))
+        cache._entries["aa" * 32].last_access -= 120
+        assert cache.get("aa" * 32) is None
+        assert len(cache) == 0
+
+    def test_index_survives_restart(self, tmp_path: Path, make_inputs):
+        cache = ConversionCache(tmp_path / "cache")
+        cache.put("aa" * 32, Path(make_inputs("out.pdf", content="x")[0]))
+        reopened = ConversionCache(tmp_path / "cache")
+        assert reopened.get("aa" * 32) is not None
+
+    def test_materialize_copy_and_hardlink(self, tmp_path: Path, make_inputs):
+        (cached,) = map(Path, make_inputs("cached.pdf", content="x"))
+        copy = ConversionCache(tmp_path / "c1").materialize(cached, tmp_path / "a.pdf")
+        assert copy.read_text() == "x"
+        assert os.stat(copy).st_ino != os.stat(cached).st_ino
+        linked = ConversionCache(tmp_path / "c2", hardlink=True).materialize(
+            cached, tmp_path / "b.pdf"
+        )
+        assert os.stat(linked).st_ino == os.stat(cached).st_ino
+
+    def test_fetch_counts_failed_placement_as_miss(self, tmp_path: Path, make_inputs):
+        cache = ConversionCache(tmp_path / "cache")
+        cache.put("ab" * 32, Path(make_inputs("out.pdf", content="pdf bytes")[0]))
+        missing_dir = tmp_path / "missing" / "dest.pdf"
+        assert cache.fetch("ab" * 32, missing_dir) is None
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.bytes_served) == (0, 1, 0)
+        placed = cache.fetch("ab" * 32, tmp_path / "dest.pdf")
+        assert placed is not None and placed.read_text() == "pdf bytes"
+        assert cache.stats.hits == 1
+
+    def test_invalid_limits(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="max_bytes"):
+            ConversionCache(tmp_path, max_bytes=0)
+        with pytest.raises(ValueError, match="max_age"):
+            ConversionCache(tmp_path, max_age=-1)
+
+
+class TestEngineCache:
+    def test_identical_inputs_convert_once(
+        self, fake_soffice, tmp_path: Path, make_inputs
+    ):
+        cache = ConversionCache(tmp_path / "cache")
+        first, second = make_inputs(
+            "one/template.txt", "two/upload.txt", content="same body"
+        )
+        with LibreOfficeEngine(auto_install=False, cache=cache) as engine:
+            r1 = engine.transform(str(first), "pdf")
+            r2 = engine.transform(str(second), "pdf")
+        assert isinstance(r1, Succeed) and isinstance(r2, Succeed)
+        assert r2.output_path == (tmp_path / "two" / "upload.pdf").resolve()
+        assert r2.output_path.read_text() == "same body"
+        assert len(fake_soffice.conversions()) == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert r2.input_size == len("same body")
+        assert r2.output_size == r2.output_path.stat().st_size
+
+    def test_same_bytes_different_extension_miss(
+        self, fake_soffice, tmp_path: Path, make_inputs
+    ):
+        cache = ConversionCache(tmp_path / "cache")
+        txt, csv = make_inputs("t.txt", "s.csv", content="a,b")
+        with LibreOfficeEngine(auto_install=False, cache=cache) as engine:
+            engine.transform(str(txt), "pdf")
+            result = engine.transform(str(csv), "pdf")
+        assert isinstance(result, Succeed)
+        assert len(fake_soffice.conversions()) == 2
+        assert (cache.stats.hits, cache.stats.misses) == (0, 2)
+
+    @pytest.mark.asyncio
+    async def test_async_cache_hit(self, fake_soffice, tmp_path: Path, make_inputs):
+        cache = ConversionCache(tmp_path / "cache")
+        (src,) = make_inputs("doc.txt", content="body")
+        with LibreOfficeEngine(auto_install=False, cache=cache) as engine:
+            await engine.async_transform(str(src), "pdf")
+            (tmp_path / "doc.pdf").unlink()
+            result = await engine.async_transform(str(src), "pdf")
+        assert isinstance(result, Succeed)
+        assert result.output_path.exists()
+        assert len(fake_soffice.conversions()) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_store_runs_off_loop(
+        self, fake_soffice, tmp_path: Path, make_inputs, monkeypatch
+    ):
+        cache = ConversionCache(tmp_path / "cache")
+        threads: list[int] = []
+        original_put = cache.put
+
+        def spy(key, output_path):
+            threads.append(threading.get_ident())
+            original_put(key, output_path)
+
+        monkeypatch.setattr(cache, "put", spy)
+        (src,) = make_inputs("doc.txt", content="body")
+        with LibreOfficeEngine(auto_install=False, cache=cache) as engine:
+            result = await engine.async_transform(str(src), "pdf")
+        assert isinstance(result, Succeed)
+        assert threads and threading.get_ident() not in threads
+        assert len(cache) == 1
+
+    def test_batch_mixes_hits_and_misses(
+        self, fake_soffice, tmp_path: Path, make_inputs
+    ):
+        cache = ConversionCache(tmp_path / "cache")
+        (cached,) = make_inputs("a.txt", content="A")
+        (fresh,) = make_inputs("b.txt", content="B")
+        with LibreOfficeEngine(auto_install=False, cache=cache) as engine:
+            engine.transform(str(cached), "pdf")
+            results = engine.transform_batch([str(cached), str(fresh)], "pdf")
+        assert all(isinstance(r, Succeed) for r in results)
+        last = fake_soffice.conversions()[-1]
+        assert str(fresh) in last and str(cached) not in last
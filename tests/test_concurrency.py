@@ -0,0 +1,230 @@
+"""적응형 동시성 리미터 테스트."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from libreformer import AdaptiveConcurrency, LibreOfficeEngine, Succeed
+from libreformer import concurrency
+from libreformer.concurrency import AdaptiveLimiter, ConcurrencyLimiter
+
+
+def _limiter(monkeypatch, memory=None, cpu=None, **config) -> AdaptiveLimiter:
+    monkeypatch.setattr(concurrency, "available_memory", lambda: memory)
+    limiter = AdaptiveLimiter(
+        AdaptiveConcurrency(adjust_interval=0, **config), config.get("initial", 2)
+    )
+    monkeypatch.setattr(limiter._cpu, "utilization", lambda: cpu)
+    return limiter
+
+
+class TestConfig:
+    def test_validation(self):
+        with pytest.raises(ValueError, match="min_concurrency"):
+            AdaptiveConcurrency(min_concurrency=0)
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AdaptiveConcurrency(min_concurrency=4, max_concurrency=2)
+        with pytest.raises(ValueError, match="latency_tolerance"):
+            AdaptiveConcurrency(latency_tolerance=1.0)
+
+    def test_initial_is_clamped(self):
+        config = AdaptiveConcurrency(min_concurrency=2, max_concurrency=4)
+        assert AdaptiveLimiter(config, 1).limit == 2
+        assert AdaptiveLimiter(config, 16).limit == 4
+
+
+class TestLimiter:
+    @pytest.mark.asyncio
+    async def test_caps_and_wakes_in_order(self):
+        limiter = AdaptiveLimiter(AdaptiveConcurrency(adjust_interval=3600), 1)
+        order = []
+
+        async def job(i: int):
+            async with limiter:
+                order.append(i)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(job(i) for i in range(4)))
+        assert order == [0, 1, 2, 3]
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_releases_nothing(self):
+        limiter = AdaptiveLimiter(AdaptiveConcurrency(adjust_interval=3600), 1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+        assert limiter.in_flight == 0
+        await limiter.acquire()
+        assert limiter.in_flight == 1
+
+
+class TestCrossLoop:
+    def test_loops_in_threads_share_limit(self):
+        limiter = ConcurrencyLimiter(2)
+        lock = threading.Lock()
+        active = peak = 0
+
+        async def job():
+            nonlocal active, peak
+            async with limiter:
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                await asyncio.sleep(0.02)
+                with lock:
+                    active -= 1
+
+        async def many():
+            await asyncio.gather(*(job() for _ in range(3)))
+
+        threads = [
+            threading.Thread(target=asyncio.run, args=(many(),)) for _ in range(3)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    def test_sync_and_async_share_limit(self):
+        limiter = ConcurrencyLimiter(1)
+        order = []
+
+        def hold():
+            with limiter:
+                order.append("sync")
+                time.sleep(0.05)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        while limiter.in_flight == 0:
+            time.sleep(0.001)
+
+        async def run():
+            async with limiter:
+                order.append("async")
+
+        asyncio.run(run())
+        thread.join()
+        assert order == ["sync", "async"]
+        assert limiter.in_flight == 0
+
+    def test_reusable_after_loop_closes(self):
+        limiter = ConcurrencyLimiter(1)
+
+        async def run():
+            async with limiter:
+                await asyncio.sleep(0)
+
+        asyncio.run(run())
+        asyncio.run(run())
+        assert limiter.in_flight == 0
+
+
+class TestAdjustment:
+    def test_grows_when_saturated_and_idle(self, monkeypatch):
+        limiter = _limiter(monkeypatch, memory=8 * 1024**3, cpu=0.2, max_concurrency=3)
+        limiter._in_flight = limiter.limit
+        assert limiter._decide() == 3
+        limiter._limit = 3
+        assert limiter._decide() == 3
+
+    def test_holds_when_not_saturated(self, monkeypatch):
+        limiter = _limiter(monkeypatch, memory=8 * 1024**3, cpu=0.2)
+        assert limiter._decide() == limiter.limit
+
+    def test_shrinks_on_low_memory(self, monkeypatch):
+        limiter = _limiter(monkeypatch, memory=1024, cpu=0.1, max_concurrency=8)
+        limiter._limit = 8
+        assert limiter._decide() == 6
+
+    def test_shrinks_on_busy_cpu(self, monkeypatch):
+        limiter = _limiter(monkeypatch, cpu=0.99)
+        limiter._in_flight = limiter.limit
+        assert limiter._decide() == 1
+
+    def test_shrinks_on_latency_spike(self, monkeypatch):
+        limiter = _limiter(monkeypatch, cpu=0.1)
+        for _ in range(50):
+            limiter._short.update(1.0)
+            limiter._long.update(1.0)
+        for _ in range(10):
+            limiter._short.update(5.0)
+        assert limiter._decide() == 1
+
+    def test_never_below_floor(self, monkeypatch):
+        limiter = _limiter(monkeypatch, memory=0, min_concurrency=2)
+        assert limiter._decide() == 2
+
+    def test_release_applies_new_limit(self, monkeypatch):
+        limiter = _limiter(monkeypatch, cpu=0.99)
+        limiter._in_flight = 2
+        limiter.release(0.1)
+        assert limiter.limit == 1
+
+
+def test_cgroup_v2_available(tmp_path: Path, monkeypatch):
+    (tmp_path / "memory.max").write_text("1000\n")
+    (tmp_path / "memory.current").write_text("400\n")
+    monkeypatch.setattr(concurrency, "_CGROUP_ROOT", tmp_path)
+    assert concurrency._cgroup_available() == 600
+    (tmp_path / "memory.max").write_text("max\n")
+    assert concurrency._cgroup_available() is None
+
+
+@pytest.mark.asyncio
+async def test_engine_uses_adaptive_limiter(fake_soffice, tmp_path: Path):
+    files = []
+    for i in range(4):
+        f = tmp_path / f"doc_{i}.txt"
+        f.write_text("x")
+        files.append(str(f))
+    engine = LibreOfficeEngine(
+        auto_install=False,
+        max_concurrency=2,
+        adaptive_concurrency=AdaptiveConcurrency(max_concurrency=3),
+    )
+    results = [r async for r in engine.async_transform_parallel(files, "pdf")]
+    assert all(isinstance(r, Succeed) for r in results)
+    limiter = engine._limiter
+    assert isinstance(limiter, AdaptiveLimiter)
+    assert 1 <= limiter.limit <= 3
+    assert limiter.in_flight == 0
+
+
+def test_engine_shared_across_event_loops(fake_soffice, tmp_path: Path):
+    files = []
+    for i in range(6):
+        f = tmp_path / f"doc_{i}.txt"
+        f.write_text("x")
+        files.append(str(f))
+    engine = LibreOfficeEngine(auto_install=False, max_concurrency=2)
+
+    async def convert(paths):
+        return [r async for r in engine.async_transform_parallel(paths, "pdf")]
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda chunk=files[i::3]: results.extend(asyncio.run(convert(chunk)))
+        )
+        for i in range(3)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    # 두 번째 루프에서 다시 써도 동작한다
+    results.append(asyncio.run(engine.async_transform(files[0], "pdf")))
+    assert len(results) == 7
+    assert all(isinstance(r, Succeed) for r in results)
+    assert engine._limiter.in_flight == 0
@@ -0,0 +1,61 @@
+"""동기 병렬 디스패처(스레드 기반)의 동시성·타임아웃 테스트."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from libreformer import LibreOfficeEngine, Succeed, Failed
+
+
+def test_parallel_uses_thread_executor():
+    engine = LibreOfficeEngine(auto_install=False, max_concurrency=3)
+    executor = engine._make_executor()
+    try:
+        assert isinstance(executor, ThreadPoolExecutor)
+        assert executor._max_workers == 3
+    finally:
+        executor.shutdown()
+
+
+def test_parallel_respects_max_concurrency(fake_soffice, make_inputs, monkeypatch):
+    monkeypatch.setenv("FAKE_SOFFICE_DELAY", "0.2")
+    files = make_inputs(count=6)
+    engine = LibreOfficeEngine(auto_install=False, max_concurrency=2)
+
+    lock = threading.Lock()
+    active = peak = 0
+    run_group = engine._run_group
+
+    def counting_run_group(*args):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            return run_group(*args)
+        finally:
+            with lock:
+                active -= 1
+
+    monkeypatch.setattr(engine, "_run_group", counting_run_group)
+    results = list(engine.transform_parallel(files, "pdf"))
+    assert all(isinstance(r, Succeed) for r in results)
+    assert peak == 2
+
+
+def test_sync_transform_honours_timeout(fake_soffice, make_inputs):
+    (hang,) = make_inputs("hang.txt")
+    engine = LibreOfficeEngine(auto_install=False, timeout=0.5)
+    start = time.monotonic()
+    result = engine.transform(hang, "pdf")
+    assert time.monotonic() - start < 10
+    assert isinstance(result, Failed)
+    assert "timed out" in result.error_message
+
+
+def test_parallel_timeout_does_not_block_other_files(fake_soffice, make_inputs):
+    files = make_inputs("hang.txt", "good.txt")
+    engine = LibreOfficeEngine(auto_install=False, timeout=0.5)
+    results = {r.file_path.name: r for r in engine.transform_parallel(files, "pdf")}
+    assert isinstance(results["hang.txt"], Failed)
+    assert isinstance(results["good.txt"], Succeed)
@@ -0,0 +1,152 @@
+"""출력 필터 이름·옵션과 프로필 설정 테스트."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from libreformer import ConversionCache, FilterOptions, LibreOfficeEngine, Succeed
+from libreformer.profiles import ProfileCache, NO_THUMBNAIL_SETTINGS
+
+
+def _convert_arg(argv: list[str]) -> str:
+    return argv[argv.index("--convert-to") + 1]
+
+
+class TestFilterOptions:
+    def test_convert_arg_uses_default_filter(self):
+        assert FilterOptions().convert_arg("pdf", "writer_pdf_Export") == (
+            "pdf:writer_pdf_Export"
+        )
+
+    def test_convert_arg_without_filter_is_bare_extension(self):
+        assert FilterOptions(options="x").convert_arg("png", None) == "png"
+
+    def test_filter_name_overrides_default(self):
+        opts = FilterOptions(filter_name="MyFilter", options="a,b")
+        assert opts.convert_arg("pdf", "writer_pdf_Export") == "pdf:MyFilter:a,b"
+
+    def test_properties_serialized_as_typed_json(self):
+        opts = FilterOptions(properties={"Quality": 80, "UseTaggedPDF": False})
+        assert json.loads(opts.serialize()) == {
+            "Quality": {"type": "long", "value": "80"},
+            "UseTaggedPDF": {"type": "boolean", "value": "false"},
+        }
+
+    def test_options_and_properties_are_exclusive(self):
+        with pytest.raises(ValueError, match="mutually exclusive"):
+            FilterOptions(options="a", properties={"b": 1})
+
+    def test_pdf_compact_preset(self):
+        props = FilterOptions.pdf_compact(quality=60, max_resolution=100).properties
+        assert props["ReduceImageResolution"] is True
+        assert props["MaxImageResolution"] == 100
+        assert props["Quality"] == 60
+        with pytest.raises(ValueError, match="quality"):
+            FilterOptions.pdf_compact(quality=0)
+
+    def test_csv_preset(self):
+        opts = FilterOptions.csv(separator=";", encoding="UTF-8")
+        assert opts.filter_name == "Text - txt - csv (StarCalc)"
+        assert opts.options == "59,34,76,1"
+        with pytest.raises(ValueError, match="Unsupported CSV encoding"):
+            FilterOptions.csv(encoding="koi8-r")
+
+
+class TestEngineFilterArgs:
+    def test_registry_filter_is_passed(self, fake_soffice, tmp_path: Path):
+        src = tmp_path / "sheet.xlsx"
+        src.write_text("x")
+        engine = LibreOfficeEngine(auto_install=False)
+        assert isinstance(engine.transform(str(src), "pdf"), Succeed)
+        (conversion,) = fake_soffice.conversions()
+        assert _convert_arg(conversion) == "pdf:calc_pdf_Export"
+
+    def test_options_are_passed(self, fake_soffice, tmp_path: Path):
+        src = tmp_path / "doc.docx"
+        src.write_text("x")
+        engine = LibreOfficeEngine(auto_install=False)
+        result = engine.transform(str(src), "pdf", FilterOptions.pdf_compact())
+        assert isinstance(result, Succeed)
+        assert result.output_path.name == "doc.pdf"
+        (conversion,) = fake_soffice.conversions()
+        ext, filter_name, options = _convert_arg(conversion).split(":", 2)
+        assert (ext, filter_name) == ("pdf", "writer_pdf_Export")
+        assert "ReduceImageResolution" in json.loads(options)
+
+    def test_graphic_export_leaves_filter_to_soffice(
+        self, fake_soffice, tmp_path: Path
+    ):
+        src = tmp_path / "doc.docx"
+        src.write_text("x")
+        engine = LibreOfficeEngine(auto_install=False)
+        assert isinstance(engine.transform(str(src), "png"), Succeed)
+        (conversion,) = fake_soffice.conversions()
+        assert _convert_arg(conversion) == "png"
+
+    def test_batch_splits_by_filter(self, fake_soffice, tmp_path: Path):
+        files = []
+        for name in ("a.docx", "b.docx", "c.xlsx"):
+            f = tmp_path / name
+            f.write_text("x")
+            files.append(str(f))
+        engine = LibreOfficeEngine(auto_install=False)
+        results = engine.transform_batch(files, "pdf")
+        assert all(isinstance(r, Succeed) for r in results)
+        args = sorted(_convert_arg(c) for c in fake_soffice.conversions())
+        assert args == ["pdf:calc_pdf_Export", "pdf:writer_pdf_Export"]
+
+    @pytest.mark.asyncio
+    async def test_async_options(self, fake_soffice, tmp_path: Path):
+        src = tmp_path / "sheet.ods"
+        src.write_text("x")
+        engine = LibreOfficeEngine(auto_install=False)
+        result = await engine.async_transform(
+            str(src), "csv", FilterOptions.csv(separator="\t")
+        )
+        assert isinstance(result, Succeed)
+        (conversion,) = fake_soffice.conversions()
+        assert _convert_arg(conversion) == "csv:Text - txt - csv (StarCalc):9,34,76,1"
+
+    def test_cache_key_includes_options(self, fake_soffice, tmp_path: Path):
+        src = tmp_path / "doc.docx"
+        src.write_text("x")
+        cache = ConversionCache(tmp_path / "cache")
+        engine = LibreOfficeEngine(auto_install=False, cache=cache)
+        engine.transform(str(src), "pdf")
+        engine.transform(str(src), "pdf", FilterOptions.pdf_compact())
+        engine.transform(str(src), "pdf", FilterOptions.pdf_compact())
+        assert len(fake_soffice.conversions()) == 2
+        assert cache.stats.hits == 1
+
+
+class TestThumbnailSetting:
+    def test_template_gets_settings(self, fake_soffice):
+        cache = ProfileCache(str(fake_soffice.path), settings=NO_THUMBNAIL_SETTINGS)
+        try:
+            xcu = cache.template() / "user" / "registrymodifications.xcu"
+            text = xcu.read_text()
+            assert 'oor:name="GenerateThumbnail"' in text
+            assert "<value>false</value>" in text
+        finally:
+            cache.close()
+
+    def test_one_off_profile_gets_settings(
+        self, fake_soffice, tmp_path: Path, monkeypatch
+    ):
+        src = tmp_path / "doc.txt"
+        src.write_text("x")
+        engine = LibreOfficeEngine(
+            auto_install=False, reuse_profiles=False, generate_thumbnails=False
+        )
+        seen = {}
+        build = engine._build_command
+
+        def spy(input_paths, to, output_dir, profile_dir, *args):
+            xcu = profile_dir / "user" / "registrymodifications.xcu"
+            seen["xcu"] = xcu.read_text() if xcu.exists() else ""
+            return build(input_paths, to, output_dir, profile_dir, *args)
+
+        monkeypatch.setattr(engine, "_build_command", spy)
+        assert isinstance(engine.transform(str(src), "pdf"), Succeed)
+        assert "GenerateThumbnail" in seen["xcu"]
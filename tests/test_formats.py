@@ -60,6 +60,23 @@ class TestFormatRegistryBasic:
         """점(.)이 포함된 확장자도 처리한다."""
         assert FormatRegistry.can_convert(".docx", ".pdf") is True
 
+    def test_can_convert_ignores_modules(self):
+        """can_convert는 모듈과 무관하게 입출력 가능 여부만 본다."""
+        assert FormatRegistry.can_convert("csv", "pptx") is True
+
+    def test_can_route_requires_route(self):
+        """모듈을 건너는 변환은 경로가 있어야 가능하다."""
+        assert FormatRegistry.can_route("csv", "docx") is True
+        assert FormatRegistry.can_route("csv", "pptx") is False
+        assert FormatRegistry.can_route("pptx", "xlsx") is False
+        assert FormatRegistry.can_route("xyz_invalid", "pdf") is False
+
+    @pytest.mark.parametrize("ext", ["pdf", "png", "jpg", "svg", "gif"])
+    def test_draw_imports_pdf_and_images(self, ext: str):
+        """PDF와 이미지는 Draw로 불러와 변환한다."""
+        assert ext in FormatRegistry.supported_input_formats()
+        assert FormatRegistry.can_route(ext, "pdf") is True
+
     def test_get_format_single(self):
         """단일 카테고리 확장자 조회."""
         results = FormatRegistry.get_format("docx")
@@ -86,6 +103,25 @@ class TestFormatRegistryBasic:
         """알 수 없는 조합 → None."""
         assert FormatRegistry.get_export_filter("zzz", "yyy") is None
 
+    def test_get_export_filter_prefers_input_category(self):
+        """출력 필터는 입력과 같은 카테고리의 것을 우선한다."""
+        assert FormatRegistry.get_export_filter("xlsx", "pdf") == "calc_pdf_Export"
+        assert FormatRegistry.get_export_filter("docx", "pdf") == "writer_pdf_Export"
+
+    def test_get_by_mime(self):
+        """MIME 타입으로 조회하며 대소문자와 매개변수를 무시한다."""
+        results = FormatRegistry.get_by_mime("Application/PDF; charset=binary")
+        assert results
+        assert all(f.extension == "pdf" for f in results)
+        assert FormatRegistry.get_by_mime("application/x-unknown") == []
+
+    def test_returned_collections_do_not_alias_index(self):
+        """반환된 컬렉션을 수정해도 레지스트리는 바뀌지 않는다."""
+        FormatRegistry.supported_input_formats().clear()
+        FormatRegistry.get_format("docx").clear()
+        assert "docx" in FormatRegistry.supported_input_formats()
+        assert FormatRegistry.get_format("docx")
+
 
 # ===========================================================================
 # US6: 문서 카테고리별 포맷 매핑
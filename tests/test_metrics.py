@@ -0,0 +1,116 @@
+"""단계별 소요 시간 계측(히스토그램·결과 첨부·내보내기) 테스트."""
+
+from pathlib import Path
+
+import pytest
+
+from libreformer import ConversionMetrics, Failed, LibreOfficeEngine, Stage, Succeed
+from libreformer.metrics import NULL_TIMER, Histogram
+
+
+class TestHistogram:
+    def test_cumulative_buckets(self):
+        hist = Histogram(buckets=[0.1, 1.0])
+        for value in (0.05, 0.1, 0.5, 3.0):
+            hist.observe(value)
+        snap = hist.snapshot()
+        assert snap.buckets == ((0.1, 2), (1.0, 3), (float("inf"), 4))
+        assert snap.count == 4
+        assert snap.sum == pytest.approx(3.65)
+
+    def test_reset(self):
+        hist = Histogram()
+        hist.observe(1.0)
+        hist.reset()
+        assert hist.snapshot().count == 0
+
+
+class TestConversionMetrics:
+    def test_callbacks_receive_stage_and_attributes(self):
+        seen = []
+        metrics = ConversionMetrics(callbacks=[lambda *a: seen.append(a)])
+        metrics.timer({"target": "pdf"}).add(Stage.SOFFICE_RUN, 0.5)
+        assert seen == [("soffice_run", 0.5, {"target": "pdf"})]
+        assert metrics.histogram(Stage.SOFFICE_RUN).snapshot().count == 1
+
+    def test_prometheus_format(self):
+        metrics = ConversionMetrics(buckets=[1.0])
+        metrics.observe(Stage.CLEANUP, 0.25)
+        text = metrics.to_prometheus()
+        assert "# TYPE libreformer_stage_duration_seconds histogram" in text
+        assert (
+            'libreformer_stage_duration_seconds_bucket{stage="cleanup",le="1.0"} 1'
+            in text
+        )
+        assert (
+            'libreformer_stage_duration_seconds_bucket{stage="cleanup",le="+Inf"} 1'
+            in text
+        )
+        assert 'libreformer_stage_duration_seconds_count{stage="cleanup"} 1' in text
+        assert 'libreformer_stage_duration_seconds_count{stage="queue_wait"} 0' in text
+
+    def test_null_timer_is_inert(self):
+        result = Succeed(Path("a"), Path("b"))
+        with NULL_TIMER.measure(Stage.SOFFICE_RUN):
+            pass
+        NULL_TIMER.attach([result])
+        assert result.timings is None
+
+
+class TestEngineMetrics:
+    def test_disabled_by_default(self, fake_soffice, make_inputs):
+        (src,) = make_inputs("doc.txt")
+        result = LibreOfficeEngine(auto_install=False).transform(src, "pdf")
+        assert isinstance(result, Succeed)
+        assert result.timings is None
+
+    def test_sync_stage_timings(self, fake_soffice, make_inputs):
+        metrics = ConversionMetrics()
+        engine = LibreOfficeEngine(auto_install=False, metrics=metrics)
+        files = make_inputs("a.txt", "b.txt", "fail.txt")
+        results = list(engine.transform_parallel(files, "pdf"))
+        assert len(results) == 3
+        for result in results:
+            assert {
+                Stage.QUEUE_WAIT,
+                Stage.SEMAPHORE_WAIT,
+                Stage.PROFILE_SETUP,
+                Stage.PROCESS_SPAWN,
+                Stage.SOFFICE_RUN,
+                Stage.OUTPUT_DISCOVERY,
+                Stage.CLEANUP,
+            } <= set(result.timings)
+            assert result.timings["soffice_run"] > 0
+        assert any(isinstance(r, Failed) for r in results)
+        snapshot = metrics.snapshot()
+        assert snapshot["soffice_run"].count == 3
+        assert snapshot["queue_wait"].count == 3
+        assert snapshot["semaphore_wait"].count == 3
+
+    def test_multi_hop_accumulates(self, fake_soffice, make_inputs):
+        metrics = ConversionMetrics()
+        engine = LibreOfficeEngine(auto_install=False, metrics=metrics)
+        (src,) = make_inputs("table.csv")
+        result = engine.transform(src, "docx")
+        assert isinstance(result, Succeed)
+        assert metrics.snapshot()["soffice_run"].count == 2
+        assert Stage.QUEUE_WAIT not in result.timings
+
+    @pytest.mark.asyncio
+    async def test_async_stage_timings(self, fake_soffice, make_inputs):
+        seen = []
+        metrics = ConversionMetrics(callbacks=[lambda *a: seen.append(a)])
+        engine = LibreOfficeEngine(auto_install=False, metrics=metrics)
+        files = make_inputs("a.docx", "b.docx")
+        results = [
+            r async for r in engine.async_transform_parallel(files, "pdf", batch_size=2)
+        ]
+        assert all(isinstance(r, Succeed) for r in results)
+        for result in results:
+            assert {"queue_wait", "semaphore_wait", "soffice_run"} <= set(
+                result.timings
+            )
+        # 두 파일은 soffice 한 번으로 변환되었다
+        assert metrics.snapshot()["soffice_run"].count == 1
+        ((_, _, attributes),) = [s for s in seen if s[0] == "soffice_run"]
+        assert attributes == {"target": "pdf"}
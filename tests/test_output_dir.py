@@ -0,0 +1,191 @@
+"""출력 디렉터리 지정과 스테이징 후 원자적 배치 테스트."""
+
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+from libreformer import ConversionCache, Failed, LibreOfficeEngine, Succeed
+from libreformer import routing
+from libreformer.routing import OutputClaims, publish
+
+
+def _outdir(argv: list[str]) -> Path:
+    return Path(argv[argv.index("--outdir") + 1])
+
+
+@pytest.fixture
+def doc(tmp_path: Path) -> Path:
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    path = src_dir / "report.txt"
+    path.write_text("hello")
+    return path
+
+
+class TestOutputDir:
+    def test_writes_into_output_dir(self, fake_soffice, tmp_path: Path, doc: Path):
+        out = tmp_path / "out"
+        engine = LibreOfficeEngine(auto_install=False, output_dir=out)
+        result = engine.transform(str(doc), "pdf")
+        assert isinstance(result, Succeed)
+        assert result.output_path == (out / "report.pdf").resolve()
+        assert not (doc.parent / "report.pdf").exists()
+        (argv,) = fake_soffice.conversions()
+        assert _outdir(argv) == out.resolve()
+
+    def test_cache_hit_materializes_into_output_dir(
+        self, fake_soffice, tmp_path: Path, doc: Path
+    ):
+        out = tmp_path / "out"
+        cache = ConversionCache(tmp_path / "cache")
+        engine = LibreOfficeEngine(auto_install=False, output_dir=out, cache=cache)
+        engine.transform(str(doc), "pdf")
+        (out / "report.pdf").unlink()
+        result = engine.transform(str(doc), "pdf")
+        assert isinstance(result, Succeed)
+        assert result.output_path == (out / "report.pdf").resolve()
+        assert len(fake_soffice.conversions()) == 1
+
+
+class TestStaging:
+    @pytest.mark.parametrize("output_dir", [None, "out"])
+    def test_stages_then_publishes(
+        self, fake_soffice, tmp_path: Path, doc: Path, output_dir
+    ):
+        out = tmp_path / output_dir if output_dir else doc.parent
+        engine = LibreOfficeEngine(
+            auto_install=False, output_dir=output_dir and out, staging=True
+        )
+        result = engine.transform(str(doc), "pdf")
+        assert isinstance(result, Succeed)
+        assert result.output_path == (out / "report.pdf").resolve()
+        assert result.output_path.read_text() == "hello"
+        (argv,) = fake_soffice.conversions()
+        staged_dir = _outdir(argv)
+        assert staged_dir.parent != out.resolve()
+        # 작업이 끝나면 스테이징 디렉터리는 지워진다
+        assert not staged_dir.exists()
+
+    def test_multi_hop(self, fake_soffice, tmp_path: Path):
+        src = tmp_path / "table.csv"
+        src.write_text("a,b\n1,2\n")
+        out = tmp_path / "out"
+        engine = LibreOfficeEngine(auto_install=False, output_dir=out, staging=True)
+        result = engine.transform(str(src), "docx")
+        assert isinstance(result, Succeed)
+        assert result.output_path == (out / "table.docx").resolve()
+        assert sorted(p.name for p in out.iterdir()) == ["table.docx"]
+
+    @pytest.mark.asyncio
+    async def test_async(self, fake_soffice, tmp_path: Path, doc: Path):
+        out = tmp_path / "out"
+        engine = LibreOfficeEngine(auto_install=False, output_dir=out, staging=True)
+        result = await engine.async_transform(str(doc), "pdf")
+        assert isinstance(result, Succeed)
+        assert result.output_path == (out / "report.pdf").resolve()
+        assert result.output_size == len("hello")
+
+    def test_publish_failure_is_reported(self, fake_soffice, tmp_path: Path, doc: Path):
+        out = tmp_path / "out"
+        engine = LibreOfficeEngine(auto_install=False, output_dir=out, staging=True)
+        out.rmdir()
+        result = engine.transform(str(doc), "pdf")
+        assert isinstance(result, Failed)
+        assert "Failed to publish output" in result.error_message
+
+
+def _same_stem_inputs(tmp_path: Path) -> list[str]:
+    files = []
+    for name in ("a", "b"):
+        src_dir = tmp_path / name
+        src_dir.mkdir()
+        (src_dir / "report.txt").write_text(name)
+        files.append(str(src_dir / "report.txt"))
+    return files
+
+
+class TestOutputCollisions:
+    @pytest.mark.parametrize("staging", [False, True])
+    def test_same_stem_from_different_dirs(
+        self, fake_soffice, tmp_path: Path, monkeypatch, staging: bool
+    ):
+        # 두 변환이 겹치도록 가짜 soffice를 늦춘다
+        monkeypatch.setenv("FAKE_SOFFICE_DELAY", "0.5")
+        out = tmp_path / "out"
+        engine = LibreOfficeEngine(
+            auto_install=False, max_concurrency=2, output_dir=out, staging=staging
+        )
+        results = list(engine.transform_parallel(_same_stem_inputs(tmp_path), "pdf"))
+        (succeeded,) = [r for r in results if isinstance(r, Succeed)]
+        (failed,) = [r for r in results if isinstance(r, Failed)]
+        assert "Output path collision" in failed.error_message
+        assert len(fake_soffice.conversions()) == 1
+        # 남은 출력은 성공한 입력의 내용이다
+        assert succeeded.output_path.read_text() == succeeded.file_path.read_text()
+
+    @pytest.mark.asyncio
+    async def test_async(self, fake_soffice, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("FAKE_SOFFICE_DELAY", "0.5")
+        engine = LibreOfficeEngine(auto_install=False, output_dir=tmp_path / "out")
+        files = _same_stem_inputs(tmp_path)
+        results = [r async for r in engine.async_transform_parallel(files, "pdf")]
+        assert sorted(type(r).__name__ for r in results) == ["Failed", "Succeed"]
+
+    def test_sequential_runs_do_not_collide(self, fake_soffice, tmp_path: Path):
+        engine = LibreOfficeEngine(auto_install=False, output_dir=tmp_path / "out")
+        for f in _same_stem_inputs(tmp_path):
+            assert isinstance(engine.transform(f, "pdf"), Succeed)
+
+
+class TestOutputClaims:
+    def test_conflicts_and_release(self, tmp_path: Path):
+        claims = OutputClaims()
+        dst = tmp_path / "out.pdf"
+        a, b = tmp_path / "a" / "out.txt", tmp_path / "b" / "out.txt"
+        with claims.claim({a: dst}) as conflicts:
+            assert conflicts == {}
+            # 같은 입력은 다시 점유할 수 있다
+            with claims.claim({a: dst}) as nested:
+                assert nested == {}
+            with claims.claim({b: dst}) as other:
+                assert other == {b: dst}
+        with claims.claim({b: dst}) as conflicts:
+            assert conflicts == {}
+
+    def test_conflict_within_one_claim(self, tmp_path: Path):
+        claims = OutputClaims()
+        dst = tmp_path / "out.pdf"
+        a, b = tmp_path / "out.docx", tmp_path / "out.txt"
+        with claims.claim({a: dst, b: dst}) as conflicts:
+            assert conflicts == {b: dst}
+
+
+class TestPublish:
+    def test_rename(self, tmp_path: Path):
+        staged = tmp_path / "staged.pdf"
+        staged.write_text("x")
+        dest = tmp_path / "dest.pdf"
+        assert publish(staged, dest) == dest
+        assert dest.read_text() == "x"
+        assert not staged.exists()
+
+    def test_copies_across_filesystems(self, tmp_path: Path, monkeypatch):
+        staged = tmp_path / "staged.pdf"
+        staged.write_text("x")
+        dest = tmp_path / "dest.pdf"
+        dest.write_text("old")
+        real_replace = os.replace
+
+        def replace(src, dst):
+            if Path(src) == staged:
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            return real_replace(src, dst)
+
+        monkeypatch.setattr(routing.os, "replace", replace)
+        assert publish(staged, dest) == dest
+        assert dest.read_text() == "x"
+        assert not staged.exists()
+        # 임시 파일이 남지 않는다
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["dest.pdf"]
@@ -0,0 +1,242 @@
+"""상주 soffice 워커 풀 테스트.
+
+가짜 soffice를 사용해 워커 기동/재사용/재시작과 엔진 연동을 검증한다.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from libreformer import LibreOfficeEngine, Succeed, Failed
+from libreformer.pool import SofficeWorkerPool
+
+
+def _wait_recycled(pool: SofficeWorkerPool, count: int) -> None:
+    deadline = time.monotonic() + 10
+    while pool.recycled < count:
+        assert time.monotonic() < deadline, "worker was not replaced"
+        time.sleep(0.01)
+
+
+class TestSofficeWorkerPool:
+    def test_workers_start_lazily_and_are_reused(self, fake_soffice):
+        pool = SofficeWorkerPool(str(fake_soffice.path), size=2)
+        try:
+            assert fake_soffice.invocations() == []
+            worker = pool.checkout()
+            assert worker.alive
+            assert (worker.profile_dir / ".lock").exists()
+            pool.checkin(worker)
+
+            again = pool.checkout()
+            assert again is worker
+            pool.checkin(again)
+            servers = [a for a in fake_soffice.invocations() if "--convert-to" not in a]
+            assert len(servers) == 1
+        finally:
+            pool.close()
+
+    def test_worker_replaced_after_max_jobs(self, fake_soffice):
+        pool = SofficeWorkerPool(str(fake_soffice.path), size=1, max_jobs_per_worker=2)
+        try:
+            for _ in range(2):
+                with pool.lease() as first:
+                    pass
+            _wait_recycled(pool, 1)
+            with pool.lease() as second:
+                assert second is not first
+                assert second.worker_id == first.worker_id
+                assert second.profile_dir != first.profile_dir
+            assert not first.alive
+            assert not first.profile_dir.exists()
+            servers = [a for a in fake_soffice.invocations() if "--convert-to" not in a]
+            assert len(servers) == 2
+        finally:
+            pool.close()
+
+    def test_old_worker_serves_while_replacement_warms(self, fake_soffice):
+        pool = SofficeWorkerPool(str(fake_soffice.path), size=1, max_jobs_per_worker=1)
+        gate = threading.Event()
+        replace = pool._replace
+
+        def gated_replace(*args):
+            gate.wait()
+            replace(*args)
+
+        pool._replace = gated_replace
+        try:
+            with pool.lease() as old:
+                pass
+            # 교체 워커가 준비되기 전에는 기존 워커가 계속 작업을 받는다
+            busy = pool.checkout()
+            assert busy is old and busy.alive
+            gate.set()
+            _wait_recycled(pool, 1)
+            # 작업 중에 교체된 워커는 반납될 때 종료된다
+            assert busy.alive and busy.retired
+            pool.checkin(busy)
+            assert not busy.alive
+            with pool.lease() as new:
+                assert new is not old
+        finally:
+            gate.set()
+            pool.close()
+
+    def test_worker_replaced_over_rss_limit(self, fake_soffice):
+        pool = SofficeWorkerPool(str(fake_soffice.path), size=1, max_worker_rss=1)
+        try:
+            with pool.lease() as worker:
+                assert worker.rss() > 0
+            _wait_recycled(pool, 1)
+            assert not worker.alive
+        finally:
+            pool.close()
+
+    def test_worker_replaced_after_max_age(self, fake_soffice):
+        pool = SofficeWorkerPool(str(fake_soffice.path), size=1, max_worker_age=0.05)
+        try:
+            with pool.lease() as worker:
+                time.sleep(0.1)
+            _wait_recycled(pool, 1)
+            assert not worker.alive
+        finally:
+            pool.close()
+
+    def test_failed_replacement_keeps_old_worker(self, fake_soffice, monkeypatch):
+        pool = SofficeWorkerPool(str(fake_soffice.path), size=1, max_jobs_per_worker=1)
+        try:
+            with pool.lease() as worker:
+                pass
+            # 교체 워커가 쓸 실행 파일이 사라졌다
+            pool.soffice_path = "/nonexistent/soffice"
+            deadline = time.monotonic() + 5
+            while pool._replacing and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert pool.recycled == 0
+            with pool.lease() as again:
+                assert again is worker and again.alive
+        finally:
+            pool.close()
+
+    def test_invalid_limits(self, fake_soffice):
+        with pytest.raises(ValueError, match="max_worker_rss"):
+            SofficeWorkerPool(str(fake_soffice.path), size=1, max_worker_rss=0)
+        with pytest.raises(ValueError, match="max_worker_age"):
+            SofficeWorkerPool(str(fake_soffice.path), size=1, max_worker_age=0)
+
+    def test_unhealthy_worker_is_restarted(self, fake_soffice):
+        pool = SofficeWorkerPool(str(fake_soffice.path), size=1)
+        try:
+            worker = pool.checkout()
+            pool.checkin(worker, healthy=False)
+            assert not worker.alive
+            assert pool.checkout().alive
+        finally:
+            pool.close()
+
+    def test_close_stops_workers(self, fake_soffice):
+        pool = SofficeWorkerPool(str(fake_soffice.path), size=1)
+        worker = pool.checkout()
+        pool.checkin(worker)
+        pool.close()
+        assert not worker.alive
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.checkout()
+
+    def test_invalid_size(self, fake_soffice):
+        with pytest.raises(ValueError, match="size must be >= 1"):
+            SofficeWorkerPool(str(fake_soffice.path), size=0)
+
+
+class TestEnginePoolMode:
+    def test_transform_uses_worker_profile(self, fake_soffice, make_inputs):
+        (src,) = make_inputs(count=1)
+        with LibreOfficeEngine(auto_install=False, pool_size=1) as engine:
+            result = engine.transform(src, "pdf")
+            assert isinstance(result, Succeed)
+            worker_profile = engine._pool.checkout().profile_dir
+        (conversion,) = fake_soffice.conversions()
+        assert f"-env:UserInstallation=file://{worker_profile}" in conversion
+
+    def test_transform_parallel_in_pool_mode(self, fake_soffice, make_inputs):
+        files = make_inputs(count=4)
+        with LibreOfficeEngine(auto_install=False, pool_size=2) as engine:
+            results = list(engine.transform_parallel(files, "pdf"))
+        assert len(results) == 4
+        assert all(isinstance(r, Succeed) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_async_transform_in_pool_mode(self, fake_soffice, make_inputs):
+        files = make_inputs(count=3)
+        with LibreOfficeEngine(auto_install=False, pool_size=2) as engine:
+            results = [r async for r in engine.async_transform_parallel(files, "pdf")]
+        assert all(isinstance(r, Succeed) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_async_waiters_do_not_hold_executor_threads(
+        self, fake_soffice, make_inputs
+    ):
+        # 워커를 기다리는 작업이 기본 executor 스레드를 모두 점유하면, 워커를
+        # 가진 작업이 스레드를 얻지 못해 교착된다
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=3)
+        loop.set_default_executor(executor)
+        files = make_inputs(count=6)
+        with LibreOfficeEngine(
+            auto_install=False, max_concurrency=6, pool_size=1
+        ) as engine:
+
+            async def run() -> list:
+                return [r async for r in engine.async_transform_parallel(files, "pdf")]
+
+            results = await asyncio.wait_for(run(), timeout=10)
+        assert len(results) == 6
+        assert all(isinstance(r, Succeed) for r in results)
+
+    def test_failed_conversion_in_pool_mode(self, fake_soffice, make_inputs):
+        (src,) = make_inputs(count=1, prefix="fail")
+        with LibreOfficeEngine(auto_install=False, pool_size=1) as engine:
+            result = engine.transform(src, "pdf")
+        assert isinstance(result, Failed)
+        assert "could not be loaded" in result.error_message
+
+    def test_recycling_keeps_serving(self, fake_soffice, make_inputs):
+        files = make_inputs(count=6)
+        with LibreOfficeEngine(
+            auto_install=False, pool_size=1, max_jobs_per_worker=2
+        ) as engine:
+            results = [engine.transform(f, "pdf") for f in files]
+            assert all(isinstance(r, Succeed) for r in results)
+            assert engine._pool.recycled >= 1
+
+    def test_invalid_pool_size(self):
+        with pytest.raises(ValueError, match="pool_size must be >= 1"):
+            LibreOfficeEngine(auto_install=False, pool_size=0)
+
+    def test_timed_out_worker_is_replaced(self, fake_soffice, make_inputs):
+        # 타임아웃은 작업을 전달한 클라이언트만 죽이므로 워커도 교체해야 한다
+        (hang,) = make_inputs(count=1, prefix="hang")
+        (src,) = make_inputs(count=1)
+        with LibreOfficeEngine(auto_install=False, pool_size=1, timeout=0.5) as engine:
+            first = engine._pool.checkout()
+            first_pid = first.pid
+            engine._pool.checkin(first)
+            result = engine.transform(hang, "pdf")
+            assert isinstance(result, Failed)
+            assert not first.alive
+            assert isinstance(engine.transform(src, "pdf"), Succeed)
+            assert engine._pool.checkout().pid != first_pid
+
+    @pytest.mark.asyncio
+    async def test_async_timed_out_worker_is_replaced(self, fake_soffice, make_inputs):
+        (hang,) = make_inputs(count=1, prefix="hang")
+        with LibreOfficeEngine(auto_install=False, pool_size=1, timeout=0.5) as engine:
+            first = engine._pool.checkout()
+            engine._pool.checkin(first)
+            result = await engine.async_transform(hang, "pdf")
+            assert isinstance(result, Failed)
+            assert not first.alive
+            assert not engine._stalled_profiles
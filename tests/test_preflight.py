@@ -0,0 +1,203 @@
+"""매직 바이트 판별과 soffice 실행 전 변환 가능 여부 검사 테스트."""
+
+import threading
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from libreformer import (
+    ConversionError,
+    Failed,
+    FailureKind,
+    FormatRegistry,
+    LibreOfficeEngine,
+    Succeed,
+)
+
+
+def _odf(path: Path, mime: str) -> Path:
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            zipfile.ZipInfo("mimetype"), mime, compress_type=zipfile.ZIP_STORED
+        )
+        archive.writestr("content.xml", "<office:document-content/>")
+    return path
+
+
+def _ooxml(path: Path, part: str) -> Path:
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr(part, "<root/>")
+    return path
+
+
+class TestSniff:
+    @pytest.mark.parametrize(
+        "head, expected",
+        [
+            (b"%PDF-1.7\n", "pdf"),
+            (b"\x89PNG\r\n\x1a\n\x00", "png"),
+            (b"\xff\xd8\xff\xe0", "jpg"),
+            (b"{\\rtf1\\ansi", "rtf"),
+            (b"plain text", None),
+            (b"", None),
+        ],
+    )
+    def test_signatures(self, tmp_path: Path, head: bytes, expected):
+        path = tmp_path / "file.bin"
+        path.write_bytes(head)
+        assert FormatRegistry.sniff_format(path) == expected
+
+    def test_odf_mimetype(self, tmp_path: Path):
+        path = _odf(tmp_path / "doc.bin", "application/vnd.oasis.opendocument.text")
+        assert FormatRegistry.sniff_format(path) == "odt"
+
+    @pytest.mark.parametrize(
+        "part, expected",
+        [
+            ("word/document.xml", "docx"),
+            ("xl/workbook.xml", "xlsx"),
+            ("ppt/presentation.xml", "pptx"),
+            ("other/thing.xml", None),
+        ],
+    )
+    def test_ooxml_parts(self, tmp_path: Path, part: str, expected):
+        assert FormatRegistry.sniff_format(_ooxml(tmp_path / "f.zip", part)) == expected
+
+    def test_real_docx(self, sample_docx: Path):
+        assert FormatRegistry.sniff_format(sample_docx) == "docx"
+
+    def test_missing_file(self, tmp_path: Path):
+        assert FormatRegistry.sniff_format(tmp_path / "missing") is None
+
+    def test_detect_falls_back_to_extension(self, tmp_path: Path):
+        path = tmp_path / "Table.CSV"
+        path.write_text("a,b\n")
+        assert FormatRegistry.detect_format(path) == "csv"
+
+    def test_can_convert_file_uses_content(self, tmp_path: Path):
+        fake = tmp_path / "report.docx"
+        fake.write_bytes(b"%PDF-1.4\n")
+        assert not FormatRegistry.can_convert_file(fake, "docx")
+        assert FormatRegistry.can_convert_file(fake, "pdf")
+        real = _ooxml(tmp_path / "real.docx", "word/document.xml")
+        assert FormatRegistry.can_convert_file(real, "docx")
+
+
+@pytest.fixture
+def engine(fake_soffice) -> LibreOfficeEngine:
+    return LibreOfficeEngine(auto_install=False)
+
+
+class TestEnginePreflight:
+    def test_unknown_extension(self, engine, fake_soffice, tmp_path: Path):
+        src = tmp_path / "data.xyz"
+        src.write_text("x")
+        result = engine.transform(str(src), "pdf")
+        assert isinstance(result, Failed)
+        assert result.kind is FailureKind.UNSUPPORTED_FORMAT
+        assert result.error_message == "Unsupported conversion: xyz -> pdf"
+        assert fake_soffice.invocations() == []
+
+    def test_impossible_pair(self, engine, fake_soffice, tmp_path: Path):
+        src = tmp_path / "table.csv"
+        src.write_text("a,b\n")
+        assert engine.transform(str(src), "pptx").kind is (
+            FailureKind.UNSUPPORTED_FORMAT
+        )
+        assert fake_soffice.invocations() == []
+
+    def test_mislabeled_file(self, engine, fake_soffice, tmp_path: Path):
+        src = tmp_path / "report.docx"
+        src.write_bytes(b"%PDF-1.4\n")
+        result = engine.transform(str(src), "docx")
+        assert result.kind is FailureKind.UNSUPPORTED_FORMAT
+        assert result.error_message == (
+            "File content does not match extension: content is pdf, not docx"
+        )
+        assert fake_soffice.invocations() == []
+
+    def test_mislabeled_file_with_route(self, engine, fake_soffice, tmp_path: Path):
+        # docx -> pdf 경로는 있지만 Writer 필터로는 PDF 내용을 열 수 없다
+        src = tmp_path / "scan.docx"
+        src.write_bytes(b"%PDF-1.4\n")
+        result = engine.transform(str(src), "pdf")
+        assert result.kind is FailureKind.UNSUPPORTED_FORMAT
+        assert "content is pdf, not docx" in result.error_message
+        assert fake_soffice.invocations() == []
+
+    @pytest.mark.parametrize("name", ["letter.doc", "notes.txt"])
+    def test_same_module_content_passes(self, engine, tmp_path: Path, name: str):
+        # Word가 .doc로 저장한 RTF처럼 같은 모듈이 여는 내용은 그대로 변환한다
+        src = tmp_path / name
+        src.write_bytes(b"{\\rtf1 hello}")
+        assert isinstance(engine.transform(str(src), "pdf"), Succeed)
+
+    def test_unknown_extension_uses_content(self, engine, tmp_path: Path):
+        src = tmp_path / "scan.bin"
+        src.write_bytes(b"%PDF-1.4\n")
+        assert isinstance(engine.transform(str(src), "png"), Succeed)
+
+    @pytest.mark.parametrize(
+        "name, to", [("scan.pdf", "png"), ("photo.png", "pdf"), ("logo.svg", "pdf")]
+    )
+    def test_draw_imports_pass(self, engine, tmp_path: Path, name: str, to: str):
+        src = tmp_path / name
+        src.write_text("x")
+        assert isinstance(engine.transform(str(src), to), Succeed)
+
+    def test_explicit_filter_is_not_checked(self, engine, tmp_path: Path):
+        src = tmp_path / "data.xyz"
+        src.write_text("x")
+        assert isinstance(engine.transform(str(src), "pdf:writer_pdf_Export"), Succeed)
+
+    def test_disabled(self, fake_soffice, tmp_path: Path):
+        src = tmp_path / "data.xyz"
+        src.write_text("x")
+        engine = LibreOfficeEngine(auto_install=False, preflight=False)
+        assert isinstance(engine.transform(str(src), "pdf"), Succeed)
+
+    def test_parallel_mixed_upload(self, engine, fake_soffice, tmp_path: Path):
+        files = []
+        for name in ("a.txt", "b.xyz", "c.csv", "d.txt"):
+            (tmp_path / name).write_text("x")
+            files.append(str(tmp_path / name))
+        targets = ["pdf", "pdf", "pptx", "pdf"]
+        results = list(engine.transform_parallel(files, targets, batch_size=4))
+        failed = sorted(r.file_path.name for r in results if isinstance(r, Failed))
+        assert failed == ["b.xyz", "c.csv"]
+        # 변환 가능한 두 파일만 soffice 한 번으로 실행된다
+        (argv,) = fake_soffice.conversions()
+        assert [Path(a).name for a in argv[-2:]] == ["a.txt", "d.txt"]
+
+    @pytest.mark.asyncio
+    async def test_async(self, engine, fake_soffice, tmp_path: Path):
+        src = tmp_path / "data.xyz"
+        src.write_text("x")
+        result = await engine.async_transform(str(src), "pdf")
+        assert result.kind is FailureKind.UNSUPPORTED_FORMAT
+        results = [r async for r in engine.async_transform_parallel([str(src)], "pdf")]
+        assert results[0].kind is FailureKind.UNSUPPORTED_FORMAT
+        assert fake_soffice.invocations() == []
+
+    @pytest.mark.asyncio
+    async def test_async_runs_off_loop(self, engine, tmp_path: Path, monkeypatch):
+        src = tmp_path / "a.txt"
+        src.write_text("x")
+        threads = []
+        sniff = FormatRegistry.sniff_format
+
+        def spy(path):
+            threads.append(threading.get_ident())
+            return sniff(path)
+
+        monkeypatch.setattr(FormatRegistry, "sniff_format", staticmethod(spy))
+        await engine.async_transform(str(src), "pdf")
+        await engine.async_transform_batch([str(src)], "pdf")
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+    def test_bytes_api(self, engine):
+        with pytest.raises(ConversionError, match="Unsupported conversion: csv"):
+            engine.transform_bytes(b"a,b\n", "csv", "pptx")
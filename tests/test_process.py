@@ -0,0 +1,175 @@
+"""프로세스 그룹 단위 실행·종료 도우미 테스트."""
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from libreformer import LibreOfficeEngine, Failed, FailureKind, Succeed
+from libreformer.process import async_run_process, run_process
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # 좀비는 종료된 것으로 간주
+    try:
+        with open(f"/proc/{pid}/stat") as fh:
+            return fh.read().split()[2] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def _wait_dead(pid: int, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not _alive(pid):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def _orphan_input(tmp_path: Path) -> Path:
+    f = tmp_path / "orphan.txt"
+    f.write_text("x")
+    return f
+
+
+def _child_pid(tmp_path: Path) -> int:
+    return int((tmp_path / "orphan.txt.childpid").read_text())
+
+
+class TestRunProcess:
+    def test_collects_output(self):
+        result = run_process([sys.executable, "-c", "print('ok')"], timeout=10)
+        assert result.returncode == 0
+        assert result.stdout.strip() == "ok"
+
+    def test_reports_resource_usage(self):
+        busy = "x = bytearray(32 * 1024 * 1024); sum(range(2_000_000))"
+        result = run_process([sys.executable, "-c", busy], timeout=30)
+        assert result.returncode == 0
+        assert result.wall_time > 0
+        assert result.cpu_time is not None and result.cpu_time > 0
+        assert result.max_rss is not None and result.max_rss >= 32 * 1024 * 1024
+
+    @pytest.mark.asyncio
+    async def test_async_reports_resource_usage(self):
+        busy = "x = bytearray(32 * 1024 * 1024); sum(range(2_000_000))"
+        result = await async_run_process([sys.executable, "-c", busy], timeout=30)
+        assert result.returncode == 0
+        assert result.cpu_time is not None and result.cpu_time > 0
+        assert result.max_rss is not None and result.max_rss >= 32 * 1024 * 1024
+
+    @pytest.mark.asyncio
+    async def test_async_collects_output_and_status(self):
+        code = "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"
+        result = await async_run_process([sys.executable, "-c", code], timeout=10)
+        assert result.returncode == 3
+        assert result.stdout.strip() == "out"
+        assert result.stderr.strip() == "err"
+
+    def test_timeout_raises(self):
+        cmd = [sys.executable, "-c", "import time; time.sleep(60)"]
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_process(cmd, timeout=0.2)
+
+    @pytest.mark.asyncio
+    async def test_async_timeout_raises(self):
+        cmd = [sys.executable, "-c", "import time; time.sleep(60)"]
+        with pytest.raises(asyncio.TimeoutError):
+            await async_run_process(cmd, timeout=0.2)
+
+
+class TestAsyncExecutor:
+    @pytest.mark.asyncio
+    async def test_uses_given_executor(self):
+        # 기본 executor가 막혀 있어도 전용 executor로 수집·회수한다
+        loop = asyncio.get_running_loop()
+        blocked = ThreadPoolExecutor(max_workers=1)
+        loop.set_default_executor(blocked)
+        release = threading.Event()
+        blocker = loop.run_in_executor(None, release.wait)
+        dedicated = ThreadPoolExecutor(max_workers=1)
+        try:
+            result = await asyncio.wait_for(
+                async_run_process(
+                    [sys.executable, "-c", "print('ok')"], 10, executor=dedicated
+                ),
+                timeout=5,
+            )
+        finally:
+            release.set()
+            await blocker
+            dedicated.shutdown()
+        assert result.stdout.strip() == "ok"
+
+    @pytest.mark.asyncio
+    async def test_timeout_counts_from_spawn(self, fake_soffice, tmp_path: Path):
+        # 스레드가 부족한 기본 executor에서도 타임아웃이 차례로 밀리지 않는다
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=2)
+        )
+        files = []
+        for i in range(4):
+            f = tmp_path / f"hang_{i}.txt"
+            f.write_text("x")
+            files.append(str(f))
+        engine = LibreOfficeEngine(auto_install=False, timeout=1, max_concurrency=4)
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(engine.async_transform(f, "pdf") for f in files)
+        )
+        elapsed = time.monotonic() - started
+        engine.close()
+        assert all(r.kind is FailureKind.TIMEOUT for r in results)
+        assert elapsed < 1.8
+
+
+class TestProcessGroupKill:
+    def test_sync_timeout_kills_children(self, fake_soffice, tmp_path: Path):
+        f = _orphan_input(tmp_path)
+        engine = LibreOfficeEngine(auto_install=False, timeout=0.5)
+        result = engine.transform(str(f), "pdf")
+        assert isinstance(result, Failed)
+        assert "timed out" in result.error_message
+        assert _wait_dead(_child_pid(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_async_timeout_kills_children(self, fake_soffice, tmp_path: Path):
+        f = _orphan_input(tmp_path)
+        engine = LibreOfficeEngine(auto_install=False, timeout=0.5)
+        result = await engine.async_transform(str(f), "pdf")
+        assert isinstance(result, Failed)
+        assert _wait_dead(_child_pid(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_async_cancel_kills_children(self, fake_soffice, tmp_path: Path):
+        f = _orphan_input(tmp_path)
+        engine = LibreOfficeEngine(auto_install=False, timeout=60)
+        task = asyncio.create_task(engine.async_transform(str(f), "pdf"))
+        pid_file = tmp_path / "orphan.txt.childpid"
+        for _ in range(100):
+            if pid_file.exists() and pid_file.read_text():
+                break
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert _wait_dead(_child_pid(tmp_path))
+
+    def test_slot_reclaimed_after_timeout(self, fake_soffice, tmp_path: Path):
+        f = _orphan_input(tmp_path)
+        good = tmp_path / "good.txt"
+        good.write_text("x")
+        engine = LibreOfficeEngine(auto_install=False, timeout=0.5, max_concurrency=1)
+        results = list(engine.transform_parallel([str(f), str(good)], "pdf"))
+        assert [type(r) for r in results] == [Failed, Succeed]
@@ -0,0 +1,167 @@
+"""UserInstallation 프로필 캐시 테스트."""
+
+import stat
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from libreformer import LibreOfficeEngine, Succeed, Failed
+from libreformer.profiles import ProfileCache
+
+
+def _alive(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat") as fh:
+            # 좀비는 종료된 것으로 간주
+            return fh.read().split()[2] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def _profile_of(argv: list[str]) -> str:
+    prefix = "-env:UserInstallation=file://"
+    return next(a[len(prefix) :] for a in argv if a.startswith(prefix))
+
+
+class TestProfileCache:
+    def test_template_built_once(self, fake_soffice):
+        cache = ProfileCache(str(fake_soffice.path))
+        try:
+            first = cache.template()
+            second = cache.template()
+            assert first is not None and first == second
+            assert (first / "user" / "registrymodifications.xcu").exists()
+            init_calls = [
+                a for a in fake_soffice.invocations() if "--terminate_after_init" in a
+            ]
+            assert len(init_calls) == 1
+        finally:
+            cache.close()
+
+    def test_checkout_clones_template(self, fake_soffice):
+        cache = ProfileCache(str(fake_soffice.path))
+        try:
+            profile = cache.checkout()
+            assert (profile / "user" / "registrymodifications.xcu").exists()
+            assert profile != cache.template()
+        finally:
+            cache.close()
+
+    def test_profile_reused_after_checkin(self, fake_soffice):
+        cache = ProfileCache(str(fake_soffice.path))
+        try:
+            with cache.lease() as first:
+                pass
+            with cache.lease() as second:
+                pass
+            assert first == second
+        finally:
+            cache.close()
+
+    def test_invalidated_profile_is_discarded(self, fake_soffice):
+        cache = ProfileCache(str(fake_soffice.path))
+        try:
+            with cache.lease() as first:
+                cache.invalidate(first)
+            assert not first.exists()
+            with cache.lease() as second:
+                assert second != first
+        finally:
+            cache.close()
+
+    def test_template_failure_falls_back_to_empty_profile(self, tmp_path: Path):
+        cache = ProfileCache(str(tmp_path / "does-not-exist"))
+        try:
+            assert cache.template() is None
+            profile = cache.checkout()
+            assert not profile.exists()
+        finally:
+            cache.close()
+
+    def test_template_timeout_kills_process_group(self, tmp_path: Path):
+        # soffice 래퍼가 soffice.bin 자식을 남긴 채 멈춘 상황을 흉내 낸다
+        pid_file = tmp_path / "child.pid"
+        script = tmp_path / "soffice"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import subprocess, sys, time\n"
+            "child = subprocess.Popen([sys.executable, '-c', "
+            "'import time; time.sleep(3600)'])\n"
+            f"open({str(pid_file)!r}, 'w').write(str(child.pid))\n"
+            "time.sleep(3600)\n"
+        )
+        script.chmod(script.stat().st_mode | stat.S_IXUSR)
+        cache = ProfileCache(str(script), init_timeout=1.0)
+        try:
+            assert cache.template() is None
+            child = int(pid_file.read_text())
+            deadline = time.monotonic() + 5
+            while _alive(child):
+                assert time.monotonic() < deadline, "template soffice child left behind"
+                time.sleep(0.05)
+        finally:
+            cache.close()
+
+    @pytest.mark.asyncio
+    async def test_async_lease_runs_off_loop(self, fake_soffice, monkeypatch):
+        cache = ProfileCache(str(fake_soffice.path))
+        threads = []
+        checkout = cache.checkout
+
+        def spy():
+            threads.append(threading.get_ident())
+            return checkout()
+
+        monkeypatch.setattr(cache, "checkout", spy)
+        try:
+            async with cache.async_lease() as first:
+                assert (first / "user").is_dir()
+            async with cache.async_lease() as second:
+                pass
+            assert first == second
+            assert threads and threading.get_ident() not in threads
+        finally:
+            cache.close()
+
+    def test_close_removes_root(self, fake_soffice):
+        cache = ProfileCache(str(fake_soffice.path))
+        cache.checkout()
+        cache.close()
+        assert not cache.root.exists()
+
+
+class TestEngineProfileReuse:
+    def test_sequential_conversions_share_profile(self, fake_soffice, tmp_path: Path):
+        files = []
+        for i in range(2):
+            f = tmp_path / f"doc_{i}.txt"
+            f.write_text("x")
+            files.append(str(f))
+        with LibreOfficeEngine(auto_install=False) as engine:
+            for f in files:
+                assert isinstance(engine.transform(f, "pdf"), Succeed)
+        first, second = fake_soffice.conversions()
+        assert _profile_of(first) == _profile_of(second)
+
+    def test_failed_conversion_discards_profile(self, fake_soffice, tmp_path: Path):
+        bad = tmp_path / "fail.txt"
+        good = tmp_path / "good.txt"
+        bad.write_text("x")
+        good.write_text("x")
+        with LibreOfficeEngine(auto_install=False) as engine:
+            assert isinstance(engine.transform(str(bad), "pdf"), Failed)
+            assert isinstance(engine.transform(str(good), "pdf"), Succeed)
+        first, second = fake_soffice.conversions()
+        assert _profile_of(first) != _profile_of(second)
+
+    def test_reuse_profiles_disabled(self, fake_soffice, tmp_path: Path):
+        f = tmp_path / "doc.txt"
+        f.write_text("x")
+        engine = LibreOfficeEngine(auto_install=False, reuse_profiles=False)
+        assert isinstance(engine.transform(str(f), "pdf"), Succeed)
+        (conversion,) = fake_soffice.conversions()
+        assert "libreoffice_conversion_" in _profile_of(conversion)
+        assert not Path(_profile_of(conversion)).exists()
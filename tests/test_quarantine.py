@@ -0,0 +1,215 @@
+"""격리 목록과 서킷 브레이커 테스트."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from libreformer import (
+    BreakerState,
+    CircuitBreaker,
+    Failed,
+    FailureKind,
+    LibreOfficeEngine,
+    Quarantine,
+    Succeed,
+)
+from libreformer import quarantine as quarantine_module
+from libreformer.cache import file_digest
+from libreformer.concurrency import ConcurrencyLimiter
+
+
+def _crash(path: Path) -> Failed:
+    return Failed(path, "boom", kind=FailureKind.CRASH)
+
+
+@pytest.fixture
+def poison(tmp_path: Path) -> Path:
+    path = tmp_path / "poison.txt"
+    path.write_text("bad bytes")
+    return path
+
+
+class TestQuarantine:
+    def test_isolates_after_max_strikes(self, tmp_path: Path, poison: Path):
+        quarantine = Quarantine(tmp_path / "q.jsonl", max_strikes=2)
+        assert not quarantine.record(_crash(poison))
+        assert quarantine.lookup(poison) is None
+        assert quarantine.record(_crash(poison))
+        entry = quarantine.lookup(poison)
+        assert entry is not None
+        assert (entry.strikes, entry.kind) == (2, FailureKind.CRASH)
+        assert file_digest(poison) in quarantine
+        assert len(quarantine) == 1
+
+    def test_ignores_other_kinds(self, tmp_path: Path, poison: Path):
+        quarantine = Quarantine(tmp_path / "q.jsonl", max_strikes=1)
+        failed = Failed(poison, "x", kind=FailureKind.UNSUPPORTED_FORMAT)
+        assert not quarantine.record(failed)
+        assert len(quarantine) == 0
+
+    def test_keyed_by_content(self, tmp_path: Path, poison: Path):
+        quarantine = Quarantine(tmp_path / "q.jsonl", max_strikes=1)
+        quarantine.record(_crash(poison))
+        copy = tmp_path / "renamed.txt"
+        copy.write_bytes(poison.read_bytes())
+        assert quarantine.lookup(copy) is not None
+        poison.write_text("fixed")
+        assert quarantine.lookup(poison) is None
+
+    def test_persists_and_sees_other_writers(self, tmp_path: Path, poison: Path):
+        index = tmp_path / "q.jsonl"
+        first = Quarantine(index, max_strikes=1)
+        second = Quarantine(index, max_strikes=1)
+        first.record(_crash(poison))
+        assert second.lookup(poison) is not None
+        assert Quarantine(index, max_strikes=1).lookup(poison) is not None
+
+    def test_release(self, tmp_path: Path, poison: Path):
+        index = tmp_path / "q.jsonl"
+        quarantine = Quarantine(index, max_strikes=1)
+        other = Quarantine(index, max_strikes=1)
+        quarantine.record(_crash(poison))
+        assert other.lookup(poison) is not None
+        assert quarantine.release(file_digest(poison))
+        assert not quarantine.release(file_digest(poison))
+        assert other.lookup(poison) is None
+        assert index.read_text() == ""
+
+    def test_skips_malformed_lines(self, tmp_path: Path, poison: Path):
+        index = tmp_path / "q.jsonl"
+        record = {
+            "digest": file_digest(poison),
+            "kind": "timeout",
+            "error_message": "slow",
+            "file_path": str(poison),
+            "time": 0.0,
+        }
+        index.write_text("not json\n" + json.dumps(record) + "\n")
+        assert (
+            Quarantine(index, max_strikes=1).lookup(poison).kind is FailureKind.TIMEOUT
+        )
+
+    def test_validation(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="max_strikes"):
+            Quarantine(tmp_path / "q.jsonl", max_strikes=0)
+
+
+class TestEngineQuarantine:
+    def test_crashing_input_is_skipped(self, fake_soffice, tmp_path: Path):
+        src = tmp_path / "crash.txt"
+        src.write_text("x")
+        quarantine = Quarantine(tmp_path / "q.jsonl", max_strikes=1)
+        engine = LibreOfficeEngine(auto_install=False, quarantine=quarantine)
+        assert engine.transform(str(src), "pdf").kind is FailureKind.CRASH
+        result = engine.transform(str(src), "pdf")
+        assert result.kind is FailureKind.QUARANTINED
+        assert "Quarantined after 1 crash" in result.error_message
+        assert len(fake_soffice.conversions()) == 1
+
+    def test_batch_failures_are_not_attributed(self, fake_soffice, tmp_path: Path):
+        files = []
+        for name in ("crash.txt", "innocent.txt"):
+            (tmp_path / name).write_text(name)
+            files.append(str(tmp_path / name))
+        quarantine = Quarantine(tmp_path / "q.jsonl", max_strikes=1)
+        engine = LibreOfficeEngine(auto_install=False, quarantine=quarantine)
+        results = engine.transform_batch(files, "pdf")
+        assert all(r.kind is FailureKind.CRASH for r in results)
+        assert len(quarantine) == 0
+
+    @pytest.mark.asyncio
+    async def test_async(self, fake_soffice, tmp_path: Path):
+        src = tmp_path / "crash.txt"
+        src.write_text("x")
+        quarantine = Quarantine(tmp_path / "q.jsonl", max_strikes=1)
+        engine = LibreOfficeEngine(auto_install=False, quarantine=quarantine)
+        await engine.async_transform(str(src), "pdf")
+        result = await engine.async_transform(str(src), "pdf")
+        assert result.kind is FailureKind.QUARANTINED
+
+    @pytest.mark.asyncio
+    async def test_async_hashes_off_loop(
+        self, fake_soffice, tmp_path: Path, monkeypatch
+    ):
+        src = tmp_path / "crash.txt"
+        src.write_text("x")
+        quarantine = Quarantine(tmp_path / "q.jsonl", max_strikes=1)
+        threads = []
+        digest = quarantine_module.file_digest
+
+        def spy(path):
+            threads.append(threading.get_ident())
+            return digest(path)
+
+        monkeypatch.setattr(quarantine_module, "file_digest", spy)
+        engine = LibreOfficeEngine(auto_install=False, quarantine=quarantine)
+        await engine.async_transform(str(src), "pdf")  # record
+        await engine.async_transform(str(src), "pdf")  # lookup
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+
+class TestCircuitBreaker:
+    def test_opens_on_failure_rate(self):
+        breaker = CircuitBreaker(failure_threshold=0.5, window=4, min_results=4)
+        caps = []
+        breaker.subscribe(caps.append)
+        ok = [Succeed(Path("a"), Path("a.pdf"))]
+        crash = [_crash(Path("b"))]
+        for results in (ok, crash, ok):
+            breaker.record(results)
+        assert breaker.state is BreakerState.CLOSED
+        breaker.record(crash)
+        assert breaker.state is BreakerState.OPEN
+        assert caps == [1]
+
+    def test_half_open_then_close_or_reopen(self):
+        breaker = CircuitBreaker(window=1, min_results=1, cooldown=0.05)
+        caps = []
+        breaker.subscribe(caps.append)
+        breaker.record([_crash(Path("a"))])
+        # 열린 동안의 결과는 상태를 바꾸지 않는다
+        breaker.record([Succeed(Path("b"), Path("b.pdf"))])
+        assert breaker.state is BreakerState.OPEN
+        time.sleep(0.06)
+        assert breaker.state is BreakerState.HALF_OPEN
+        breaker.record([_crash(Path("c"))])
+        assert breaker.state is BreakerState.OPEN
+        time.sleep(0.06)
+        breaker.record([Succeed(Path("d"), Path("d.pdf"))])
+        assert breaker.state is BreakerState.CLOSED
+        assert caps == [1, 1, None]
+
+    def test_caps_limiter(self):
+        limiter = ConcurrencyLimiter(4)
+        breaker = CircuitBreaker(window=1, min_results=1, open_concurrency=2)
+        breaker.subscribe(limiter.set_cap)
+        breaker.record([_crash(Path("a"))])
+        with limiter, limiter:
+            assert not limiter._try_take()
+        limiter.set_cap(None)
+        with limiter, limiter, limiter:
+            assert limiter._try_take()
+
+    def test_validation(self):
+        with pytest.raises(ValueError, match="failure_threshold"):
+            CircuitBreaker(failure_threshold=0)
+        with pytest.raises(ValueError, match="open_concurrency"):
+            CircuitBreaker(open_concurrency=0)
+
+    def test_engine_backs_off(self, fake_soffice, tmp_path: Path):
+        files = []
+        for i in range(3):
+            (tmp_path / f"crash_{i}.txt").write_text("x")
+            files.append(str(tmp_path / f"crash_{i}.txt"))
+        breaker = CircuitBreaker(window=2, min_results=2, cooldown=60)
+        engine = LibreOfficeEngine(
+            auto_install=False, max_concurrency=4, circuit_breaker=breaker
+        )
+        results = list(engine.transform_parallel(files, "pdf"))
+        assert all(r.kind is FailureKind.CRASH for r in results)
+        assert breaker.state is BreakerState.OPEN
+        assert engine._limiter._allowed() == 1
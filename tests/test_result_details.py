@@ -0,0 +1,79 @@
+"""결과 객체의 실행 정보(시간·크기·자원 사용량·워커) 테스트."""
+
+from dataclasses import fields
+from pathlib import Path
+
+import pytest
+
+from libreformer import Failed, LibreOfficeEngine, Succeed
+
+
+class TestResultObjects:
+    def test_slots(self):
+        result = Succeed(Path("a"), Path("b"))
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.extra = 1  # type: ignore[attr-defined]
+
+    def test_details_do_not_affect_equality(self):
+        assert Succeed(Path("a"), Path("b"), wall_time=1.0) == Succeed(
+            Path("a"), Path("b")
+        )
+        assert Failed(Path("a"), "boom", attempt=2) == Failed(Path("a"), "boom")
+
+    def test_positional_construction_unchanged(self):
+        assert [f.name for f in fields(Succeed)][:2] == ["file_path", "output_path"]
+        assert [f.name for f in fields(Failed)][:2] == ["file_path", "error_message"]
+
+
+class TestEngineDetails:
+    def test_sync_success(self, fake_soffice, make_inputs):
+        (src,) = make_inputs("doc.txt", size=123)
+        result = LibreOfficeEngine(auto_install=False).transform(src, "pdf")
+        assert isinstance(result, Succeed)
+        assert result.input_size == 123
+        # 가짜 soffice는 입력을 그대로 복사한다
+        assert result.output_size == 123
+        assert result.wall_time > 0
+        assert result.cpu_time is not None and result.cpu_time > 0
+        assert result.max_rss is not None and result.max_rss > 0
+        assert result.worker_id is None
+        assert result.attempt == 1
+
+    def test_failure_carries_usage(self, fake_soffice, make_inputs):
+        (src,) = make_inputs("fail.txt", size=7)
+        result = LibreOfficeEngine(auto_install=False).transform(src, "pdf")
+        assert isinstance(result, Failed)
+        assert result.input_size == 7
+        assert result.wall_time > 0
+
+    def test_precheck_failure_has_no_usage(self, tmp_path: Path):
+        result = LibreOfficeEngine(auto_install=False).transform(
+            str(tmp_path / "missing.txt"), "pdf"
+        )
+        assert isinstance(result, Failed)
+        assert result.wall_time is None and result.input_size is None
+
+    def test_multi_hop_sums_wall_time(self, fake_soffice, make_inputs, monkeypatch):
+        monkeypatch.setenv("FAKE_SOFFICE_DELAY", "0.1")
+        (src,) = make_inputs("table.csv")
+        result = LibreOfficeEngine(auto_install=False).transform(src, "docx")
+        assert isinstance(result, Succeed)
+        assert result.wall_time >= 0.2
+
+    def test_pooled_worker_id(self, fake_soffice, make_inputs):
+        (src,) = make_inputs("doc.txt")
+        with LibreOfficeEngine(auto_install=False, pool_size=1) as engine:
+            result = engine.transform(src, "pdf")
+        assert isinstance(result, Succeed)
+        assert result.worker_id == 0
+
+    @pytest.mark.asyncio
+    async def test_async_details(self, fake_soffice, make_inputs):
+        files = make_inputs("a.docx", size=5) + make_inputs("b.docx", size=9)
+        engine = LibreOfficeEngine(auto_install=False)
+        results = await engine.async_transform_batch(files, "pdf")
+        assert [r.input_size for r in results] == [5, 9]
+        assert all(r.wall_time > 0 for r in results)
+        assert all(r.cpu_time is not None and r.cpu_time > 0 for r in results)
+        assert all(r.max_rss is not None and r.max_rss > 0 for r in results)
@@ -0,0 +1,117 @@
+"""열 기반 결과 저장소(ResultStore) 테스트."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from libreformer import Failed, FailureKind, LibreOfficeEngine, ResultStore, Succeed
+
+
+def _results() -> list:
+    return [
+        Succeed(
+            Path("/data/a.docx"),
+            Path("/data/a.pdf"),
+            wall_time=1.0,
+            cpu_time=0.5,
+            max_rss=1000,
+            input_size=10,
+            output_size=20,
+            worker_id=2,
+        ),
+        Failed(
+            Path("/data/b.docx"),
+            "boom",
+            wall_time=3.0,
+            input_size=5,
+            attempt=2,
+            kind=FailureKind.TIMEOUT,
+        ),
+        Failed(Path("/other/c.xlsx"), "boom"),
+        Succeed(Path("/data/d.txt"), Path("/data/d.pdf"), wall_time=2.0),
+    ]
+
+
+def _same(a, b) -> bool:
+    return (
+        a == b
+        and all(
+            getattr(a, name) == getattr(b, name)
+            for name in ("wall_time", "cpu_time", "max_rss", "input_size", "worker_id")
+        )
+        and (not isinstance(a, Failed) or a.kind == b.kind)
+    )
+
+
+class TestResultStore:
+    def test_round_trip(self):
+        store = ResultStore().extend(_results())
+        assert len(store) == 4
+        restored = list(store)
+        assert all(_same(a, b) for a, b in zip(restored, _results()))
+        assert restored[1].attempt == 2
+        assert restored[0].output_size == 20
+
+    def test_interns_directories_and_errors(self):
+        store = ResultStore().extend(_results())
+        assert store._dirs.values == ["/data", "/other"]
+        assert store._errors.values == ["boom"]
+
+    def test_summary(self):
+        summary = ResultStore().extend(_results()).summary()
+        assert (summary.total, summary.succeeded, summary.failed) == (4, 2, 2)
+        assert summary.input_bytes == 15
+        assert summary.output_bytes == 20
+        assert summary.cpu_time == 0.5
+        assert summary.wall_time["p50"] == 2.0
+        assert summary.wall_time["max"] == 3.0
+
+    def test_empty_summary(self):
+        summary = ResultStore().summary()
+        assert summary.total == 0
+        assert summary.wall_time["p99"] == 0.0
+
+    def test_spill_to_disk(self, tmp_path: Path):
+        spill = tmp_path / "results.jsonl"
+        with ResultStore(spill_path=spill, spill_threshold=3) as store:
+            store.extend(_results())
+            # 3행은 파일로 넘어가고 1행만 메모리에 남는다
+            assert len(store._status) == 1
+            assert len(store) == 4
+            assert [r.file_path.name for r in store] == [
+                "a.docx",
+                "b.docx",
+                "c.xlsx",
+                "d.txt",
+            ]
+            assert all(_same(a, b) for a, b in zip(store, _results()))
+            assert [r.file_path.name for r in store.failures()] == ["b.docx", "c.xlsx"]
+            assert store.summary().wall_time["max"] == 3.0
+        lines = spill.read_text().splitlines()
+        assert len(lines) == 4
+        assert json.loads(lines[1])["error_message"] == "boom"
+
+    def test_to_transform_result(self):
+        result = ResultStore().extend(_results()).to_transform_result()
+        assert len(result.succeeds) == 2
+        assert len(result.failed) == 2
+
+    def test_rejects_bad_threshold(self):
+        with pytest.raises(ValueError, match="spill_threshold"):
+            ResultStore(spill_threshold=0)
+
+    @pytest.mark.asyncio
+    async def test_async_ingest(self, fake_soffice, tmp_path: Path):
+        files = []
+        for name in ("a.txt", "fail.txt"):
+            f = tmp_path / name
+            f.write_text("x")
+            files.append(str(f))
+        engine = LibreOfficeEngine(auto_install=False)
+        store = await ResultStore().aextend(
+            engine.async_transform_parallel(files, "pdf")
+        )
+        summary = store.summary()
+        assert (summary.succeeded, summary.failed) == (1, 1)
+        assert summary.input_bytes == 2
@@ -0,0 +1,163 @@
+"""실패 분류와 재시도 정책 테스트."""
+
+import signal
+from pathlib import Path
+
+import pytest
+
+from libreformer import (
+    Failed,
+    FailureKind,
+    LibreOfficeEngine,
+    RetryPolicy,
+    Succeed,
+)
+from libreformer.retry import classify_exit
+
+# 테스트가 백오프를 기다리지 않도록 대기 시간을 없앤다
+FAST = RetryPolicy(base_delay=0.0, max_delay=0.0)
+
+
+class TestClassifyExit:
+    @pytest.mark.parametrize(
+        "returncode, output, kind",
+        [
+            (-signal.SIGSEGV, "", FailureKind.CRASH),
+            (81, "", FailureKind.TRANSIENT),
+            (
+                1,
+                "Error: user installation could not be completed",
+                FailureKind.TRANSIENT,
+            ),
+            (
+                1,
+                "Error: source file could not be loaded",
+                FailureKind.UNSUPPORTED_FORMAT,
+            ),
+            (1, "something else", FailureKind.UNKNOWN),
+        ],
+    )
+    def test_classify(self, returncode: int, output: str, kind: FailureKind):
+        assert classify_exit(returncode, output) is kind
+
+
+class TestFailureKinds:
+    @pytest.mark.parametrize(
+        "name, kind",
+        [
+            ("fail.txt", FailureKind.UNSUPPORTED_FORMAT),
+            ("crash.txt", FailureKind.CRASH),
+            ("nooutput.txt", FailureKind.OUTPUT_MISSING),
+            ("flaky.txt", FailureKind.TRANSIENT),
+        ],
+    )
+    def test_engine_classifies(self, fake_soffice, make_inputs, name, kind):
+        (src,) = make_inputs(name)
+        result = LibreOfficeEngine(auto_install=False).transform(src, "pdf")
+        assert isinstance(result, Failed)
+        assert result.kind is kind
+
+    def test_input_not_found(self, fake_soffice, tmp_path: Path):
+        engine = LibreOfficeEngine(auto_install=False)
+        result = engine.transform(str(tmp_path / "missing.txt"), "pdf")
+        assert result.kind is FailureKind.INPUT_NOT_FOUND
+
+    def test_timeout(self, fake_soffice, make_inputs):
+        (src,) = make_inputs("hang.txt")
+        engine = LibreOfficeEngine(auto_install=False, timeout=0.5)
+        result = engine.transform(src, "pdf")
+        assert result.kind is FailureKind.TIMEOUT
+
+
+class TestRetryPolicy:
+    def test_validation(self):
+        with pytest.raises(ValueError, match="max_attempts"):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError, match="jitter"):
+            RetryPolicy(jitter=1.5)
+
+    def test_backoff_is_capped_and_jittered(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0, jitter=0.0)
+        assert [policy.delay(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 4.0]
+        jittered = RetryPolicy(base_delay=1.0, max_delay=4.0, jitter=0.5)
+        assert all(1.0 <= jittered.delay(3) <= 4.0 for _ in range(50))
+
+    def test_only_listed_kinds_are_retried(self):
+        policy = RetryPolicy(max_attempts=2)
+        assert policy.should_retry(Failed(Path("a"), "x", kind=FailureKind.TRANSIENT))
+        assert not policy.should_retry(
+            Failed(Path("a"), "x", kind=FailureKind.UNSUPPORTED_FORMAT)
+        )
+        assert not policy.should_retry(
+            Failed(Path("a"), "x", attempt=2, kind=FailureKind.TRANSIENT)
+        )
+
+
+class TestParallelRetry:
+    def test_retries_transient_only(self, fake_soffice, make_inputs):
+        files = make_inputs("flaky.txt", "fail.txt", "ok.txt")
+        engine = LibreOfficeEngine(auto_install=False)
+        results = {
+            r.file_path.name: r
+            for r in engine.transform_parallel(files, "pdf", retry=FAST)
+        }
+        assert isinstance(results["flaky.txt"], Succeed)
+        assert results["flaky.txt"].attempt == 2
+        assert isinstance(results["fail.txt"], Failed)
+        assert results["fail.txt"].attempt == 1
+        assert results["ok.txt"].attempt == 1
+        # 가망 없는 실패는 다시 실행하지 않는다
+        assert len(fake_soffice.conversions()) == 4
+
+    def test_without_policy(self, fake_soffice, make_inputs):
+        files = make_inputs("flaky.txt")
+        engine = LibreOfficeEngine(auto_install=False)
+        (result,) = engine.transform_parallel(files, "pdf")
+        assert result.kind is FailureKind.TRANSIENT
+
+    def test_gives_up_after_max_attempts(self, fake_soffice, make_inputs):
+        files = make_inputs("crash.txt")
+        policy = RetryPolicy(
+            max_attempts=3,
+            base_delay=0.0,
+            retry_on=frozenset({FailureKind.CRASH}),
+        )
+        engine = LibreOfficeEngine(auto_install=False)
+        (result,) = engine.transform_parallel(files, "pdf", retry=policy)
+        assert result.kind is FailureKind.CRASH
+        assert result.attempt == 3
+        assert len(fake_soffice.conversions()) == 3
+
+    def test_batch_failure_retries_each_file(self, fake_soffice, make_inputs):
+        files = make_inputs("a.txt", "flaky.txt", "b.txt")
+        engine = LibreOfficeEngine(auto_install=False)
+        results = list(
+            engine.transform_parallel(files, "pdf", batch_size=3, retry=FAST)
+        )
+        assert all(isinstance(r, Succeed) for r in results)
+        assert {r.attempt for r in results} == {2}
+        # 배치 한 번 + 파일별 재시도 세 번
+        assert len(fake_soffice.conversions()) == 4
+
+    def test_backoff_does_not_hold_slots(self, fake_soffice, make_inputs):
+        files = make_inputs("flaky.txt", count=4)
+        policy = RetryPolicy(base_delay=1.0, jitter=0.0)
+        engine = LibreOfficeEngine(auto_install=False, max_concurrency=1)
+        names = [
+            r.file_path.name
+            for r in engine.transform_parallel(files, "pdf", retry=policy)
+        ]
+        # 재시도를 기다리는 동안 나머지 파일이 먼저 끝난다
+        assert names[-1] == "flaky.txt"
+
+    @pytest.mark.asyncio
+    async def test_async(self, fake_soffice, make_inputs):
+        files = make_inputs("flaky.txt", "fail.txt")
+        engine = LibreOfficeEngine(auto_install=False)
+        results = {
+            r.file_path.name: r
+            async for r in engine.async_transform_parallel(files, "pdf", retry=FAST)
+        }
+        assert isinstance(results["flaky.txt"], Succeed)
+        assert results["flaky.txt"].attempt == 2
+        assert results["fail.txt"].kind is FailureKind.UNSUPPORTED_FORMAT
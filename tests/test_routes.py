@@ -0,0 +1,147 @@
+"""변환 행렬·경로 계획과 엔진의 다단계 변환 실행 테스트."""
+
+from pathlib import Path
+
+import pytest
+
+from libreformer import LibreOfficeEngine, FormatRegistry, Succeed, Failed
+from libreformer.formats import DocumentCategory
+
+
+class TestConversionMatrix:
+    def test_same_category_is_direct(self):
+        matrix = FormatRegistry.conversion_matrix()
+        assert matrix.can_convert("docx", "pdf")
+        assert matrix.can_convert(".csv", "XLSX")
+
+    def test_cross_category_is_not_direct(self):
+        matrix = FormatRegistry.conversion_matrix()
+        assert not matrix.can_convert("csv", "docx")
+        assert not matrix.can_convert("pptx", "xlsx")
+
+    def test_graphic_exports_are_universal(self):
+        matrix = FormatRegistry.conversion_matrix()
+        for src in ("docx", "xlsx", "pptx", "odg"):
+            assert matrix.can_convert(src, "png")
+
+    def test_targets(self):
+        targets = FormatRegistry.conversion_matrix().targets("csv")
+        assert {"xlsx", "ods", "pdf", "html"} <= targets
+        assert "docx" not in targets
+
+    def test_categories_for_ambiguous_extension(self):
+        matrix = FormatRegistry.conversion_matrix()
+        assert matrix.categories_for("html", "xlsx") == [DocumentCategory.CALC]
+        assert set(matrix.categories_for("html", "pdf")) == {
+            DocumentCategory.WRITER,
+            DocumentCategory.CALC,
+        }
+
+    def test_unknown_extension(self):
+        matrix = FormatRegistry.conversion_matrix()
+        assert matrix.bit("zzz") == 0
+        assert not matrix.can_convert("zzz", "pdf")
+        assert matrix.targets("zzz") == frozenset()
+
+
+class TestPlanRoute:
+    def test_direct_route(self):
+        route = FormatRegistry.plan_route("pages", "pdf")
+        assert route is not None and route.is_direct
+        (hop,) = route.hops
+        assert hop.category == DocumentCategory.WRITER
+        assert hop.import_filter is None
+        assert hop.export_filter == "writer_pdf_Export"
+
+    def test_multi_hop_route(self):
+        route = FormatRegistry.plan_route("csv", "docx")
+        assert route is not None
+        assert route.intermediates == ("html",)
+        assert [hop.category for hop in route.hops] == [
+            DocumentCategory.CALC,
+            DocumentCategory.WRITER,
+        ]
+
+    def test_reimport_forces_module(self):
+        route = FormatRegistry.plan_route("docx", "xlsx")
+        assert route is not None
+        assert route.hops[-1].import_filter == "HTML (StarCalc)"
+
+    def test_direct_route_with_non_default_module(self):
+        route = FormatRegistry.plan_route("html", "xlsx")
+        assert route is not None and route.is_direct
+        assert route.hops[0].import_filter == "HTML (StarCalc)"
+
+    def test_prefers_cheaper_route(self):
+        direct = FormatRegistry.plan_route("docx", "pdf")
+        indirect = FormatRegistry.plan_route("csv", "docx")
+        assert direct.cost < indirect.cost
+
+    def test_unreachable_or_limited(self):
+        assert FormatRegistry.plan_route("pptx", "docx") is None
+        assert FormatRegistry.plan_route("csv", "docx", max_hops=1) is None
+        assert FormatRegistry.plan_route("zzz", "pdf") is None
+
+
+def _infilter(argv: list[str]) -> str | None:
+    return next((a.split("=", 1)[1] for a in argv if a.startswith("--infilter=")), None)
+
+
+class TestEngineRoutes:
+    def test_multi_hop_conversion(self, fake_soffice, tmp_path: Path):
+        src = tmp_path / "table.csv"
+        src.write_text("a,b\n1,2\n")
+        engine = LibreOfficeEngine(auto_install=False)
+        result = engine.transform(str(src), "docx")
+        assert isinstance(result, Succeed)
+        assert result.file_path == src
+        assert result.output_path == (tmp_path / "table.docx").resolve()
+        # 중간 결과물은 원본 디렉터리에 남지 않는다
+        assert not (tmp_path / "table.html").exists()
+
+        first, second = fake_soffice.conversions()
+        assert first[first.index("--convert-to") + 1] == "html:HTML (StarCalc)"
+        assert first[first.index("--outdir") + 1] != str(tmp_path)
+        assert second[second.index("--convert-to") + 1] == "docx:MS Word 2007 XML"
+        assert second[second.index("--outdir") + 1] == str(tmp_path)
+
+    def test_direct_conversion_unchanged(self, fake_soffice, tmp_path: Path):
+        src = tmp_path / "doc.txt"
+        src.write_text("x")
+        engine = LibreOfficeEngine(auto_install=False)
+        assert isinstance(engine.transform(str(src), "pdf"), Succeed)
+        (conversion,) = fake_soffice.conversions()
+        assert _infilter(conversion) is None
+
+    def test_import_filter_passed(self, fake_soffice, tmp_path: Path):
+        src = tmp_path / "page.html"
+        src.write_text("<table></table>")
+        engine = LibreOfficeEngine(auto_install=False)
+        assert isinstance(engine.transform(str(src), "xlsx"), Succeed)
+        (conversion,) = fake_soffice.conversions()
+        assert _infilter(conversion) == "HTML (StarCalc)"
+
+    def test_batch_splits_by_route(self, fake_soffice, tmp_path: Path):
+        files = []
+        for name in ("a.txt", "b.txt", "c.csv"):
+            f = tmp_path / name
+            f.write_text("x")
+            files.append(str(f))
+        engine = LibreOfficeEngine(auto_install=False)
+        results = engine.transform_batch(files, "docx")
+        assert [r.file_path.name for r in results] == ["a.txt", "b.txt", "c.csv"]
+        assert all(isinstance(r, Succeed) for r in results)
+        # txt 2개는 한 번에, csv는 html을 거쳐 두 번
+        assert len(fake_soffice.conversions()) == 3
+
+    @pytest.mark.asyncio
+    async def test_async_multi_hop_failure_maps_to_original(
+        self, fake_soffice, tmp_path: Path
+    ):
+        src = tmp_path / "fail.csv"
+        src.write_text("x")
+        engine = LibreOfficeEngine(auto_install=False)
+        result = await engine.async_transform(str(src), "docx")
+        assert isinstance(result, Failed)
+        assert result.file_path == src
+        assert len(fake_soffice.conversions()) == 1
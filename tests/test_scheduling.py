@@ -0,0 +1,139 @@
+"""크기·카테고리 기반 작업 순서 결정 테스트."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from libreformer import LibreOfficeEngine, SchedulePolicy, Scheduler, Succeed
+from libreformer.scheduling import UnitQueue
+
+
+def _input_names(conversions: list[list[str]]) -> list[str]:
+    return [Path(argv[-1]).name for argv in conversions]
+
+
+class TestEstimate:
+    def test_calc_costs_more_than_writer(self, make_inputs):
+        scheduler = Scheduler()
+        doc, sheet = make_inputs("a.docx", "b.xlsx", size=1000)
+        assert scheduler.estimate(sheet)[0] > scheduler.estimate(doc)[0]
+
+    def test_heavy_needs_category_and_size(self, make_inputs):
+        scheduler = Scheduler(heavy_min_bytes=100)
+        assert scheduler.estimate(*make_inputs("big.xlsx", size=200))[1]
+        assert not scheduler.estimate(*make_inputs("small.xlsx", size=10))[1]
+        assert not scheduler.estimate(*make_inputs("big.docx", size=200))[1]
+
+    def test_missing_file_is_cheap(self, tmp_path: Path):
+        cost, heavy = Scheduler().estimate(str(tmp_path / "missing.pptx"))
+        assert cost > 0 and not heavy
+
+    def test_validation(self):
+        with pytest.raises(ValueError, match="lookahead"):
+            Scheduler(lookahead=0)
+        with pytest.raises(ValueError, match="max_heavy"):
+            Scheduler(max_heavy=0)
+
+
+class TestUnitQueue:
+    def _fill(self, queue: UnitQueue, make_inputs, sizes: dict[str, int]) -> None:
+        for name, size in sizes.items():
+            queue.push("pdf", make_inputs(name, size=size))
+
+    def _drain(self, queue: UnitQueue) -> list[str]:
+        names = []
+        while (unit := queue.pop()) is not None:
+            names.append(Path(unit.paths[0]).name)
+            queue.finish(unit)
+        return names
+
+    def test_default_is_fifo_one_at_a_time(self, make_inputs):
+        queue = UnitQueue()
+        assert queue.wants_more()
+        self._fill(queue, make_inputs, {"a.txt": 1})
+        assert not queue.wants_more()
+
+    @pytest.mark.parametrize(
+        "policy, expected",
+        [
+            (SchedulePolicy.FIFO, ["s.txt", "l.txt", "m.txt"]),
+            (SchedulePolicy.LONGEST_FIRST, ["l.txt", "m.txt", "s.txt"]),
+            (SchedulePolicy.SHORTEST_FIRST, ["s.txt", "m.txt", "l.txt"]),
+        ],
+    )
+    def test_policies(self, make_inputs, policy, expected):
+        queue = UnitQueue(Scheduler(policy=policy))
+        self._fill(queue, make_inputs, {"s.txt": 1, "l.txt": 500_000, "m.txt": 50_000})
+        assert self._drain(queue) == expected
+
+    def test_heavy_cap_lets_light_jobs_through(self, make_inputs):
+        queue = UnitQueue(Scheduler(max_heavy=1, heavy_min_bytes=10))
+        self._fill(queue, make_inputs, {"a.xlsx": 100, "b.pptx": 90, "c.txt": 1})
+        first = queue.pop()
+        assert Path(first.paths[0]).name == "a.xlsx"
+        second = queue.pop()
+        assert Path(second.paths[0]).name == "c.txt"
+        # 무거운 작업이 끝나기 전에는 다음 무거운 작업을 내보내지 않는다
+        assert queue.pop() is None
+        queue.finish(first)
+        assert Path(queue.pop().paths[0]).name == "b.pptx"
+
+
+class TestEngineScheduling:
+    def test_longest_first_sync(self, fake_soffice, make_inputs):
+        files = [
+            *make_inputs("small.txt", size=10),
+            *make_inputs("medium.docx", size=50_000),
+            *make_inputs("large.xlsx", size=200_000),
+        ]
+        engine = LibreOfficeEngine(auto_install=False, max_concurrency=1)
+        results = list(engine.transform_parallel(files, "pdf", schedule=Scheduler()))
+        assert all(isinstance(r, Succeed) for r in results)
+        assert _input_names(fake_soffice.conversions()) == [
+            "large.xlsx",
+            "medium.docx",
+            "small.txt",
+        ]
+
+    def test_sync_heavy_cap(self, fake_soffice, make_inputs, monkeypatch):
+        monkeypatch.setenv("FAKE_SOFFICE_DELAY", "0.1")
+        files = make_inputs(*(f"sheet_{i}.xlsx" for i in range(4)), size=100)
+        engine = LibreOfficeEngine(auto_install=False, max_concurrency=4)
+
+        lock = threading.Lock()
+        active = peak = 0
+        run_group = engine._run_group
+
+        def counting_run_group(*args):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                return run_group(*args)
+            finally:
+                with lock:
+                    active -= 1
+
+        monkeypatch.setattr(engine, "_run_group", counting_run_group)
+        schedule = Scheduler(max_heavy=1, heavy_min_bytes=10)
+        results = list(engine.transform_parallel(files, "pdf", schedule=schedule))
+        assert len(results) == 4
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_shortest_first_async(self, fake_soffice, make_inputs):
+        files = [
+            *make_inputs("large.pptx", size=300_000),
+            *make_inputs("small.txt", size=10),
+        ]
+        engine = LibreOfficeEngine(auto_install=False, max_concurrency=1)
+        schedule = Scheduler(policy=SchedulePolicy.SHORTEST_FIRST)
+        results = [
+            r
+            async for r in engine.async_transform_parallel(
+                files, "pdf", max_in_flight=1, schedule=schedule
+            )
+        ]
+        assert [r.file_path.name for r in results] == ["small.txt", "large.pptx"]
@@ -0,0 +1,237 @@
+"""프로세스 간 공유 슬롯 테스트."""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+
+import pytest
+
+from libreformer import LibreOfficeEngine, SharedSlots, Succeed
+
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+_HOLDER = """
+import sys, time
+from libreformer import SharedSlots
+with SharedSlots(sys.argv[1], slots=1).lease():
+    print("held", flush=True)
+    time.sleep(60)
+"""
+
+
+def _spawn_holder(directory: Path) -> subprocess.Popen:
+    env = dict(os.environ, PYTHONPATH=_SRC)
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _HOLDER, str(directory)],
+        stdout=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    assert proc.stdout.readline().strip() == "held"
+    return proc
+
+
+class TestSharedSlots:
+    def test_validation(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="slots"):
+            SharedSlots(tmp_path, slots=0)
+        with pytest.raises(ValueError, match="poll_interval"):
+            SharedSlots(tmp_path, poll_interval=0)
+
+    def test_first_slot_count_wins(self, tmp_path: Path):
+        assert SharedSlots(tmp_path, slots=2).slots == 2
+        assert SharedSlots(tmp_path, slots=5).slots == 2
+
+    def test_caps_across_instances(self, tmp_path: Path):
+        first = SharedSlots(tmp_path, slots=2)
+        second = SharedSlots(tmp_path, slots=2)
+        with first.lease() as a, second.lease() as b:
+            assert {a, b} == {0, 1}
+            assert first.in_use() == 2
+            assert second._try_slot() is None
+        assert first.in_use() == 0
+
+    def test_waiters_are_served_in_order(self, tmp_path: Path):
+        slots = SharedSlots(tmp_path, slots=1, poll_interval=0.01)
+        order = []
+
+        def wait(i: int):
+            with slots.lease():
+                order.append(i)
+
+        with slots.lease():
+            threads = []
+            for i in range(4):
+                t = threading.Thread(target=wait, args=(i,))
+                t.start()
+                threads.append(t)
+                # 번호표를 받은 뒤 다음 스레드를 시작한다
+                while len(list(tmp_path.glob("wait-*"))) <= i:
+                    time.sleep(0.005)
+        for t in threads:
+            t.join()
+        assert order == [0, 1, 2, 3]
+        assert not list(tmp_path.glob("wait-*"))
+
+    def test_stale_ticket_is_dropped(self, tmp_path: Path):
+        slots = SharedSlots(tmp_path, slots=1)
+        # 잠금 없이 남은 번호표 (대기 중 죽은 프로세스)
+        (tmp_path / "wait-0000000000000000").touch()
+        with slots.lease():
+            pass
+        assert not list(tmp_path.glob("wait-*"))
+
+    def test_crashed_holder_releases_slot(self, tmp_path: Path):
+        slots = SharedSlots(tmp_path, slots=1)
+        proc = _spawn_holder(tmp_path)
+        try:
+            assert slots.in_use() == 1
+            assert (tmp_path / "slot-0.lock").read_text().strip() == str(proc.pid)
+        finally:
+            proc.send_signal(signal.SIGKILL)
+            proc.wait()
+        assert slots.in_use() == 0
+        with slots.lease() as index:
+            assert index == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_async_waiter_leaves_queue(self, tmp_path: Path):
+        slots = SharedSlots(tmp_path, slots=1, poll_interval=0.01)
+
+        async def wait():
+            async with slots.async_lease():
+                pass
+
+        with slots.lease():
+            task = asyncio.create_task(wait())
+            await asyncio.sleep(0.05)
+            assert len(list(tmp_path.glob("wait-*"))) == 1
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        assert not list(tmp_path.glob("wait-*"))
+        async with slots.async_lease() as index:
+            assert index == 0
+
+    @pytest.mark.asyncio
+    async def test_async_queue_steps_run_off_loop(self, tmp_path: Path, monkeypatch):
+        slots = SharedSlots(tmp_path, slots=1, poll_interval=0.01)
+        threads = []
+        step = slots._step
+
+        def spy(ticket):
+            threads.append(threading.get_ident())
+            return step(ticket)
+
+        async def wait() -> int:
+            async with slots.async_lease() as index:
+                return index
+
+        with slots.lease():
+            monkeypatch.setattr(slots, "_step", spy)
+            waiter = asyncio.create_task(wait())
+            await asyncio.sleep(0.05)
+        assert await waiter == 0
+        assert threads and threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_step_releases_slot(self, tmp_path: Path, monkeypatch):
+        slots = SharedSlots(tmp_path, slots=1)
+        entered = threading.Event()
+        proceed = threading.Event()
+        step = slots._step
+
+        def slow(ticket):
+            entered.set()
+            proceed.wait(5)
+            return step(ticket)
+
+        monkeypatch.setattr(slots, "_step", slow)
+
+        async def hold():
+            async with slots.async_lease():
+                await asyncio.sleep(60)
+
+        task = asyncio.create_task(hold())
+        await asyncio.to_thread(entered.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        proceed.set()
+        for _ in range(100):
+            if slots.in_use() == 0:
+                break
+            await asyncio.sleep(0.02)
+        assert slots.in_use() == 0
+        assert not list(tmp_path.glob("wait-*"))
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_engine_respects_shared_slots(
+    fake_soffice, tmp_path: Path, monkeypatch, use_async: bool
+):
+    monkeypatch.setenv("FAKE_SOFFICE_DELAY", "0.05")
+    files = []
+    for i in range(4):
+        f = tmp_path / f"doc_{i}.txt"
+        f.write_text("x")
+        files.append(str(f))
+    slots = SharedSlots(tmp_path / "slots", slots=1, poll_interval=0.01)
+    engine = LibreOfficeEngine(
+        auto_install=False, max_concurrency=4, shared_slots=slots
+    )
+
+    lock = threading.Lock()
+    active = peak = 0
+    lease, async_lease = slots.lease, slots.async_lease
+
+    def enter():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+
+    def leave():
+        nonlocal active
+        with lock:
+            active -= 1
+
+    @contextmanager
+    def counted_lease():
+        with lease() as index:
+            enter()
+            try:
+                yield index
+            finally:
+                leave()
+
+    @asynccontextmanager
+    async def counted_async_lease():
+        async with async_lease() as index:
+            enter()
+            try:
+                yield index
+            finally:
+                leave()
+
+    monkeypatch.setattr(slots, "lease", counted_lease)
+    monkeypatch.setattr(slots, "async_lease", counted_async_lease)
+
+    if use_async:
+
+        async def run():
+            return [r async for r in engine.async_transform_parallel(files, "pdf")]
+
+        results = asyncio.run(run())
+    else:
+        results = list(engine.transform_parallel(files, "pdf"))
+    assert len(results) == 4
+    assert all(isinstance(r, Succeed) for r in results)
+    assert peak == 1
+    assert slots.in_use() == 0
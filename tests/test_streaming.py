@@ -0,0 +1,87 @@
+"""스트리밍 입력과 제한된 동시 제출(window) 테스트."""
+
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from libreformer import LibreOfficeEngine, Succeed
+from libreformer.jobs import iter_jobs
+
+
+class _CountingPaths:
+    """소비된 경로 수를 기록하는 제너레이터 래퍼."""
+
+    def __init__(self, paths: list[str]):
+        self.paths = paths
+        self.consumed = 0
+
+    def __iter__(self) -> Iterator[str]:
+        for path in self.paths:
+            self.consumed += 1
+            yield path
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        for path in self.paths:
+            self.consumed += 1
+            yield path
+
+
+class TestIterJobs:
+    def test_single_target(self):
+        assert list(iter_jobs(iter(["a", "b"]), "pdf")) == [("a", "pdf"), ("b", "pdf")]
+
+    def test_sized_mismatch_raises_before_first_job(self):
+        jobs = iter_jobs(["a", "b"], ["pdf"])
+        with pytest.raises(ValueError, match="Length of 'to'"):
+            next(jobs)
+
+    def test_unsized_mismatch_raises_when_detected(self):
+        jobs = iter_jobs(iter(["a", "b"]), iter(["pdf"]))
+        assert next(jobs) == ("a", "pdf")
+        with pytest.raises(ValueError, match="Length of 'to'"):
+            next(jobs)
+
+    def test_unsized_extra_targets(self):
+        with pytest.raises(ValueError, match="Length of 'to'"):
+            list(iter_jobs(iter(["a"]), iter(["pdf", "html"])))
+
+
+class TestBoundedSubmission:
+    def test_sync_reads_input_lazily(self, fake_soffice, make_inputs):
+        paths = _CountingPaths(make_inputs(count=10))
+        engine = LibreOfficeEngine(auto_install=False)
+        results = engine.transform_parallel(iter(paths), "pdf", max_in_flight=2)
+        first = next(results)
+        assert isinstance(first, Succeed)
+        assert paths.consumed <= 3
+        assert len([first, *results]) == 10
+
+    @pytest.mark.asyncio
+    async def test_async_accepts_async_iterable(self, fake_soffice, make_inputs):
+        paths = _CountingPaths(make_inputs(count=6))
+        engine = LibreOfficeEngine(auto_install=False)
+        results = engine.async_transform_parallel(paths, "pdf", max_in_flight=2)
+        first = await results.__anext__()
+        assert isinstance(first, Succeed)
+        assert paths.consumed <= 3
+        rest = [r async for r in results]
+        assert len(rest) == 5
+
+    @pytest.mark.asyncio
+    async def test_async_batched_stream(self, fake_soffice, make_inputs):
+        paths = _CountingPaths(make_inputs(count=5))
+        engine = LibreOfficeEngine(auto_install=False)
+        results = [
+            r
+            async for r in engine.async_transform_parallel(
+                paths, "pdf", batch_size=2, max_in_flight=1
+            )
+        ]
+        assert len(results) == 5
+        assert len(fake_soffice.conversions()) == 3
+
+    def test_invalid_max_in_flight(self, tmp_path: Path):
+        engine = LibreOfficeEngine(auto_install=False)
+        with pytest.raises(ValueError, match="max_in_flight must be >= 1"):
+            list(engine.transform_parallel([], "pdf", max_in_flight=0))
@@ -0,0 +1,181 @@
+"""UNO 브리지 엔진 테스트."""
+
+import asyncio
+import importlib.util
+import shutil
+from pathlib import Path
+
+import pytest
+
+from libreformer import CircuitBreaker, Failed, FailureKind, Succeed, UnoEngine
+from libreformer.engine import BaseEngine
+from libreformer.uno_engine import graphic_export_filter, split_convert_arg
+
+LIBREOFFICE_INSTALLED = shutil.which("libreoffice") is not None
+UNO_AVAILABLE = importlib.util.find_spec("uno") is not None
+
+requires_uno = pytest.mark.skipif(
+    not (UNO_AVAILABLE and LIBREOFFICE_INSTALLED),
+    reason="LibreOffice and its Python bindings are required",
+)
+
+
+class _EchoEngine(BaseEngine):
+    """변환 없이 입력 경로를 그대로 돌려주는 최소 엔진."""
+
+    def transform(self, file_path, to, options=None):
+        return Succeed(Path(file_path), Path(file_path).with_suffix(f".{to}"))
+
+    async def async_transform(self, file_path, to, options=None):
+        await asyncio.sleep(0)
+        return self.transform(file_path, to, options)
+
+
+class TestSplitConvertArg:
+    @pytest.mark.parametrize(
+        "arg, expected",
+        [
+            ("pdf", ("pdf", None, None)),
+            ("pdf:writer_pdf_Export", ("pdf", "writer_pdf_Export", None)),
+            (
+                'pdf:writer_pdf_Export:{"Quality":{"type":"long","value":"80"}}',
+                (
+                    "pdf",
+                    "writer_pdf_Export",
+                    '{"Quality":{"type":"long","value":"80"}}',
+                ),
+            ),
+            (
+                "csv:Text - txt - csv (StarCalc):44,34,76",
+                ("csv", "Text - txt - csv (StarCalc)", "44,34,76"),
+            ),
+        ],
+    )
+    def test_split(self, arg: str, expected):
+        assert split_convert_arg(arg) == expected
+
+
+class _FakeDocument:
+    """``supportsService``만 흉내 내는 UNO 문서."""
+
+    def __init__(self, *services: str):
+        self._services = set(services)
+
+    def supportsService(self, name: str) -> bool:
+        return name in self._services
+
+
+class TestGraphicExportFilter:
+    @pytest.mark.parametrize(
+        "services, extension, expected",
+        [
+            (("com.sun.star.text.TextDocument",), "png", "writer_png_Export"),
+            (("com.sun.star.sheet.SpreadsheetDocument",), "png", "calc_png_Export"),
+            (("com.sun.star.sheet.SpreadsheetDocument",), "jpeg", "calc_jpg_Export"),
+            (
+                (
+                    "com.sun.star.presentation.PresentationDocument",
+                    "com.sun.star.drawing.DrawingDocument",
+                ),
+                "svg",
+                "impress_svg_Export",
+            ),
+            (("com.sun.star.drawing.DrawingDocument",), "webp", "draw_webp_Export"),
+        ],
+    )
+    def test_maps_module_filter(self, services, extension: str, expected: str):
+        document = _FakeDocument(*services)
+        assert graphic_export_filter(document, extension) == expected
+
+    def test_non_graphic_or_unknown_module(self):
+        writer = _FakeDocument("com.sun.star.text.TextDocument")
+        assert graphic_export_filter(writer, "pdf") is None
+        assert graphic_export_filter(_FakeDocument(), "png") is None
+
+
+class TestBaseEngineParallel:
+    """병렬 API는 ``BaseEngine``에 있으므로 어느 엔진에서나 쓸 수 있다."""
+
+    def test_sync(self):
+        engine = _EchoEngine(max_concurrency=2)
+        results = list(engine.transform_parallel(["a.txt", "b.txt"], "pdf"))
+        assert sorted(r.output_path.name for r in results) == ["a.pdf", "b.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_async_batched(self):
+        engine = _EchoEngine(max_concurrency=2)
+        results = [
+            r
+            async for r in engine.async_transform_parallel(
+                ["a.txt", "b.txt", "c.txt"], "pdf", batch_size=2
+            )
+        ]
+        assert sorted(r.output_path.name for r in results) == [
+            "a.pdf",
+            "b.pdf",
+            "c.pdf",
+        ]
+
+
+@pytest.mark.skipif(UNO_AVAILABLE, reason="uno module is installed")
+def test_requires_uno_bindings():
+    with pytest.raises(ImportError, match="python3-uno"):
+        UnoEngine(auto_install=False)
+
+
+@requires_uno
+class TestUnoConversion:
+    @pytest.fixture
+    def engine(self):
+        engine = UnoEngine(auto_install=False, max_concurrency=2)
+        yield engine
+        engine.close()
+
+    def test_transform(self, engine: UnoEngine, sample_docx: Path, tmp_path: Path):
+        src = tmp_path / sample_docx.name
+        shutil.copy(sample_docx, src)
+        result = engine.transform(str(src), "pdf")
+        assert isinstance(result, Succeed)
+        assert result.output_path == src.with_suffix(".pdf")
+        assert result.output_path.read_bytes().startswith(b"%PDF")
+        assert result.worker_id is not None
+
+    def test_graphic_export(self, engine: UnoEngine, sample_docx: Path, tmp_path: Path):
+        src = tmp_path / sample_docx.name
+        shutil.copy(sample_docx, src)
+        result = engine.transform(str(src), "png")
+        assert isinstance(result, Succeed)
+        assert result.output_path.read_bytes().startswith(b"\x89PNG")
+
+    def test_missing_file(self, engine: UnoEngine, tmp_path: Path):
+        result = engine.transform(str(tmp_path / "missing.docx"), "pdf")
+        assert isinstance(result, Failed)
+        assert result.error_message == "File not found"
+
+    def test_multi_hop(self, engine: UnoEngine, sample_csv: Path, tmp_path: Path):
+        src = tmp_path / sample_csv.name
+        shutil.copy(sample_csv, src)
+        result = engine.transform(str(src), "docx")
+        assert isinstance(result, Succeed)
+        assert result.output_path.suffix == ".docx"
+
+    def test_circuit_breaker_caps_concurrency(self):
+        breaker = CircuitBreaker(window=1, min_results=1, open_concurrency=1)
+        with UnoEngine(
+            auto_install=False, max_concurrency=2, circuit_breaker=breaker
+        ) as engine:
+            breaker.record([Failed(Path("a"), "boom", kind=FailureKind.CRASH)])
+            assert engine._limiter._allowed() == 1
+
+    @pytest.mark.asyncio
+    async def test_async_parallel(
+        self, engine: UnoEngine, sample_docx: Path, tmp_path: Path
+    ):
+        files = []
+        for i in range(3):
+            dst = tmp_path / f"doc_{i}.docx"
+            shutil.copy(sample_docx, dst)
+            files.append(str(dst))
+        results = [r async for r in engine.async_transform_parallel(files, "pdf")]
+        assert len(results) == 3
+        assert all(isinstance(r, Succeed) for r in results)